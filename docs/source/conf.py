@@ -75,6 +75,7 @@ autodoc_mock_imports = [
     'machine',
     'framebuf',
     'utime',
+    'uasyncio',
     ]
 
 # -- Options for HTML output -------------------------------------------------
@@ -2,8 +2,9 @@ from machine import I2C, Pin
 import utime
 import struct
 import math
+from i2c_device import I2cDevice  # See `modules` folder
 
-class SGP40:
+class SGP40(I2cDevice):
 
     class NotFoundException(Exception):
         pass
@@ -53,10 +54,12 @@ class SGP40:
         ]
 
     def __init__(self, i2c, addr=0x59):
-        self.i2c = i2c
-        self.addr = addr
+        # 16-bit commands are sent as register addresses
+        super().__init__(i2c, addr, buf_size=6, addrsize=16)
         if not addr in i2c.scan():
             raise self.NotFoundException
+        # Humidity and temperature parameters of the raw measurement
+        self._params = bytearray(6)
         self._voc_mean = 0.0
         self._voc_initialized = False
 
@@ -98,21 +101,21 @@ class SGP40:
         return raw, voc_index
 
     def measure_raw(self, humidity=50, temperature=25):
-        paramh = struct.pack(">H", math.ceil(humidity * 0xffff / 100))
-        crch = self.__crc(paramh[0], paramh[1])
-        paramt = struct.pack(">H", math.ceil((temperature + 45) * 0xffff / 175))
-        crct = self.__crc(paramt[0], paramt[1])
-        data = paramh + bytes([crch]) + paramt + bytes([crct])
-        self.i2c.writeto_mem(self.addr, self.MEASUREMENT_RAW, data, addrsize=16)
+        data = self._params
+        struct.pack_into(">H", data, 0, math.ceil(humidity * 0xffff / 100))
+        data[2] = self.__crc(data[0], data[1])
+        struct.pack_into(">H", data, 3, math.ceil((temperature + 45) * 0xffff / 175))
+        data[5] = self.__crc(data[3], data[4])
+        self.write_block(self.MEASUREMENT_RAW, data)
         utime.sleep_ms(30)
-        raw = self.i2c.readfrom(self.addr, 3)
+        raw = self.read_raw(3)
         self.__check_crc(raw)
-        return struct.unpack('>H', raw[:2])[0]
+        return (raw[0] << 8) | raw[1]
 
     def measure_test(self):
         raw = self.__read_bytes(self.MEASUREMENT_TEST, 3, 250000)
         self.__check_crc(raw)
-        return struct.unpack('>H', raw[:2])[0]
+        return (raw[0] << 8) | raw[1]
 
     def reset(self):
         self.__write_command(self.RESET)
@@ -126,13 +129,15 @@ class SGP40:
         return serial_hex
 
     def __write_command(self, cmd):
-        bcmd = struct.pack('>H', cmd)
-        self.i2c.writeto(self.addr, bcmd)
+        bcmd = self._wbuf
+        bcmd[0] = cmd >> 8
+        bcmd[1] = cmd & 0xff
+        self.write_raw(bcmd)
 
     def __read_bytes(self, cmd, count, pause):
         self.__write_command(cmd)
         utime.sleep_us(pause)
-        return self.i2c.readfrom(self.addr, count)
+        return self.read_raw(count)
 
     def __check_crc(self, arr):
         assert (len(arr) == 3)
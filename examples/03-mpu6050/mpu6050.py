@@ -1,5 +1,6 @@
 import time
 import math
+from i2c_device import I2cDevice  # See `modules` folder
 
 # Device addresses
 MPU6050_ADDR = 0x68
@@ -34,10 +35,10 @@ GYRO_SCALE = 131.0  # Gyroscope scale for ±250°/s (16-bit)
 RAD_TO_DEG = 180.0 / math.pi
 
 
-class MPU6050:
+class MPU6050(I2cDevice):
     def __init__(self, i2c, address=MPU6050_ADDR):
+        super().__init__(i2c, address, buf_size=14)
         self.address = address
-        self.i2c = i2c
         self.accel_offset_x = 0
         self.accel_offset_y = 0
         self.accel_offset_z = 0
@@ -50,7 +51,7 @@ class MPU6050:
 
     def _init_mpu6050(self):
         # Wake up, enable temperature sensor, internal 8MHz oscillator
-        self.i2c.writeto(self.address, bytearray([POWER_MGMT_1, 0]))
+        self.write_u8(POWER_MGMT_1, 0)
         
         # TODO: Setup resolution and filters
 
@@ -62,21 +63,12 @@ class MPU6050:
         # Gyro_X_H:L
         # Gyro_Y_H:L
         # Gyro_Z_H:L
-        high, low = self.i2c.readfrom_mem(self.address, addr, 2)
-        time.sleep_ms(2)
-
-        if not high & 0x80:
-            return high << 8 | low
-        return - (((high ^ 255) << 8) | (low ^ 255) + 1)
+        return self.read_s16(addr)
 
     def get_values(self):
-        ax = self._get_raw(ACCEL_XOUT_H)
-        ay = self._get_raw(ACCEL_YOUT_H)
-        az = self._get_raw(ACCEL_ZOUT_H)
-        temp = self._get_raw(TEMP_OUT_H)
-        gx = self._get_raw(GYRO_XOUT_H)
-        gy = self._get_raw(GYRO_YOUT_H)
-        gz = self._get_raw(GYRO_ZOUT_H)
+        # Read all 14 data registers in one I2C transaction so that
+        # the values come from the same sample
+        ax, ay, az, temp, gx, gy, gz = self.unpack(ACCEL_XOUT_H, ">hhhhhhh", 14)
 
         # Convert to 'g' (gravity)
         ax = ax / ACCEL_SCALE - self.accel_offset_x
@@ -91,7 +83,7 @@ class MPU6050:
         gy = gy / GYRO_SCALE - self.gyro_offset_y
         gz = gz / GYRO_SCALE - self.gyro_offset_z
 
-        return ax, ay, az, temp, gz, gy, gz
+        return ax, ay, az, temp, gx, gy, gz
 
     def calibrate(self):
         # Calibrate the sensor by averaging several readings for both accelerometer and gyroscope
@@ -28,11 +28,11 @@ MicroPython I2C driver for AK8963 magnetometer
 __version__ = "0.4.0"
 
 # pylint: disable=import-error
-import ustruct
 import utime
 from machine import I2C, Pin
 from micropython import const
 # pylint: enable=import-error
+from i2c_device import I2cDevice  # See `modules` folder
 
 _WIA = const(0x00)
 _HXL = const(0x03)
@@ -61,14 +61,14 @@ OUTPUT_16_BIT = 0b00010000
 _SO_14BIT = 0.6 # μT per digit when 14bit mode
 _SO_16BIT = 0.15 # μT per digit when 16bit mode
 
-class AK8963:
+class AK8963(I2cDevice):
     """Class which provides interface to AK8963 magnetometer."""
     def __init__(
         self, i2c, address=0x0c,
         mode=MODE_CONTINOUS_MEASURE_1, output=OUTPUT_16_BIT,
         offset=(0, 0, 0), scale=(1, 1, 1)
     ):
-        self.i2c = i2c
+        super().__init__(i2c, address, buf_size=6)
         self.address = address
         self._offset = offset
         self._scale = scale
@@ -180,25 +180,20 @@ class AK8963:
 
         return self._offset, self._scale
 
-    def _register_short(self, register, value=None, buf=bytearray(2)):
+    def _register_short(self, register, value=None):
         if value is None:
-            self.i2c.readfrom_mem_into(self.address, register, buf)
-            return ustruct.unpack("<h", buf)[0]
+            return self.read_s16(register, little_endian=True)
 
-        ustruct.pack_into("<h", buf, 0, value)
-        return self.i2c.writeto_mem(self.address, register, buf)
+        return self.write_u16(register, value, little_endian=True)
 
-    def _register_three_shorts(self, register, buf=bytearray(6)):
-        self.i2c.readfrom_mem_into(self.address, register, buf)
-        return ustruct.unpack("<hhh", buf)
+    def _register_three_shorts(self, register):
+        return self.unpack(register, "<hhh", 6)
 
-    def _register_char(self, register, value=None, buf=bytearray(1)):
+    def _register_char(self, register, value=None):
         if value is None:
-            self.i2c.readfrom_mem_into(self.address, register, buf)
-            return buf[0]
+            return self.read_u8(register)
 
-        ustruct.pack_into("<b", buf, 0, value)
-        return self.i2c.writeto_mem(self.address, register, buf)
+        return self.write_u8(register, value)
 
     def __enter__(self):
         return self
@@ -27,11 +27,11 @@ MicroPython I2C driver for MPU6500 6-axis motion tracking device
 __version__ = "0.4.0"
 
 # pylint: disable=import-error
-import ustruct
 import utime
 from machine import I2C, Pin
 from micropython import const
 # pylint: enable=import-error
+from i2c_device import I2cDevice  # See `modules` folder
 
 _GYRO_CONFIG = const(0x1b)
 _ACCEL_CONFIG = const(0x1c)
@@ -84,7 +84,7 @@ SF_M_S2 = 9.80665 # 1 g = 9.80665 m/s2 ie. standard gravity
 SF_DEG_S = 1
 SF_RAD_S = 0.017453292519943 # 1 deg/s is 0.017453292519943 rad/s
 
-class MPU6500:
+class MPU6500(I2cDevice):
     """Class which provides interface to MPU6500 6-axis motion tracking device."""
     def __init__(
         self, i2c, address=0x68,
@@ -92,7 +92,7 @@ class MPU6500:
         accel_sf=SF_M_S2, gyro_sf=SF_RAD_S,
         gyro_offset=(0, 0, 0)
     ):
-        self.i2c = i2c
+        super().__init__(i2c, address, buf_size=6)
         self.address = address
 
         # 0x70 = standalone MPU6500, 0x71 = MPU6250 SIP, 0x90 = MPU6700
@@ -172,25 +172,20 @@ class MPU6500:
         self._gyro_offset = (ox / n, oy / n, oz / n)
         return self._gyro_offset
 
-    def _register_short(self, register, value=None, buf=bytearray(2)):
+    def _register_short(self, register, value=None):
         if value is None:
-            self.i2c.readfrom_mem_into(self.address, register, buf)
-            return ustruct.unpack(">h", buf)[0]
+            return self.read_s16(register)
 
-        ustruct.pack_into(">h", buf, 0, value)
-        return self.i2c.writeto_mem(self.address, register, buf)
+        return self.write_u16(register, value)
 
-    def _register_three_shorts(self, register, buf=bytearray(6)):
-        self.i2c.readfrom_mem_into(self.address, register, buf)
-        return ustruct.unpack(">hhh", buf)
+    def _register_three_shorts(self, register):
+        return self.unpack(register, ">hhh", 6)
 
-    def _register_char(self, register, value=None, buf=bytearray(1)):
+    def _register_char(self, register, value=None):
         if value is None:
-            self.i2c.readfrom_mem_into(self.address, register, buf)
-            return buf[0]
+            return self.read_u8(register)
 
-        ustruct.pack_into("<b", buf, 0, value)
-        return self.i2c.writeto_mem(self.address, register, buf)
+        return self.write_u8(register, value)
 
     def _accel_fs(self, value):
         self._register_char(_ACCEL_CONFIG, value)
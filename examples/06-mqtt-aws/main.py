@@ -6,8 +6,9 @@
 
 import time
 import network
-import ssl
-from umqtt.simple import MQTTClient
+import uasyncio as asyncio
+from mqtt_session import MqttSession
+from tls_cache import TlsCredentials
 
 # Configuration
 WIFI_SSID = "YOUR-WIFI"
@@ -15,6 +16,7 @@ WIFI_PASSWORD = "YOUR-PASSWORD"
 AWS_ENDPOINT = "YOUR-ENDPOINT.amazonaws.com"
 AWS_CLIENT_ID = "ESP32"
 AWS_TOPIC = "esp32/pub"
+PUBLISH_TIME_SEC = 60
 
 # Paths to the certificates and private key
 CA_CERT_PATH = "/AmazonRootCA1.pem"
@@ -30,62 +32,52 @@ def connect_wifi(ssid, password):
         time.sleep(1)
     print('Connected to Wi-Fi:', wlan.ifconfig())
 
-def create_ssl_context():
-    # Create an SSL context
-    ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-
-    # Load the CA certificate
-    ssl_context.load_verify_locations(cafile=CA_CERT_PATH)
-
-    # Load the client certificate and private key
-    ssl_context.load_cert_chain(certfile=CLIENT_CERT_PATH, keyfile=PRIVATE_KEY_PATH)
-    return ssl_context
-
-def publish_to_aws():
-    try:
-        while True:
-            # Read sensor data
-            # dht_sensor.measure()
-            # temperature = dht_sensor.temperature()
-            # humidity = dht_sensor.humidity()
-            temperature = 23.5
-            humidity = 33.3
-
-            ssl_context = create_ssl_context()
-
-            # Initialize MQTT client
-            mqtt_client = MQTTClient(
-                client_id=AWS_CLIENT_ID,
-                server=AWS_ENDPOINT,
-                port=8883,
-                keepalive=3600,
-                ssl=ssl_context
-            )
-
-            # Connect to AWS
-            mqtt_client.connect()
-            print("Connected to {} MQTT Broker".format(AWS_ENDPOINT))
-
-            # Prepare the MQTT message
-            message = '{{"temperature": {}, "humidity": {}}}'.format(temperature, humidity)
-            # Publish message to AWS
-            mqtt_client.publish(AWS_TOPIC, message)
-            print("- topic:", AWS_TOPIC)
-            print("- payload:", message)
-
-            mqtt_client.disconnect()
-            print("Disconnected from AWS IoT")
-
-            # Wait 60 seconds before the next reading
-            time.sleep(60)
-
-    except Exception as e:
-        print("Error:", e)
+async def publish_to_aws():
+    # Certificates and key are read and parsed once, not before
+    # every reconnect
+    tls = TlsCredentials(CA_CERT_PATH, CLIENT_CERT_PATH, PRIVATE_KEY_PATH)
+
+    # One TLS session is kept open and reconnects by itself after
+    # a failure
+    mqtt = MqttSession(
+        server=AWS_ENDPOINT,
+        client_id=AWS_CLIENT_ID,
+        port=8883,
+        keepalive=2 * PUBLISH_TIME_SEC,
+        ssl=tls
+    )
+    asyncio.create_task(mqtt.run())
+
+    while True:
+        # Read sensor data
+        # dht_sensor.measure()
+        # temperature = dht_sensor.temperature()
+        # humidity = dht_sensor.humidity()
+        temperature = 23.5
+        humidity = 33.3
+
+        # Prepare the MQTT message
+        message = '{{"temperature": {}, "humidity": {}}}'.format(temperature, humidity)
+        # Publish message to AWS; QoS 1 messages are kept until
+        # acknowledged, also over a reconnect
+        await mqtt.publish(AWS_TOPIC, message, qos=1)
+        print("- topic:", AWS_TOPIC)
+        print("- payload:", message)
+        print("- acked: {}, latency: {} ms, in flight: {}".format(
+            mqtt.acked, mqtt.last_latency_ms, mqtt.inflight()))
+        print("- TLS: {} handshakes, last {} ms, mean {} ms".format(
+            tls.handshakes, tls.last_handshake_ms, tls.avg_handshake_ms()))
+
+        # Wait 60 seconds before the next reading
+        await asyncio.sleep(PUBLISH_TIME_SEC)
 
 # Main function
 def main():
     connect_wifi(WIFI_SSID, WIFI_PASSWORD)
-    publish_to_aws()
+    try:
+        asyncio.run(publish_to_aws())
+    except Exception as e:
+        print("Error:", e)
 
 # Run the main function
 if __name__ == "__main__":
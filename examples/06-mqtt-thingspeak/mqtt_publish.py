@@ -12,6 +12,10 @@ Authors
 
 Modification history
 --------------------
+- **2026-10-18** : Samples are queued on flash by `telemetry_queue`
+  and sent oldest first, none is dropped while offline.
+- **2026-10-18** : One persistent MQTT session by `mqtt_session` module
+  instead of connect and disconnect for every sample.
 - **2024-12-16** : print_log function added.
 - **2024-12-14** : Example created and tested.
 """
@@ -19,15 +23,18 @@ Modification history
 from machine import I2C
 from machine import Pin
 import time
+import uasyncio as asyncio
 import bme280
 import network
 import wifi_module
 import config
-from umqtt.robust import MQTTClient
+from mqtt_session import MqttSession
+from telemetry_queue import TelemetryQueue
 import mqtt_credentials as mc
 import sys
 
 PUBLISH_TIME_SEC = 60  # 300
+MIN_INTERVAL_SEC = 15  # ThingSpeak rate limit
 
 # MQTT parameters
 BROKER_ADDRESS = "mqtt3.thingspeak.com"
@@ -53,29 +60,63 @@ def print_log(level, message):
 
 
 # Publish sensor data if changed
-def publish_data(T, RH, P):
+async def publish_data(T, RH, P):
     global prev_T, prev_RH, prev_P
 
     # Check if the data has changed (ignore small fluctuations)
     if abs(T-prev_T) > 0.1 or abs(RH-prev_RH) > 1 or abs(P-prev_P) > 1:
         # Prepare payload
         payload = "field1={:.1f}&field2={:.1f}&field3={:.1f}".format(T, RH, P)
-
-        try:
-            client.connect()
-            client.publish(topic, payload)
-            client.disconnect()
-            print_log("I", "mqtt: Data published to channel: {}".format(topic))
-
-            # Update previous values after publishing
-            prev_T = T
-            prev_RH = RH
-            prev_P = P
-        except Exception as e:
-            print_log("E", "mqtt: Failed to publish data: {}{}".formagt(type(e).__name__, e))
+        tm = time.gmtime()
+        if tm[0] >= 2024:
+            # Time of the sample, as it may be sent later
+            payload += "&created_at={:04d}-{:02d}-{:02d}T{:02d}:{:02d}:{:02d}Z".format(*tm[:6])
+
+        # Store the sample first, so it survives a failure or reset
+        queue.put(payload.encode())
+        prev_T = T
+        prev_RH = RH
+        prev_P = P
     else:
         print_log("I", "mqtt: No/small changes, skipping publish")
 
+    await publish_queued()
+
+
+# Publish queued samples, oldest first
+async def publish_queued(max_count=PUBLISH_TIME_SEC // MIN_INTERVAL_SEC):
+    for i in range(max_count):
+        records = queue.peek(1)
+        if not records:
+            return
+        if i:
+            await asyncio.sleep(MIN_INTERVAL_SEC)
+
+        # ThingSpeak supports QoS 0 only
+        if not await client.publish(topic, records[0]):
+            print_log("E", "mqtt: Not connected, data kept in queue")
+            return
+        queue.ack()
+        print_log("I", "mqtt: Data published to channel: {}".format(topic))
+
+
+# Read and publish the data periodically
+async def main():
+    # Session connects, sends keep-alive pings and reconnects
+    asyncio.create_task(client.run())
+    await asyncio.sleep(2)  # Time to connect
+
+    while True:
+        # Read the sensor data
+        T, RH, P, _ = bme.read_values()
+        print_log("I", "bme280: temp(°C), humi(%), pres(hPa): {:.1f}, {:.1f}, {:.1f}".format(T, RH, P))
+
+        # Publish data if it has changed
+        await publish_data(T, RH, P)
+
+        # Wait before next reading
+        await asyncio.sleep(PUBLISH_TIME_SEC)
+
 
 # Initialize start time for log system
 start_time = time.ticks_ms()
@@ -90,16 +131,19 @@ wifi = network.WLAN(network.STA_IF)
 if not wifi_module.connect(wifi, config.SSID, config.PSWD):
     sys.exit()
 
-# Setup MQTT client and topic
+# Setup MQTT session and topic
 # Note: Connection uses unsecure TCP (port 1883)
-client = MQTTClient(
+client = MqttSession(
     server=BROKER_ADDRESS,
-    client_id=mc.MQTT_CLIENT_ID, 
-    user=mc.MQTT_USERNAME, 
-    password=mc.MQTT_PASSWORD, 
-    ssl=False)
+    client_id=mc.MQTT_CLIENT_ID,
+    user=mc.MQTT_USERNAME,
+    password=mc.MQTT_PASSWORD,
+    keepalive=2 * PUBLISH_TIME_SEC)
 topic = "channels/{}/publish".format(mc.CHANNEL_ID)
 
+# Samples waiting for publishing, up to 8 x 4 kB on flash
+queue = TelemetryQueue("/queue", segment_size=4096, max_segments=8)
+
 # Initialize previous sensor data
 prev_T = T + 10  # Make sure the first readings are published
 prev_RH = RH
@@ -110,16 +154,7 @@ print_log("I", "main: Press `Ctrl+C` to stop")
 
 # Main loop to read and publish data
 try:
-    while True:
-        # Read the sensor data
-        T, RH, P, _ = bme.read_values()
-        print_log("I", "bme280: temp(°C), humi(%), pres(hPa): {:.1f}, {:.1f}, {:.1f}".format(T, RH, P))
-
-        # Publish data if it has changed
-        publish_data(T, RH, P)
-
-        # Wait before next reading
-        time.sleep(PUBLISH_TIME_SEC)
+    asyncio.run(main())
 
 except KeyboardInterrupt:
     # This part runs when Ctrl+C is pressed
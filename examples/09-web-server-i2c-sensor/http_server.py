@@ -0,0 +1,431 @@
+"""
+This module provides a small HTTP/1.1 server based on `asyncio`, for
+web pages and data of sensor examples.
+
+Several clients are served concurrently and connections are kept open
+between requests (keep-alive), so a page polling the device every
+second does not open a new TCP connection each time. Each connection
+gets one of `max_clients` preallocated slots with a request buffer and
+a response buffer; when all are used, the client gets the response
+503. A response is assembled in its buffer and sent by one write,
+including the status line and headers. Responses larger than the
+buffer can be streamed by `Response.send` with chunked encoding.
+
+Handlers are registered in a route table by the method and path and
+are called with a `Request` and a `Response`. They may be plain
+functions or coroutines.
+
+Example
+-------
+.. code-block:: python
+
+    import uasyncio as asyncio
+    from http_server import HttpServer
+
+    server = HttpServer()
+
+    @server.route("/")
+    def index(request, response):
+        response.write("<h1>Hello</h1>")
+
+    @server.route("/data")
+    def data(request, response):
+        response.content_type = "application/json"
+        response.write('{"temp": 23.5}')
+
+    asyncio.run(server.serve(port=80))
+
+Author
+------
+Tomas Fryza
+
+Modification history
+--------------------
+- **2026-10-18** : File created, initial release.
+"""
+
+
+import uasyncio as asyncio
+
+_HEADROOM = 192  # Space for the status line, headers and chunk size
+_TAILROOM = 7  # Line end after a chunk and the last empty chunk
+_REASONS = {200: "OK", 204: "No Content", 400: "Bad Request",
+            404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 500: "Internal Server Error",
+            503: "Service Unavailable"}
+_BUSY = (b"HTTP/1.1 503 Service Unavailable\r\nContent-Length: 0\r\n"
+         b"Connection: close\r\n\r\n")
+
+
+async def _recv(reader, mv):
+    """
+    Read into a memoryview, with a fallback for streams without
+    `readinto`.
+    """
+    if hasattr(reader, "readinto"):
+        return await reader.readinto(mv)
+    data = await reader.read(len(mv))
+    mv[:len(data)] = data
+    return len(data)
+
+
+def _find_end(buf, start, n):
+    """
+    Return the end of the headers, i.e. the position after the empty
+    line, or -1.
+    """
+    i = max(start, 2)
+    while i < n:
+        if buf[i] == 0x0a and buf[i - 2] == 0x0a:
+            return i + 1
+        i += 1
+    return -1
+
+
+class Request:
+    """
+    Parsed request; one object is reused by all requests of a slot.
+    """
+
+    def __init__(self, size):
+        self.buf = bytearray(size)
+        self.mv = memoryview(self.buf)
+        self.method = ""
+        self.path = ""
+        self.query = ""
+        self.keep_alive = True
+        self.body = self.mv[:0]
+        self._headers = self.mv[:0]
+
+    def _parse(self, end):
+        """
+        Parse the request line and keep the header lines.
+
+        :param end: End of the headers in the buffer.
+        :returns: `False` if the request line is malformed.
+        """
+        mv = self.mv
+        eol = 0
+        while mv[eol] != 0x0a:
+            eol += 1
+        line = bytes(mv[:eol]).split()
+        if len(line) != 3:
+            return False
+        try:
+            self.method = line[0].decode()
+            target = line[1].decode()
+        except ValueError:
+            return False  # Not valid UTF-8
+        q = target.find("?")
+        if q < 0:
+            (self.path, self.query) = (target, "")
+        else:
+            (self.path, self.query) = (target[:q], target[q + 1:])
+        self._headers = mv[eol + 1:end]
+        connection = self.header(b"connection")
+        if connection is not None:
+            connection = connection.lower()
+        if line[2] == b"HTTP/1.0":
+            self.keep_alive = connection == b"keep-alive"
+        else:
+            self.keep_alive = connection != b"close"
+        return True
+
+    def header(self, name):
+        """
+        Return the value of a header as bytes, or `None`.
+
+        :param name: Header name in lower case as bytes, e.g. `b"host"`.
+        """
+        (hdr, n, start) = (self._headers, len(self._headers), 0)
+        while start < n:
+            end = start
+            while end < n and hdr[end] != 0x0a:
+                end += 1
+            colon = start
+            while colon < end and hdr[colon] != 0x3a:  # ':'
+                colon += 1
+            if colon - start == len(name) and \
+                    bytes(hdr[start:colon]).lower() == name:
+                return bytes(hdr[colon + 1:end]).strip()
+            start = end + 1
+        return None
+
+
+class Response:
+    """
+    Response assembled in a preallocated buffer.
+    """
+
+    def __init__(self, size):
+        self.buf = bytearray(_HEADROOM + size + _TAILROOM)
+        self.mv = memoryview(self.buf)
+        self.writer = None
+        self.reset()
+
+    def reset(self):
+        """
+        Prepare the object for the next response.
+        """
+        self.status = 200
+        self.content_type = "text/html"
+        self.headers = ""  # Extra header lines, each ending with "\r\n"
+        self.keep_alive = True
+        self.sent = False  # Headers were sent
+        self._n = _HEADROOM  # End of the body
+        self._chunked = False
+
+    def free(self):
+        """
+        Return the free space of the buffer in bytes.
+        """
+        return len(self.buf) - _TAILROOM - self._n
+
+    def write(self, data):
+        """
+        Append data to the body.
+
+        :param data: `str` or bytes-like object.
+        :raises ValueError: If the data do not fit in the buffer.
+        """
+        if isinstance(data, str):
+            data = data.encode()
+        n = len(data)
+        if n > self.free():
+            raise ValueError("response buffer full")
+        self.mv[self._n:self._n + n] = data
+        self._n += n
+
+    async def send(self, data):
+        """
+        Append data to the body; whenever the buffer is full, its
+        contents are sent as one chunk of chunked transfer encoding.
+
+        :param data: `str` or bytes-like object.
+        """
+        if isinstance(data, str):
+            data = data.encode()
+        mv = memoryview(data)
+        while len(mv) > self.free():
+            n = self.free()
+            self.write(mv[:n])
+            mv = mv[n:]
+            self._chunked = True
+            await self.flush()
+        self.write(mv)
+
+    async def flush(self, last=False):
+        """
+        Send the buffered body, with the status line and headers in
+        front of it if they were not sent yet. Called by the server
+        after the handler with `last` set.
+        """
+        length = self._n - _HEADROOM
+        end = self._n
+        prefix = b""
+        if not self.sent:
+            if self._chunked:
+                size = "Transfer-Encoding: chunked"
+            else:
+                size = "Content-Length: %d" % length
+            prefix = ("HTTP/1.1 %d %s\r\nContent-Type: %s\r\n%s\r\n"
+                      "Connection: %s\r\n%s\r\n") % (
+                self.status, _REASONS.get(self.status, ""),
+                self.content_type, size,
+                "keep-alive" if self.keep_alive else "close",
+                self.headers)
+            prefix = prefix.encode()
+        if self._chunked:
+            if length:
+                prefix += b"%x\r\n" % length
+                self.mv[end:end + 2] = b"\r\n"
+                end += 2
+            if last:
+                self.mv[end:end + 5] = b"0\r\n\r\n"
+                end += 5
+        start = _HEADROOM - len(prefix)
+        if start < 0:
+            # Long extra headers do not fit in front of the body
+            self.writer.write(prefix)
+            start = _HEADROOM
+        else:
+            self.mv[start:_HEADROOM] = prefix
+        self.writer.write(self.mv[start:end])
+        await self.writer.drain()
+        self.sent = True
+        self._n = _HEADROOM
+
+
+class HttpServer:
+    """
+    HTTP/1.1 server with keep-alive and a route table.
+    """
+
+    def __init__(self, max_clients=4, request_size=1024, response_size=2048,
+                 keepalive_s=5):
+        """
+        Allocate the buffers of all client slots.
+
+        :param max_clients: Number of connections served at once.
+        :param request_size: Size of the buffer of the request headers
+                             and body.
+        :param response_size: Size of the buffer of the response body.
+        :param keepalive_s: Time an idle connection is kept open.
+        """
+        self.routes = {}
+        self.keepalive_s = keepalive_s
+        self._slots = [(Request(request_size), Response(response_size))
+                       for _ in range(max_clients)]
+        self.server = None
+        self.connections = 0
+        self.requests = 0
+        self.rejected = 0  # Connections refused by 503
+
+    def add_route(self, method, path, handler):
+        """
+        Register a handler `handler(request, response)`.
+
+        :param method: Method, such as `"GET"`.
+        :param path: Path without the query, such as `"/data"`.
+        :param handler: Function, or coroutine function.
+        """
+        self.routes[(method, path)] = handler
+
+    def route(self, path, method="GET"):
+        """
+        Decorator form of `add_route`.
+        """
+        def decorator(handler):
+            self.add_route(method, path, handler)
+            return handler
+        return decorator
+
+    async def serve(self, host="0.0.0.0", port=80, backlog=5):
+        """
+        Start the server and wait until it is closed.
+        """
+        self.server = await asyncio.start_server(self._client, host, port,
+                                                 backlog=backlog)
+        print(f"HTTP server listening on port {port}")
+        await self.server.wait_closed()
+
+    async def _client(self, reader, writer):
+        try:
+            if not self._slots:
+                self.rejected += 1
+                writer.write(_BUSY)
+            else:
+                self.connections += 1
+                slot = self._slots.pop()
+                try:
+                    await self._connection(reader, writer, *slot)
+                except (OSError, asyncio.TimeoutError):
+                    pass  # Client disconnected or idle
+                finally:
+                    self._slots.append(slot)
+        finally:
+            # Also after an unexpected error, so no socket is leaked
+            try:
+                await writer.drain()
+                writer.close()
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    async def _connection(self, reader, writer, request, response):
+        """
+        Serve the requests of one connection until it is closed.
+        """
+        (buf, mv) = (request.buf, request.mv)
+        response.writer = writer
+        n = 0  # Bytes in the request buffer
+        while True:
+            # Headers
+            end = _find_end(buf, 0, n)
+            while end < 0:
+                if n == len(buf):
+                    await self._error(response, 413)
+                    return
+                got = await asyncio.wait_for(_recv(reader, mv[n:]),
+                                             self.keepalive_s)
+                if not got:
+                    return  # Closed by the client
+                end = _find_end(buf, max(n - 3, 0), n + got)
+                n += got
+            response.reset()
+            if not request._parse(end):
+                await self._error(response, 400)
+                return
+            # Body
+            try:
+                total = end + int(request.header(b"content-length") or 0)
+            except ValueError:
+                await self._error(response, 400)
+                return
+            if total > len(buf):
+                await self._error(response, 413)
+                return
+            while n < total:
+                got = await asyncio.wait_for(_recv(reader, mv[n:total]),
+                                             self.keepalive_s)
+                if not got:
+                    return
+                n += got
+            request.body = mv[end:total]
+
+            self.requests += 1
+            response.keep_alive = request.keep_alive
+            if not await self._dispatch(request, response):
+                return  # Broken response, close the connection
+            await response.flush(True)
+            if not response.keep_alive:
+                return
+            # Keep a pipelined request received together with this one
+            rest = n - total
+            if rest:
+                buf[:rest] = buf[total:n]
+            n = rest
+
+    async def _dispatch(self, request, response):
+        """
+        Call the handler of a request.
+
+        :returns: `False` if the handler failed after a part of the
+                  response was sent.
+        """
+        handler = self.routes.get((request.method, request.path))
+        if handler is None:
+            for (method, path) in self.routes:
+                if path == request.path:
+                    response.status = 405
+                    break
+            else:
+                response.status = 404
+            response.content_type = "text/plain"
+            response.write(_REASONS[response.status])
+            return True
+        try:
+            result = handler(request, response)
+            if result is not None:
+                await result  # Coroutine handler
+        except Exception as e:
+            print(f"[!] Handler of {request.path} failed: {e}")
+            if response.sent:
+                return False
+            response.reset()
+            response.keep_alive = False
+            response.status = 500
+            response.content_type = "text/plain"
+            response.write(_REASONS[500])
+        return True
+
+    async def _error(self, response, status):
+        """
+        Send an error response and close the connection.
+        """
+        response.reset()
+        response.keep_alive = False
+        response.status = status
+        response.content_type = "text/plain"
+        response.write(_REASONS[status])
+        await response.flush(True)
@@ -14,18 +14,44 @@ NOTES:
 
     * Save copy of both files (`boot.py` and `main.py`) to
       ESP device and press on-board reset button
-    * Put IP address from the Shell to your web browser
+    * Save also `http_server.py`, `sensor_service.py` and
+      `ts_store.py` to ESP device
+    * Put IP address from the Shell to your web browser; the page
+      updates the values every second from `/data`
+    * Sensors are read every 5 seconds by a separate task, not by
+      the requests; `/data?max_age=1000` asks for values younger
+      than 1 second
+    * History of values is stored in `/ts` directory, e.g.
+      `/history?ch=1&hours=24&step=3600` returns hourly mean,
+      minimum and maximum temperature of the last 24 hours
+    * The clock is set by NTP; values are not stored into the
+      history until the time is valid
 
 Inspired by:
     * https://randomnerdtutorials.com/micropython-esp32-esp8266-dht11-dht22-web-server/
     * https://fontawesome.com/icons
 """
 
+import uasyncio as asyncio
+import time
+import ntptime
+from http_server import HttpServer
+from sensor_service import SensorService
+from ts_store import TimeSeriesStore
+
+# Channel IDs of the history
+CH_TEMP = 1
+CH_TEMP_C = 2
+CH_HUMI = 3
+
+# Earlier time means the clock was not set after a power cycle
+MIN_VALID_YEAR = 2024
+
 
 def read_dht12_sensor():
     """Read 5 bytes from DHT12 sensor and verify the checksum
 
-    :return:  None
+    :return:  True if the checksum is valid
     """
     # Read 5 bytes from addr. 0 from peripheral with 7-bit address 0x5c
     led.on()
@@ -34,7 +60,10 @@ def read_dht12_sensor():
     # Checksum
     if (buf[0] + buf[1] + buf[2] + buf[3]) & 0xff != buf[4]:
         print("ERR: Checksum error")
+        led.off()
+        return False
     led.off()
+    return True
 
 
 def read_raw_temperature():
@@ -49,12 +78,8 @@ def read_raw_temperature():
     return(round(temp_c, 1))
 
 
-def web_page():
-    """Static web page to be trasmited
-
-    :return:  HTML code to be displayed
-    """
-    html_code = """<!DOCTYPE HTML><html>
+# Static parts of the web page, values are written between them
+PAGE_HEAD = b"""<!DOCTYPE HTML><html>
 <head>
     <meta name="viewport" content="width=device-width, initial-scale=1">
     <link rel="stylesheet" href="https://use.fontawesome.com/releases/v5.7.2/css/all.css" integrity="sha384-fnmOCqbTlWIlj8LyTjo7mOUStjsKC4pOpQbqyi7RrhN7udi9RwhKkMHpvLbHG9Sr" crossorigin="anonymous">
@@ -80,21 +105,48 @@ def web_page():
 
     <p><i class="fas fa-thermometer-quarter" style="color:#008000;"></i> 
     <span class="dht-labels">Temperature</span> 
-    <span>"""+str(temp)+"""</span>
+    <span id="temp">"""
+PAGE_TEMP_C = b"""</span>
     <sup class="units">&#186;C</sup></p>
 
     <p><i class="fas fa-thermometer-half" style="color:#dd0000;"></i> 
     <span class="dht-labels">ESP Temperature</span> 
-    <span>"""+str(temp_c)+"""</span>
+    <span id="temp_c">"""
+PAGE_HUMI = b"""</span>
     <sup class="units">&#186;C</sup></p>
 
     <p><i class="fas fa-tint" style="color:#00add6;"></i> 
     <span class="dht-labels">Humidity</span>
-    <span>"""+str(humi)+"""</span>
+    <span id="humi">"""
+PAGE_TAIL = b"""</span>
     <sup class="units">%</sup></p>
+    <script>
+        setInterval(async () => {
+            const r = await fetch("/data");
+            if (!r.ok) return;
+            const d = await r.json();
+            for (const k in d) {
+                const e = document.getElementById(k);
+                if (e) e.textContent = d[k];
+            }
+        }, 1000);
+    </script>
 </body>
 </html>"""
-    return html_code
+
+
+def read_values():
+    """Read all sensors, called by the sampling service only
+
+    :return:  Tuple of DHT12 temperature, ESP32 temperature and humidity
+    """
+    if not read_dht12_sensor():
+        raise OSError("DHT12 checksum")
+    temp_c = read_raw_temperature()
+    humi = buf[0] + (buf[1]*0.1)
+    temp = buf[2] + (buf[3]*0.1)
+    print(f"Temperature: {temp} C\tHumidity: {humi} %")
+    return (temp, temp_c, humi)
 
 
 # Create I2C peripheral at frequency of 100 kHz
@@ -105,31 +157,127 @@ buf = bytearray(5)
 # Status LED
 led = Pin(2, Pin.OUT)
 
-# Create TCP/IP socket object
-s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-s.bind(("", 80))
-s.listen(5)
+# Sensors are read every 5 s, DHT12 needs at least 2 s between readings
+sensors = SensorService(read_values, period_ms=5000, min_interval_ms=2000)
 
-# Forever loop
-while True:
-    # Accept a new connection
-    conn, address = s.accept()
+# History with 1-minute and 1-hour rollups, sized for a 1.5 MB file
+# system: 3 channels x 3 series x 4 segments x 1024 records take
+# about 0.55 MB (raw 8 bytes, rollup 18 bytes per record), i.e. the
+# last 5.7 hours of samples, 2.8 days of minutes and 170 days of hours
+db = TimeSeriesStore("/ts", rollups=(60, 3600), segment_records=1024,
+                     max_segments=4)
 
-    # Receive data from the remote socket; maximum size is 512 bytes
-    request = conn.recv(512)
-    print(f"Request received ({len(request)} bytes) from {address}")
-    print(request.decode())
 
-    # Get sensor data
-    read_dht12_sensor()
-    temp_c = read_raw_temperature()
-    humi = buf[0] + (buf[1]*0.1)
-    temp = buf[2] + (buf[3]*0.1)
-    print(f"Temperature: {temp} C\tHumidity: {humi} %")
+def clock_valid():
+    """Check that the clock was set by NTP"""
+    return time.gmtime()[0] >= MIN_VALID_YEAR
+
+
+def store_values(snap):
+    """Append every new snapshot to the history"""
+    if not clock_valid():
+        return  # Time stamps would be wrong
+    (temp, temp_c, humi) = snap.values
+    t = int(time.time())
+    db.append(CH_TEMP, temp, t)
+    db.append(CH_TEMP_C, temp_c, t)
+    db.append(CH_HUMI, humi, t)
+
+
+sensors.subscribe(store_values)
+
+# Web server with up to 4 clients at once
+server = HttpServer(max_clients=4, response_size=2048)
+
+
+def query_params(request):
+    """Parse query string of a request to a dictionary"""
+    params = {}
+    for item in request.query.split("&"):
+        if "=" in item:
+            (key, value) = item.split("=", 1)
+            params[key] = value
+    return params
+
+
+@server.route("/")
+def index(request, response):
+    """Web page with current values"""
+    snap = sensors.get()
+    if snap is None:
+        response.status = 503
+        response.write("Sensor not ready, try again later")
+        return
+    (temp, temp_c, humi) = snap.values
+    response.write(PAGE_HEAD)
+    response.write("%.1f" % temp)
+    response.write(PAGE_TEMP_C)
+    response.write("%.1f" % temp_c)
+    response.write(PAGE_HUMI)
+    response.write("%.1f" % humi)
+    response.write(PAGE_TAIL)
+
+
+@server.route("/data")
+def data(request, response):
+    """Current values in JSON, polled by the web page"""
+    max_age = query_params(request).get("max_age")
+    snap = sensors.get(int(max_age) if max_age else None)
+    response.content_type = "application/json"
+    if snap is None:
+        response.status = 503
+        response.write('{"error": "sensor not ready"}')
+        return
+    (temp, temp_c, humi) = snap.values
+    response.write('{"temp": %.1f, "temp_c": %.1f, "humi": %.1f, '
+                   '"version": %d, "age_ms": %d}'
+                   % (temp, temp_c, humi, snap.version, snap.age_ms()))
+
+
+@server.route("/history")
+async def history(request, response):
+    """Mean, minimum and maximum of one channel in JSON"""
+    response.content_type = "application/json"
+    if not clock_valid():
+        response.status = 503
+        response.write('{"error": "clock not set"}')
+        return
+    params = query_params(request)
+    channel = int(params.get("ch", CH_TEMP))
+    step = int(params.get("step", 600))
+    t_end = int(time.time())
+    t_start = t_end - int(params.get("hours", 24)) * 3600
+    await response.send("[")
+    sep = ""
+    for (t, mean, min_val, max_val) in db.query(channel, t_start, t_end, step):
+        await response.send("%s[%d,%.2f,%.2f,%.2f]"
+                            % (sep, t, mean, min_val, max_val))
+        sep = ","
+    await response.send("]")
+
+
+async def sync_clock():
+    """Set the clock by NTP, every minute until it succeeds and then
+    once a day"""
+    while True:
+        try:
+            ntptime.settime()  # UTC
+            print(f"Clock set by NTP: {time.gmtime()[:6]}")
+        except OSError as e:
+            print(f"[!] NTP failed: {e}")
+        await asyncio.sleep(86400 if clock_valid() else 60)
+
+
+async def main():
+    """Start the sampling task and the web server"""
+    asyncio.create_task(sync_clock())
+    sensors.refresh()
+    asyncio.create_task(sensors.run())
+    await server.serve(port=80)
+
 
-    response = web_page()
-    conn.send('HTTP/1.1 200 OK\n')
-    conn.send('Content-Type: text/html\n')
-    conn.send('Connection: close\n\n')
-    conn.sendall(response)
-    conn.close()
+try:
+    asyncio.run(main())
+except KeyboardInterrupt:
+    print("Program stopped. Exiting...")
+    db.flush()
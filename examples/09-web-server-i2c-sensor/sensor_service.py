@@ -0,0 +1,145 @@
+"""
+This module decouples reading of sensors from their users. A
+sampling task reads the sensors on its own schedule and publishes the
+values as an immutable, versioned `Snapshot`. HTTP handlers, MQTT
+publishers or a display then take the latest snapshot without any bus
+transfer, so their latency does not depend on the conversion time of
+the sensors, and a burst of requests does not violate the minimum
+sampling interval of a sensor, e.g. 2 seconds of DHT12.
+
+A user that needs fresher data passes `max_age_ms` to `get`; the
+sensors are then read at once, but never more often than
+`min_interval_ms`.
+
+Example
+-------
+.. code-block:: python
+
+    import uasyncio as asyncio
+    from sensor_service import SensorService
+
+    def sample():
+        return (read_temperature(), read_humidity())
+
+    sensors = SensorService(sample, period_ms=5000, min_interval_ms=2000)
+    sensors.subscribe(lambda snap: print(snap.version, snap.values))
+    asyncio.create_task(sensors.run())
+    ...
+    snap = sensors.get()  # No bus transfer
+    (temp, humi) = snap.values
+    snap = sensors.get(max_age_ms=1000)  # Read again if older than 1 s
+
+Author
+------
+Tomas Fryza
+
+Modification history
+--------------------
+- **2026-10-18** : Listener errors do not stop the sampling task;
+  failed readings also count for `min_interval_ms`.
+- **2026-10-18** : File created, initial release.
+"""
+
+import uasyncio as asyncio
+import time
+
+
+class Snapshot:
+    """
+    Values of all sensors read at one time. A new object is created
+    for every refresh, so a reference always stays consistent.
+    """
+
+    def __init__(self, version, ticks, values):
+        self.version = version  # Incremented with every refresh
+        self.ticks = ticks  # `time.ticks_ms()` of the reading
+        self.values = values
+
+    def age_ms(self):
+        """
+        Return the time since the reading in milliseconds.
+        """
+        return time.ticks_diff(time.ticks_ms(), self.ticks)
+
+
+class SensorService:
+    """
+    Periodic sampling of sensors into versioned snapshots.
+    """
+
+    def __init__(self, sample, period_ms=2000, min_interval_ms=2000):
+        """
+        :param sample: Function reading all sensors and returning their
+                       values, e.g. as a tuple.
+        :param period_ms: Sampling period of the `run` task.
+        :param min_interval_ms: Shortest time between two readings,
+                                also for `get` with `max_age_ms`.
+        """
+        self.sample = sample
+        self.period_ms = period_ms
+        self.min_interval_ms = min_interval_ms
+        self.snapshot = None
+        self.errors = 0  # Failed readings
+        self.listener_errors = 0  # Exceptions raised by listeners
+        self._listeners = []
+        self._attempt_ms = None  # Last reading, also a failed one
+
+    def subscribe(self, callback):
+        """
+        Call `callback(snapshot)` after every successful reading, e.g.
+        to store the values. Exceptions of the callback are counted in
+        `listener_errors` and do not stop the sampling.
+        """
+        self._listeners.append(callback)
+
+    def refresh(self):
+        """
+        Read the sensors, unless the last attempt to read them, also
+        a failed one, is younger than `min_interval_ms`.
+
+        :returns: `True` if a new snapshot was published.
+        """
+        now = time.ticks_ms()
+        if self._attempt_ms is not None and \
+                time.ticks_diff(now, self._attempt_ms) < self.min_interval_ms:
+            return False
+        self._attempt_ms = now
+        snap = self.snapshot
+        try:
+            values = self.sample()
+        except OSError as e:
+            self.errors += 1
+            print(f"[!] Sensor reading failed: {e}")
+            return False
+        version = snap.version + 1 if snap is not None else 1
+        self.snapshot = Snapshot(version, time.ticks_ms(), values)
+        for callback in self._listeners:
+            try:
+                callback(self.snapshot)
+            except Exception as e:
+                # E.g. a full file system; sampling goes on
+                self.listener_errors += 1
+                print(f"[!] Snapshot listener failed: {e}")
+        return True
+
+    def get(self, max_age_ms=None):
+        """
+        Return the latest snapshot without reading the sensors, or
+        `None` before the first successful reading.
+
+        :param max_age_ms: Read the sensors first if the snapshot is
+                           older; `None` accepts any age.
+        """
+        snap = self.snapshot
+        if snap is None or (max_age_ms is not None and
+                            snap.age_ms() > max_age_ms):
+            self.refresh()
+        return self.snapshot
+
+    async def run(self):
+        """
+        Sampling task; start it by `asyncio.create_task(service.run())`.
+        """
+        while True:
+            self.refresh()
+            await asyncio.sleep_ms(self.period_ms)
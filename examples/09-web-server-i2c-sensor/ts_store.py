@@ -0,0 +1,419 @@
+"""
+This module provides an append-only time-series store on the file
+system (VFS) of the device, e.g. sensor history behind a web page.
+
+Every channel is kept as a set of series: the raw samples and rollups
+with the minimum, maximum and mean over coarser intervals, 1 minute
+and 1 hour by default. A series is split into segment files of a
+fixed number of records and every segment has a sparse index with the
+time of every `index_every`-th record. A query therefore reads the
+small index, seeks close to the start time and streams the records
+one block at a time; whole segments are never loaded into RAM.
+
+Files in the `root` directory, for channel `c` and level `l` (0 is
+the raw series):
+
+- `c_l.cat`: catalog of segments, (number, first time) as 2x uint32;
+- `c_l_NNNNN.dat`: records, (time, value) as uint32 and float for
+  raw samples, (time, minimum, maximum, mean, count) as uint32, 3x
+  float and uint16 for rollups;
+- `c_l_NNNNN.idx`: time of every `index_every`-th record as uint32.
+
+Times are integer seconds, `time.time()` by default, and must not
+decrease. The oldest segments are removed when a series has more than
+`max_segments`. A rollup interval is stored when the first sample of
+the next interval arrives; after a restart, the open intervals are
+rebuilt from the raw samples.
+
+Example
+-------
+.. code-block:: python
+
+    from ts_store import TimeSeriesStore
+
+    db = TimeSeriesStore("/ts", rollups=(60, 3600))
+    db.append(1, 23.5)  # Channel 1, current time
+    ...
+    # Hourly values of the last 24 hours
+    now = time.time()
+    for (t, mean, min_val, max_val) in db.query(1, now - 86400, now, 3600):
+        print(t, mean, min_val, max_val)
+
+Author
+------
+Tomas Fryza
+
+Modification history
+--------------------
+- **2026-10-18** : Open rollup intervals rebuilt after a restart.
+- **2026-10-18** : File created, initial release.
+"""
+
+import os
+import struct
+import time
+
+_RAW_FORMAT = "<If"  # Time, value
+_ROLLUP_FORMAT = "<IfffH"  # Time, minimum, maximum, mean, count
+_CATALOG_FORMAT = "<II"  # Segment number, time of the first record
+
+
+def _size(path):
+    """
+    Return the size of a file, or -1 if it does not exist.
+    """
+    try:
+        return os.stat(path)[6]
+    except OSError:
+        return -1
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass  # Already removed
+
+
+class _Series:
+    """
+    Time-ordered records of one channel and level in segment files.
+    """
+
+    def __init__(self, prefix, fmt, segment_records, index_every,
+                 max_segments, buffer_records=32):
+        self.prefix = prefix
+        self.fmt = fmt
+        self.record_size = struct.calcsize(fmt)
+        self.segment_records = segment_records
+        self.index_every = index_every
+        self.max_segments = max_segments
+        self._buf = bytearray(buffer_records * self.record_size)
+        self._buf_n = 0  # Records in the buffer
+        self._idx = bytearray(4 * (buffer_records // index_every + 1))
+        self._idx_n = 0  # Index entries in the buffer
+        self._count = 0  # Records of the last segment, including buffer
+        self.last_time = 0
+        # Catalog of segments
+        self.segments = []
+        self.firsts = []
+        try:
+            with open(prefix + ".cat", "rb") as f:
+                data = f.read()
+            for pos in range(0, len(data) - 7, 8):
+                (number, first) = struct.unpack_from(_CATALOG_FORMAT, data, pos)
+                self.segments.append(number)
+                self.firsts.append(first)
+        except OSError:
+            pass  # New series
+        if self.segments:
+            size = _size(self._path(self.segments[-1], ".dat"))
+            if size < 0 or size % self.record_size:
+                # Incomplete last record after a reset: continue in a
+                # new segment
+                self._count = self.segment_records
+            else:
+                self._count = size // self.record_size
+            self.last_time = self.firsts[-1]
+            self._read_last_time(size)
+        else:
+            self._count = self.segment_records  # First append opens one
+
+    def _path(self, number, ext):
+        return f"{self.prefix}_{number:05d}{ext}"
+
+    def _read_last_time(self, size):
+        """
+        Set the time of the last stored record.
+        """
+        if size < self.record_size:
+            return
+        with open(self._path(self.segments[-1], ".dat"), "rb") as f:
+            f.seek(size - size % self.record_size - self.record_size)
+            self.last_time = struct.unpack("<I", f.read(4))[0]
+
+    def _new_segment(self, t):
+        self.flush()
+        number = self.segments[-1] + 1 if self.segments else 1
+        self.segments.append(number)
+        self.firsts.append(t)
+        if self.max_segments and len(self.segments) > self.max_segments:
+            old = self.segments.pop(0)
+            self.firsts.pop(0)
+            _remove(self._path(old, ".dat"))
+            _remove(self._path(old, ".idx"))
+            # Rewrite the catalog without the removed segment
+            with open(self.prefix + ".cat", "wb") as f:
+                for i in range(len(self.segments)):
+                    f.write(struct.pack(_CATALOG_FORMAT, self.segments[i],
+                                        self.firsts[i]))
+        else:
+            with open(self.prefix + ".cat", "ab") as f:
+                f.write(struct.pack(_CATALOG_FORMAT, number, t))
+        self._count = 0
+
+    def append(self, t, *fields):
+        """
+        Add one record; `t` must not be smaller than the last time.
+        """
+        if self._count >= self.segment_records:
+            self._new_segment(t)
+        if self._count % self.index_every == 0:
+            struct.pack_into("<I", self._idx, 4 * self._idx_n, t)
+            self._idx_n += 1
+        struct.pack_into(self.fmt, self._buf, self._buf_n * self.record_size,
+                         t, *fields)
+        self._buf_n += 1
+        self._count += 1
+        self.last_time = t
+        if self._buf_n * self.record_size == len(self._buf):
+            self.flush()
+
+    def flush(self):
+        """
+        Write the buffered records and index entries. The data go
+        first, so an index entry never points past the data.
+        """
+        if not self._buf_n:
+            return
+        number = self.segments[-1]
+        with open(self._path(number, ".dat"), "ab") as f:
+            f.write(memoryview(self._buf)[:self._buf_n * self.record_size])
+        if self._idx_n:
+            with open(self._path(number, ".idx"), "ab") as f:
+                f.write(memoryview(self._idx)[:4 * self._idx_n])
+        self._buf_n = 0
+        self._idx_n = 0
+
+    def _start_record(self, number, t_start):
+        """
+        Return the number of a record of a segment at or before the
+        first record with time `t_start`, using the sparse index.
+        """
+        try:
+            with open(self._path(number, ".idx"), "rb") as f:
+                idx = f.read()
+        except OSError:
+            return 0
+        # Binary search of the last entry with time below `t_start`
+        (lo, hi) = (0, len(idx) // 4)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if struct.unpack_from("<I", idx, 4 * mid)[0] < t_start:
+                lo = mid + 1
+            else:
+                hi = mid
+        return max(lo - 1, 0) * self.index_every
+
+    def scan(self, t_start, t_end, buf):
+        """
+        Iterate over the records with time from `t_start` to `t_end`,
+        both included.
+
+        :param buf: Read buffer, larger than one record.
+        """
+        self.flush()
+        rs = self.record_size
+        mv = memoryview(buf)[:len(buf) - len(buf) % rs]
+        # Last segment starting before `t_start`; records with time
+        # equal to `t_start` may end the previous segment
+        i = 0
+        while i + 1 < len(self.segments) and self.firsts[i + 1] < t_start:
+            i += 1
+        while i < len(self.segments):
+            number = self.segments[i]
+            if self.firsts[i] > t_end:
+                return
+            try:
+                f = open(self._path(number, ".dat"), "rb")
+            except OSError:
+                i += 1
+                continue  # Removed meanwhile
+            with f:
+                f.seek(self._start_record(number, t_start) * rs)
+                while True:
+                    n = f.readinto(mv)
+                    if not n:
+                        break
+                    for pos in range(0, n - n % rs, rs):
+                        record = struct.unpack_from(self.fmt, mv, pos)
+                        if record[0] > t_end:
+                            return
+                        if record[0] >= t_start:
+                            yield record
+            i += 1
+
+
+class _Channel:
+    """
+    Raw series and rollups of one channel.
+    """
+
+    def __init__(self, store, channel):
+        base = f"{store.root}/{channel}_"
+        args = (store.segment_records, store.index_every, store.max_segments)
+        self.series = [_Series(base + "0", _RAW_FORMAT, *args)]
+        for level in range(1, len(store.rollups) + 1):
+            self.series.append(_Series(base + str(level), _ROLLUP_FORMAT,
+                                       *args))
+        n = len(store.rollups)
+        # Open rollup intervals: start, minimum, maximum, sum, count
+        self.start = [-1] * n
+        self.min = [0.0] * n
+        self.max = [0.0] * n
+        self.sum = [0.0] * n
+        self.count = [0] * n
+
+
+class TimeSeriesStore:
+    """
+    Append-only store of channels with sparse indexes and rollups.
+    """
+
+    def __init__(self, root="/ts", rollups=(60, 3600), segment_records=4096,
+                 index_every=64, max_segments=8):
+        """
+        Open the store, creating the directory if needed.
+
+        :param root: Directory of the files.
+        :param rollups: Rollup intervals in seconds, ascending.
+        :param segment_records: Number of records of one segment.
+        :param index_every: Distance of the index entries in records.
+        :param max_segments: Number of segments kept per series; zero
+                             keeps all.
+        """
+        self.root = root
+        self.rollups = tuple(rollups)
+        self.segment_records = segment_records
+        self.index_every = index_every
+        self.max_segments = max_segments
+        self._channels = {}
+        try:
+            os.mkdir(root)
+        except OSError:
+            pass  # Already exists
+
+    def _channel(self, channel):
+        ch = self._channels.get(channel)
+        if ch is None:
+            ch = _Channel(self, channel)
+            self._channels[channel] = ch
+            self._reload(ch)
+        return ch
+
+    def _reload(self, ch):
+        """
+        Rebuild the open rollup intervals of a channel from the raw
+        samples, so a restart does not lose the partial minute or
+        hour. Samples older than the raw series are not included.
+        """
+        raw = ch.series[0]
+        if not raw.segments:
+            return
+        t_last = raw.last_time
+        buf = bytearray(512)
+        for i in range(len(self.rollups)):
+            start = t_last - t_last % self.rollups[i]
+            rollup = ch.series[i + 1]
+            if rollup.segments and rollup.last_time >= start:
+                continue  # Interval already stored
+            for (t, value) in raw.scan(start, t_last, buf):
+                if not ch.count[i]:
+                    ch.start[i] = start
+                    ch.min[i] = ch.max[i] = value
+                elif value < ch.min[i]:
+                    ch.min[i] = value
+                elif value > ch.max[i]:
+                    ch.max[i] = value
+                ch.sum[i] += value
+                ch.count[i] += 1
+
+    def append(self, channel, value, t=None):
+        """
+        Add one sample and update the rollups.
+
+        :param channel: Channel ID, a small integer.
+        :param value: Sample value, stored as a 32-bit float.
+        :param t: Time in seconds; the current time if omitted.
+        """
+        ch = self._channel(channel)
+        raw = ch.series[0]
+        if t is None:
+            t = int(time.time())
+        if t < raw.last_time:
+            t = raw.last_time  # Keep the series in time order
+        raw.append(t, value)
+        for i in range(len(self.rollups)):
+            start = t - t % self.rollups[i]
+            if start != ch.start[i]:
+                if ch.count[i]:
+                    ch.series[i + 1].append(ch.start[i], ch.min[i], ch.max[i],
+                                            ch.sum[i] / ch.count[i],
+                                            ch.count[i])
+                ch.start[i] = start
+                ch.min[i] = ch.max[i] = value
+                ch.sum[i] = 0.0
+                ch.count[i] = 0
+            elif value < ch.min[i]:
+                ch.min[i] = value
+            elif value > ch.max[i]:
+                ch.max[i] = value
+            ch.sum[i] += value
+            ch.count[i] += 1
+
+    def query(self, channel, t_start, t_end, step=0, buf=None):
+        """
+        Iterate over a time range of a channel. With `step`, samples
+        are merged into intervals of `step` seconds, read from the
+        coarsest rollup not longer than `step`.
+
+        :param channel: Channel ID.
+        :param t_start: First time in seconds, included.
+        :param t_end: Last time in seconds, included.
+        :param step: Interval in seconds; zero returns the raw samples.
+        :param buf: Read buffer; a new 512-byte buffer if omitted, so
+                    queries can be interleaved.
+        :returns: Iterator of (time, mean, minimum, maximum); the time
+                  of an interval is its start.
+        """
+        ch = self._channel(channel)
+        level = 0
+        for i in range(len(self.rollups)):
+            if step and self.rollups[i] <= step:
+                level = i + 1
+        if buf is None:
+            buf = bytearray(512)
+        records = ch.series[level].scan(t_start, t_end, buf)
+        if not step:
+            for (t, value) in records:
+                yield (t, value, value, value)
+            return
+
+        start = -1
+        for record in records:
+            t = record[0]
+            if level:
+                (r_min, r_max, r_mean, r_count) = record[1:]
+            else:
+                r_min = r_max = r_mean = record[1]
+                r_count = 1
+            if t - t % step != start:
+                if start >= 0:
+                    yield (start, total / count, i_min, i_max)
+                start = t - t % step
+                (i_min, i_max, total, count) = (r_min, r_max, 0.0, 0)
+            else:
+                i_min = min(i_min, r_min)
+                i_max = max(i_max, r_max)
+            total += r_mean * r_count
+            count += r_count
+        if start >= 0:
+            yield (start, total / count, i_min, i_max)
+
+    def flush(self):
+        """
+        Write the buffered records of all channels.
+        """
+        for ch in self._channels.values():
+            for series in ch.series:
+                series.flush()
@@ -31,6 +31,8 @@ modules to read latitude, longitude, and more.
              Tomas Fryza:
                 2025-02-25: Added _parse_gpgll, _parse_gpvtg
                 2025-02-25: Small modifs
+                2026-10-18: Talker-independent dispatch, GSA/GSV satellite
+                            table, PDOP/HDOP/VDOP
 
 Implementation Notes
 --------------------
@@ -47,6 +49,8 @@ Implementation Notes
 
 """
 
+import array
+
 # Internal helper parsing functions.
 # These handle input that might be none or null and return none instead of
 # throwing errors.
@@ -70,6 +74,49 @@ def _parse_float(nmea_data):
         return None
     return float(nmea_data.decode())
 
+def _field_end(buf, start):
+    # Index of the comma terminating a field starting at `start`
+    end = buf.find(b',', start)
+    return len(buf) if end == -1 else end
+
+def _int_at(buf, start, end):
+    # Parse an unsigned integer from buf[start:end] without slicing.
+    # Returns None for an empty or invalid field
+    if start >= end:
+        return None
+    val = 0
+    for i in range(start, end):
+        c = buf[i]
+        if c == 0x2e:  # Ignore decimal places, e.g. '12.0'
+            break
+        if c < 0x30 or c > 0x39:
+            return None
+        val = val * 10 + c - 0x30
+    return val
+
+# Constellations of the satellite table
+SYS_GPS = 0
+SYS_GLONASS = 1
+SYS_GALILEO = 2
+SYS_BEIDOU = 3
+SYS_QZSS = 4
+_CONSTELLATIONS = 5
+# Satellites in view per constellation; GSV carries up to 4 per message
+MAX_SATELLITES = 16
+
+# Talker ID to constellation
+_TALKERS = {
+    b'GP': SYS_GPS,
+    b'GL': SYS_GLONASS,
+    b'GA': SYS_GALILEO,
+    b'GB': SYS_BEIDOU,
+    b'BD': SYS_BEIDOU,
+    b'GQ': SYS_QZSS,
+}
+
+# NMEA 4.10 system ID of GSA/GSV to constellation
+_SYSTEM_IDS = (None, SYS_GPS, SYS_GLONASS, SYS_GALILEO, SYS_BEIDOU, SYS_QZSS)
+
 # lint warning about too many attributes disabled
 #pylint: disable-msg=R0902
 class GPS:
@@ -92,6 +139,23 @@ class GPS:
         # self.velocity_knots = None
         self.speed = None
         self.track_angle_deg = None
+        # Data from GSA, dilution of precision and fix type (1 to 3)
+        self.fix_type = None
+        self.pdop = None
+        self.hdop = None
+        self.vdop = None
+        # Satellite table from GSV, one block of MAX_SATELLITES entries
+        # per constellation; only the first `sats_in_view[c]` entries of
+        # block `c` are valid. SNR is 0 if the satellite is not tracked
+        size = _CONSTELLATIONS * MAX_SATELLITES
+        self.sat_prn = array.array('H', bytes(2 * size))
+        self.sat_azimuth = array.array('H', bytes(2 * size))
+        self.sat_elevation = bytearray(size)
+        self.sat_snr = bytearray(size)
+        self.sat_used = bytearray(size)  # Used in the solution (GSA)
+        self.sats_in_view = bytearray(_CONSTELLATIONS)
+        # Number of the next expected GSV message of each constellation
+        self._gsv_next = bytearray(_CONSTELLATIONS)
 
     def update(self):
         """Check for updated data from the GPS module and process it
@@ -105,15 +169,25 @@ class GPS:
             return False
         data_type, args = sentence
         data_type = data_type.upper()
-
-        if data_type == b'GPGGA':      # GGA, 3d location fix
+        if len(data_type) != 5:
+            return True
+
+        # Dispatch on the sentence type regardless of the talker
+        # (GP = GPS, GN = combined, GL = GLONASS, GA = Galileo, ...)
+        talker = data_type[:2]
+        sentence_type = data_type[2:]
+        if sentence_type == b'GGA':    # GGA, 3d location fix
             self._parse_gpgga(args)
-        elif data_type == b'GPRMC':    # RMC, minimum location info
+        elif sentence_type == b'RMC':  # RMC, minimum location info
             self._parse_gprmc(args)
-        elif data_type == b'GPGLL':    # GLL, geographic position
+        elif sentence_type == b'GLL':  # GLL, geographic position
             self._parse_gpgll(args)
-        elif data_type == b'GPVTG':    # VTG, track and ground speed
+        elif sentence_type == b'VTG':  # VTG, track and ground speed
             self._parse_gpvtg(args)
+        elif sentence_type == b'GSA':  # GSA, DOP and active satellites
+            self._parse_gsa(talker, args)
+        elif sentence_type == b'GSV':  # GSV, satellites in view
+            self._parse_gsv(talker, args)
         return True
 
     def send_command(self, command, add_checksum=True):
@@ -137,6 +211,36 @@ class GPS:
         """True if a current fix for location information is available."""
         return self.fix_quality is not None and self.fix_quality >= 1
 
+    def snr_stats(self, constellation=None, min_snr=1):
+        """Return SNR statistics of tracked satellites as a tuple
+        (count, mean, minimum, maximum) in dB-Hz, or count 0 and None
+        values if no satellite has SNR of at least `min_snr`.
+
+        :param constellation: One of SYS_GPS, SYS_GLONASS, SYS_GALILEO,
+                              SYS_BEIDOU, SYS_QZSS, or None for all of them.
+        :param min_snr: Satellites with lower SNR are not counted.
+        """
+        count = total = 0
+        lo = 255
+        hi = 0
+        first = 0 if constellation is None else constellation
+        last = _CONSTELLATIONS if constellation is None else constellation + 1
+        snr = self.sat_snr
+        for c in range(first, last):
+            base = c * MAX_SATELLITES
+            for i in range(base, base + self.sats_in_view[c]):
+                val = snr[i]
+                if val >= min_snr:
+                    count += 1
+                    total += val
+                    if val < lo:
+                        lo = val
+                    if val > hi:
+                        hi = val
+        if count == 0:
+            return (0, None, None, None)
+        return (count, total / count, lo, hi)
+
     def _parse_sentence(self):
         # Parse any NMEA sentence that is available.
         sentence = self._uart.readline()
@@ -308,3 +412,109 @@ class GPS:
         # Parse out speed and other simple numeric values
         self.track_angle_deg = _parse_float(data[0])
         self.speed = _parse_float(data[6]) # kilometers/hour
+
+    def _constellation(self, talker, system_id, prn):
+        # Constellation of a GSA/GSV sentence: from the talker, or for the
+        # combined `GN` talker from the NMEA 4.10 system ID or the
+        # satellite number range
+        c = _TALKERS.get(talker)
+        if c is not None:
+            return c
+        if system_id is not None and system_id < len(_SYSTEM_IDS) \
+           and _SYSTEM_IDS[system_id] is not None:
+            return _SYSTEM_IDS[system_id]
+        if prn is not None and 65 <= prn <= 96:
+            return SYS_GLONASS
+        return SYS_GPS
+
+    def _parse_gsa(self, talker, args):
+        # Parse the arguments (everything after data type) for NMEA GSA
+        # DOP and active satellites: mode, fix type, 12 satellite
+        # numbers, PDOP, HDOP, VDOP (and system ID in NMEA 4.10)
+        data = args.split(b',')
+        if len(data) < 17:
+            return  # Unexpected number of params
+
+        self.fix_type = _parse_int(data[1])
+        self.pdop = _parse_float(data[14])
+        self.hdop = _parse_float(data[15])
+        self.vdop = _parse_float(data[16])
+
+        # Mark the satellites used in the solution
+        system_id = _parse_int(data[17]) if len(data) > 17 else None
+        c = self._constellation(talker, system_id, _parse_int(data[2]))
+        base = c * MAX_SATELLITES
+        count = self.sats_in_view[c]
+        used = self.sat_used
+        for i in range(base, base + MAX_SATELLITES):
+            used[i] = 0
+        for k in range(2, 14):
+            prn = _parse_int(data[k])
+            if prn is None:
+                continue
+            for i in range(base, base + count):
+                if self.sat_prn[i] == prn:
+                    used[i] = 1
+                    break
+
+    def _parse_gsv(self, talker, args):
+        # Parse the arguments (everything after data type) for NMEA GSV
+        # satellites in view: number of messages, message number, number
+        # of satellites, then up to 4 blocks of PRN, elevation, azimuth
+        # and SNR. The fields are scanned in place and the satellites are
+        # written directly to the table, so no intermediate lists are built
+        end = _field_end(args, 0)
+        total = _int_at(args, 0, end)
+        start = end + 1
+        end = _field_end(args, start)
+        number = _int_at(args, start, end)
+        start = end + 1
+        end = _field_end(args, start)
+        in_view = _int_at(args, start, end)
+        if total is None or number is None or in_view is None:
+            return
+
+        # The constellation is known from the first satellite number
+        start = end + 1
+        prn = _int_at(args, start, _field_end(args, start))
+        c = self._constellation(talker, None, prn)
+
+        # Messages of a sequence must arrive in order, otherwise the
+        # sequence is dropped
+        if number == 1:
+            self._gsv_next[c] = 1
+        if self._gsv_next[c] != number:
+            self._gsv_next[c] = 0
+            return
+        self._gsv_next[c] = number + 1
+
+        base = c * MAX_SATELLITES
+        index = (number - 1) * 4
+        length = len(args)
+        while index < MAX_SATELLITES and start < length:
+            # PRN, elevation, azimuth and SNR of one satellite
+            end = _field_end(args, start)
+            prn = _int_at(args, start, end)
+            start = end + 1
+            end = _field_end(args, start)
+            elevation = _int_at(args, start, end)
+            start = end + 1
+            end = _field_end(args, start)
+            azimuth = _int_at(args, start, end)
+            start = end + 1
+            end = _field_end(args, start)
+            snr = _int_at(args, start, end)
+            start = end + 1
+            if prn is None:
+                break  # NMEA 4.10 signal ID or empty block
+            i = base + index
+            self.sat_prn[i] = prn
+            self.sat_elevation[i] = elevation or 0
+            self.sat_azimuth[i] = azimuth or 0
+            self.sat_snr[i] = snr or 0
+            index += 1
+
+        if number == total:
+            # Sequence complete, publish the new satellite count
+            self.sats_in_view[c] = min(in_view, index, MAX_SATELLITES)
+            self._gsv_next[c] = 0
@@ -0,0 +1,188 @@
+"""
+Benchmark of the NMEA parsers of this folder, run on a computer with
+CPython or the unix port of MicroPython:
+
+.. code-block:: bash
+
+    python bench_nmea.py [log_file] [baudrate] [loop_ms]
+    micropython bench_nmea.py
+
+Without a log file, 60 seconds of a 10 Hz receiver with 1 % corrupted
+and 1 % truncated sentences are generated by `nmea_replay`. For each
+parser the script reports:
+
+- sentences/s: accepted sentences per second of CPU time, all data
+  available at once;
+- alloc B/sent: heap bytes allocated per accepted sentence, measured
+  by `gc.mem_alloc` (MicroPython only);
+- dropped: sentences accepted from the complete log but lost when the
+  log is replayed in real time at the given baud rate through a 256-byte
+  receive buffer, with the main loop running every `loop_ms`;
+- exceptions: errors raised by the parser during the replay, e.g. for
+  a partial line returned by `readline` that has no checksum.
+
+Parsers:
+
+- `nmea_parser`: incremental parser `NmeaParser`;
+- `adafruit_gps`: `GPS.update` called while data is waiting;
+- `readline_split`: `str(uart.readline()).split(',')` with a 500 ms
+  sleep when no known sentence was read, as in the original
+  `gps_sentences.py` and `rtc-from-gps.py`.
+
+Author
+------
+Tomas Fryza
+
+Modification history
+--------------------
+- **2026-10-18** : File created, initial release.
+"""
+
+import sys
+import gc
+from nmea_replay import FakeUart, generate_log
+from nmea_parser import NmeaParser
+import adafruit_gps
+
+try:
+    from time import ticks_us, ticks_diff
+except ImportError:
+    # CPython
+    from time import perf_counter
+
+    def ticks_us():
+        return int(perf_counter() * 1_000_000)
+
+    def ticks_diff(a, b):
+        return a - b
+
+
+class NmeaParserBench:
+    name = "nmea_parser"
+
+    def __init__(self, uart):
+        self.gps = NmeaParser(uart)
+
+    def poll(self):
+        # Returns (accepted sentences, extra wait in us)
+        return (self.gps.update(), 0)
+
+
+class AdafruitBench:
+    name = "adafruit_gps"
+
+    def __init__(self, uart):
+        self.uart = uart
+        self.gps = adafruit_gps.GPS(uart)
+
+    def poll(self):
+        n = 0
+        while self.uart.any():
+            if self.gps.update():
+                n += 1
+        return (n, 0)
+
+
+class ReadlineSplitBench:
+    name = "readline_split"
+    # Sentence types and field counts accepted by the original code
+    known = {"b'$GPGGA": 15, "b'$GPRMC": 13, "b'$GPGLL": 8, "b'$GPVTG": 10,
+             "b'$GNGGA": 15, "b'$GNRMC": 13, "b'$GNGLL": 8, "b'$GNVTG": 10}
+
+    def __init__(self, uart):
+        self.uart = uart
+
+    def poll(self):
+        data = str(self.uart.readline()).split(',')
+        if self.known.get(data[0]) == len(data):
+            return (1, 0)
+        return (0, 500_000)
+
+
+PARSERS = (NmeaParserBench, AdafruitBench, ReadlineSplitBench)
+
+
+def run_throughput(parser_class, log):
+    """
+    Parse the whole log available at once and return (accepted
+    sentences, CPU time in us).
+    """
+    uart = FakeUart(log, baudrate=1_000_000_000, rxbuf=len(log))
+    uart.advance(1_000_000)
+    parser = parser_class(uart)
+    accepted = 0
+    start = ticks_us()
+    while not uart.done():
+        accepted += parser.poll()[0]
+    return (accepted, ticks_diff(ticks_us(), start))
+
+
+def run_allocations(parser_class, log):
+    """
+    Return heap bytes allocated while parsing the whole log, or `None`
+    if the interpreter cannot tell.
+    """
+    if not hasattr(gc, "mem_alloc"):
+        return None
+    uart = FakeUart(log, baudrate=1_000_000_000, rxbuf=len(log))
+    uart.advance(1_000_000)
+    parser = parser_class(uart)
+    total = 0
+    while not uart.done():
+        # Collect outside of the measured part, so that the garbage
+        # collector does not run during `poll`
+        gc.collect()
+        before = gc.mem_alloc()
+        parser.poll()
+        total += gc.mem_alloc() - before
+    return total
+
+
+def run_replay(parser_class, log, baudrate, loop_us):
+    """
+    Replay the log in real time and return (accepted sentences,
+    dropped bytes, exceptions).
+    """
+    uart = FakeUart(log, baudrate=baudrate)
+    parser = parser_class(uart)
+    accepted = 0
+    errors = 0
+    while not uart.done():
+        try:
+            (n, wait) = parser.poll()
+        except (ValueError, TypeError, IndexError):
+            (n, wait) = (0, 0)
+            errors += 1
+        accepted += n
+        uart.advance(loop_us + wait)
+    return (accepted, uart.dropped, errors)
+
+
+def main(argv):
+    if len(argv) > 1:
+        with open(argv[1], "rb") as f:
+            log = f.read()
+    else:
+        log = generate_log(seconds=60, rate_hz=10, corrupt=0.01, truncate=0.01)
+    baudrate = int(argv[2]) if len(argv) > 2 else 115_200
+    loop_us = int(argv[3]) * 1000 if len(argv) > 3 else 20_000
+
+    print(f"Log: {len(log)} bytes, {log.count(b'$')} sentences, "
+          f"{baudrate} Bd, loop {loop_us // 1000} ms")
+    print(f"{'parser':16}{'sentences/s':>12}{'alloc B/sent':>14}"
+          f"{'accepted':>10}{'dropped':>9}{'lost B':>9}{'exceptions':>12}")
+    for parser_class in PARSERS:
+        (accepted, cpu_us) = run_throughput(parser_class, log)
+        rate = accepted * 1_000_000 // cpu_us if cpu_us else 0
+        alloc = run_allocations(parser_class, log)
+        if alloc is None or not accepted:
+            alloc = "-"
+        else:
+            alloc = f"{alloc / accepted:.0f}"
+        (replayed, lost, errors) = run_replay(parser_class, log, baudrate, loop_us)
+        print(f"{parser_class.name:16}{rate:12}{alloc:>14}"
+              f"{accepted:10}{accepted - replayed:9}{lost:9}{errors:12}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
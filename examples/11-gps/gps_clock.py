@@ -0,0 +1,227 @@
+"""
+This module disciplines the internal RTC by a GNSS receiver. The rising
+edge of the PPS (pulse per second) output is timestamped by `ticks_us`
+in an interrupt and paired with the UTC second reported by the next
+RMC or ZDA sentence. The RTC is then set to the time of the edge plus
+the time elapsed since it, so the UART latency and the parsing delay
+do not matter.
+
+Each synchronization also measures how far the RTC drifted since the
+previous one. The frequency error is averaged over a sliding window of
+the last synchronizations and `correct` applies it between them, so
+the receiver can be powered down while the RTC stays aligned.
+
+Example
+-------
+.. code-block:: python
+
+    from machine import UART
+    import time
+    from nmea_parser import NmeaParser
+    from gps_clock import GpsClock
+
+    gps = NmeaParser(UART(2, baudrate=9600))
+    clock = GpsClock(gps, pps_pin=4)
+
+    while not clock.synced:
+        gps.update()
+        time.sleep_ms(50)
+    print(f"Offset {clock.offset_us} us, drift {clock.ppm:.2f} ppm")
+
+    # Later, with the receiver powered down
+    clock.correct()
+    seconds, micros = clock.now()
+
+Author
+------
+Tomas Fryza
+
+Modification history
+--------------------
+- **2026-10-18** : PPS edge stamped by a hard IRQ.
+- **2026-10-18** : File created, initial release.
+"""
+
+from machine import Pin, RTC
+import time
+import array
+
+
+class GpsClock:
+    """
+    RTC disciplined by GPS time and PPS edges.
+    """
+
+    def __init__(self, parser, pps_pin, rtc=None, window=8, max_age_ms=900):
+        """
+        Attach the clock to a NMEA parser and the PPS input.
+
+        :param parser: `NmeaParser` object receiving the NMEA sentences.
+        :param pps_pin: Pin number or `Pin` object of the PPS signal.
+        :param rtc: RTC to be disciplined; the internal one if `None`.
+        :param window: Number of synchronizations used for the drift
+                       estimate.
+        :param max_age_ms: Longest time between the PPS edge and the
+                           sentence reporting its second.
+
+        .. note::
+            The parser should be updated at least every few hundred
+            milliseconds, otherwise a sentence could be paired with the
+            edge of the following second.
+        """
+        self.parser = parser
+        self.rtc = rtc if rtc is not None else RTC()
+        self._max_age_us = max_age_ms * 1000
+
+        # Written by the interrupt handler only
+        self._pps_us = 0
+        self._pps_count = 0
+        self._pps_used = 0
+
+        # Sliding window of (interval in seconds, raw drift in us)
+        self._intervals = array.array('i', bytes(4 * window))
+        self._drifts = array.array('i', bytes(4 * window))
+        self._index = 0
+        self._samples = 0
+
+        self.synced = False
+        self.syncs = 0  # Number of synchronizations
+        self.offset_us = 0  # RTC error found by the last one
+        self.ppm = 0.0  # Estimated RTC frequency error, + = fast
+        self._sync_s = 0  # UTC of the last synchronization
+        self._corrected_us = 0  # Corrections applied since then
+
+        if isinstance(pps_pin, int):
+            pps_pin = Pin(pps_pin, Pin.IN)
+        self._pps = pps_pin
+        try:
+            # Hard IRQ, so the edge is stamped at once, not when the
+            # scheduler runs the handler
+            self._pps.irq(handler=self._on_pps, trigger=Pin.IRQ_RISING,
+                          hard=True)
+        except TypeError:
+            self._pps.irq(handler=self._on_pps, trigger=Pin.IRQ_RISING)
+        parser.on_time = self._on_time
+
+    def _on_pps(self, pin):
+        """
+        Hard interrupt handler of the PPS edge. It only stores a
+        timestamp, so it does not allocate memory.
+        """
+        self._pps_us = time.ticks_us()
+        self._pps_count += 1
+
+    def _read_rtc(self):
+        """
+        Return the RTC time as a tuple (seconds since epoch, microseconds).
+        """
+        dt = self.rtc.datetime()
+        seconds = time.mktime((dt[0], dt[1], dt[2], dt[4], dt[5], dt[6], 0, 0))
+        return (seconds, dt[7])
+
+    def _write_rtc(self, seconds, micros):
+        """
+        Set the RTC to a time given in seconds since epoch and
+        microseconds, which can be out of the range 0 to 999999.
+        """
+        seconds += micros // 1_000_000
+        micros %= 1_000_000
+        t = time.gmtime(seconds)
+        self.rtc.datetime((t[0], t[1], t[2], t[6], t[3], t[4], t[5], micros))
+
+    def _on_time(self, parser):
+        """
+        Pair a valid UTC second from the parser with the last PPS edge
+        and set the RTC.
+        """
+        fix = parser.fix
+        # The PPS edge marks the start of the second reported in the
+        # following sentences; use each edge once
+        if fix.millis != 0 or self._pps_count == self._pps_used:
+            return
+        (rtc_s, rtc_us) = self._read_rtc()
+        age = time.ticks_diff(time.ticks_us(), self._pps_us)
+        if age < 0 or age > self._max_age_us:
+            return
+        self._pps_used = self._pps_count
+        utc_s = time.mktime((fix.year, fix.month, fix.day,
+                             fix.hours, fix.minutes, fix.seconds, 0, 0))
+
+        # RTC error at the PPS edge, + = RTC ahead; measured only when
+        # it fits in a small integer
+        diff_s = rtc_s - utc_s
+        if self.synced and -100 < diff_s < 100:
+            self.offset_us = diff_s * 1_000_000 + rtc_us - age
+            interval = utc_s - self._sync_s
+            if interval > 0:
+                # Drift of the uncorrected clock since the last sync
+                self._add_sample(interval, self.offset_us + self._corrected_us)
+
+        # UTC now is the second of the edge plus the time since it
+        self._write_rtc(utc_s, time.ticks_diff(time.ticks_us(), self._pps_us))
+        self._sync_s = utc_s
+        self._corrected_us = 0
+        self.synced = True
+        self.syncs += 1
+
+    def _add_sample(self, interval, drift_us):
+        """
+        Store one drift measurement and update the frequency estimate.
+        """
+        n = len(self._intervals)
+        self._intervals[self._index] = interval
+        self._drifts[self._index] = drift_us
+        self._index = (self._index + 1) % n
+        if self._samples < n:
+            self._samples += 1
+        total_s = 0
+        total_us = 0
+        for i in range(self._samples):
+            total_s += self._intervals[i]
+            total_us += self._drifts[i]
+        # Microseconds per second equal parts per million
+        self.ppm = total_us / total_s
+
+    def correct(self, min_step_us=100):
+        """
+        Adjust the RTC by the drift predicted since the last
+        synchronization. Call it periodically while the receiver is
+        off; small corrections are postponed.
+
+        :param min_step_us: Smallest correction applied to the RTC.
+        :returns: Applied correction in microseconds.
+        """
+        if not self.synced or self._samples == 0:
+            return 0
+        start = time.ticks_us()
+        (rtc_s, rtc_us) = self._read_rtc()
+        predicted = int(self.ppm * (rtc_s - self._sync_s))
+        delta = predicted - self._corrected_us
+        if -min_step_us < delta < min_step_us:
+            return 0
+        self._write_rtc(rtc_s, rtc_us + time.ticks_diff(time.ticks_us(), start) - delta)
+        self._corrected_us += delta
+        return delta
+
+    def now(self):
+        """
+        Return the current UTC time including the drift correction
+        not yet applied to the RTC.
+
+        :returns: Tuple (seconds since epoch, microseconds).
+        """
+        (rtc_s, rtc_us) = self._read_rtc()
+        if self._samples:
+            rtc_us -= int(self.ppm * (rtc_s - self._sync_s)) - self._corrected_us
+            rtc_s += rtc_us // 1_000_000
+            rtc_us %= 1_000_000
+        return (rtc_s, rtc_us)
+
+    def age(self):
+        """
+        Return seconds since the last synchronization, or `None` if
+        the clock has not been synchronized yet.
+        """
+        if not self.synced:
+            return None
+        return self._read_rtc()[0] - self._sync_s
@@ -0,0 +1,518 @@
+"""
+This module provides an incremental parser of NMEA 0183 sentences from
+GNSS receivers. Received bytes are read by `UART.readinto` into a ring
+buffer and processed by a byte-oriented state machine, so `update`
+never blocks and can be called as often as needed, e.g. from the main
+loop or an `asyncio` task.
+
+Checksums are computed while the bytes arrive, so no sentence is
+sliced or split. Sentences are dispatched by their three-letter type
+regardless of the talker (`GP`, `GN`, `GL`, `GA`, ...). The latest
+position is kept in a preallocated `GpsFix` record with integer
+fixed-point values.
+
+Example
+-------
+.. code-block:: python
+
+    from machine import UART
+    from nmea_parser import NmeaParser
+
+    uart = UART(2, baudrate=9600)  # tx=17, rx=16
+    gps = NmeaParser(uart)
+
+    while True:
+        if gps.update() and gps.fix.valid:
+            print(gps.fix.latitude, gps.fix.longitude)
+
+Author
+------
+Tomas Fryza
+
+Modification history
+--------------------
+- **2026-10-18** : Added ZDA sentence and `on_time` callback.
+- **2026-10-18** : File created, initial release.
+"""
+
+try:
+    from micropython import const
+except ImportError:
+    # Host Python, e.g. the replay benchmark `bench_nmea.py`
+    def const(x):
+        return x
+
+# Number of fields of one sentence, including the sentence type
+_MAX_FIELDS = const(32)
+# Longest sentence body between `$` and `*`
+_MAX_LINE = const(96)
+
+# States of the receiver
+_WAIT = const(0)  # Waiting for `$`
+_BODY = const(1)  # Sentence body, checksum being computed
+_CS_HI = const(2)  # First checksum digit
+_CS_LO = const(3)  # Second checksum digit
+
+
+def sentence_id(name):
+    """
+    Return the integer key of a sentence type used by `NmeaParser`.
+
+    :param name: Three-letter sentence type, such as `b"GGA"`.
+    :returns: Key of the sentence type.
+    """
+    return (name[0] << 16) | (name[1] << 8) | name[2]
+
+
+GGA = sentence_id(b"GGA")
+RMC = sentence_id(b"RMC")
+GLL = sentence_id(b"GLL")
+VTG = sentence_id(b"VTG")
+ZDA = sentence_id(b"ZDA")
+
+
+def _hex_digit(c):
+    """
+    Return the value of a hexadecimal digit, or -1 if `c` is not one.
+    """
+    if 0x30 <= c <= 0x39:
+        return c - 0x30
+    if 0x41 <= c <= 0x46:
+        return c - 0x37
+    if 0x61 <= c <= 0x66:
+        return c - 0x57
+    return -1
+
+
+class GpsFix:
+    """
+    Latest navigation data. All values are integers updated in place,
+    so reading a sentence does not allocate new objects.
+    """
+
+    def __init__(self):
+        self.year = 0
+        self.month = 0
+        self.day = 0
+        self.hours = 0
+        self.minutes = 0
+        self.seconds = 0
+        self.millis = 0
+        self.latitude_ud = 0  # Micro-degrees, north positive
+        self.longitude_ud = 0  # Micro-degrees, east positive
+        self.altitude_cm = 0  # Above mean sea level
+        self.speed_cms = 0  # Speed over ground in cm/s
+        self.course_cdeg = 0  # Course over ground in 0.01 deg
+        self.quality = 0  # GGA fix quality, 0 = no fix
+        self.satellites = 0
+        self.hdop_c = 0  # Horizontal dilution of precision x100
+        self.valid = False  # Status `A` of RMC or GLL
+        self.updates = 0  # Number of processed position sentences
+
+    @property
+    def latitude(self):
+        """Latitude in degrees as a float."""
+        return self.latitude_ud / 1_000_000
+
+    @property
+    def longitude(self):
+        """Longitude in degrees as a float."""
+        return self.longitude_ud / 1_000_000
+
+    @property
+    def speed_kmh(self):
+        """Speed over ground in km/h as a float."""
+        return self.speed_cms * 0.036
+
+
+class NmeaParser:
+    """
+    Incremental NMEA 0183 parser.
+
+    Handlers of other sentence types can be added by `register`. Inside
+    a handler, fields of the current sentence are read by `field_int`,
+    `field_char` and `field_degrees`; field 0 is the sentence type.
+    """
+
+    def __init__(self, uart=None, buf_size=512):
+        """
+        Initialize the parser and allocate its buffers.
+
+        :param uart: UART connected to the receiver; can be `None` if
+                     data is passed by `feed`.
+        :param buf_size: Size of the ring buffer, rounded up to a power
+                         of two. It should hold data received between
+                         two `update` calls.
+        """
+        self.uart = uart
+        size = 64
+        while size < buf_size:
+            size <<= 1
+        self._ring = bytearray(size)
+        self._ring_mv = memoryview(self._ring)
+        self._mask = size - 1
+        self._head = 0
+        self._tail = 0
+
+        # Sentence being received, without `$` and checksum
+        self._line = bytearray(_MAX_LINE)
+        self._len = 0
+        self._commas = bytearray(_MAX_FIELDS)
+        self._nfields = 0
+        self._state = _WAIT
+        self._cs = 0
+        self._rx_cs = 0
+        self._fs = 0  # Span of the field found by `_locate`
+        self._fe = 0
+
+        self.fix = GpsFix()
+        self.talker = 0  # Two talker letters of the last sentence
+        self.sentences = 0  # Valid sentences
+        self.errors = 0  # Checksum errors and malformed sentences
+
+        self._handlers = {
+            GGA: self._parse_gga,
+            RMC: self._parse_rmc,
+            GLL: self._parse_gll,
+            VTG: self._parse_vtg,
+            ZDA: self._parse_zda,
+        }
+        # Called as `on_time(parser)` after RMC or ZDA with valid UTC
+        # date and time, e.g. to pair it with a PPS edge
+        self.on_time = None
+
+    def register(self, name, handler):
+        """
+        Call `handler(parser)` for each valid sentence of a given type.
+
+        :param name: Three-letter sentence type, such as `b"ZDA"`.
+        :param handler: Function called with the parser as an argument,
+                        or `None` to remove the handler.
+        """
+        key = sentence_id(name)
+        if handler is None:
+            self._handlers.pop(key, None)
+        else:
+            self._handlers[key] = handler
+
+    def update(self):
+        """
+        Read all bytes waiting in the UART and process them. The call
+        does not wait for new data.
+
+        :returns: Number of valid sentences processed.
+        """
+        count = self.sentences
+        uart = self.uart
+        while uart.any():
+            if not self._fill():
+                # Ring is full, make room and read again
+                self._drain()
+                if not self._fill():
+                    break
+        self._drain()
+        return self.sentences - count
+
+    def feed(self, data):
+        """
+        Process bytes received by other means than the UART, e.g.
+        recorded NMEA logs.
+
+        :param data: Bytes to be processed.
+        :returns: Number of valid sentences processed.
+        """
+        count = self.sentences
+        (ring, mask) = (self._ring, self._mask)
+        head = self._head
+        for c in data:
+            nxt = (head + 1) & mask
+            if nxt == self._tail:
+                self._head = head
+                self._drain()
+            ring[head] = c
+            head = nxt
+        self._head = head
+        self._drain()
+        return self.sentences - count
+
+    def _fill(self):
+        """
+        Read one contiguous block from the UART into the free space
+        of the ring.
+
+        :returns: Number of bytes read, 0 if the ring is full.
+        """
+        (head, tail) = (self._head, self._tail)
+        if head >= tail:
+            # Up to the end of the ring; one byte stays free when the
+            # data starts at index 0
+            end = len(self._ring) if tail else len(self._ring) - 1
+        else:
+            end = tail - 1
+        if end <= head:
+            return 0
+        # Never ask for more than is waiting, so the UART timeout
+        # does not apply
+        n = min(end - head, self.uart.any())
+        n = self.uart.readinto(self._ring_mv[head:head + n], n)
+        if not n:
+            return 0
+        self._head = (head + n) & self._mask
+        return n
+
+    def _drain(self):
+        """
+        Run the receiver state machine over the bytes in the ring.
+        """
+        (ring, mask, line, commas) = (self._ring, self._mask, self._line, self._commas)
+        (tail, head) = (self._tail, self._head)
+        (state, n, nf, cs) = (self._state, self._len, self._nfields, self._cs)
+        while tail != head:
+            c = ring[tail]
+            tail = (tail + 1) & mask
+            if c == 0x24:  # `$` starts a new sentence in any state
+                if state != _WAIT:
+                    self.errors += 1
+                (state, n, nf, cs) = (_BODY, 0, 0, 0)
+            elif state == _BODY:
+                if c == 0x2a:  # `*`
+                    state = _CS_HI
+                elif c < 0x20 or n >= _MAX_LINE:
+                    self.errors += 1
+                    state = _WAIT
+                else:
+                    cs ^= c
+                    if c == 0x2c:  # `,`
+                        if nf >= _MAX_FIELDS:
+                            self.errors += 1
+                            state = _WAIT
+                            continue
+                        commas[nf] = n
+                        nf += 1
+                    line[n] = c
+                    n += 1
+            elif state == _CS_HI:
+                d = _hex_digit(c)
+                if d < 0:
+                    self.errors += 1
+                    state = _WAIT
+                else:
+                    self._rx_cs = d << 4
+                    state = _CS_LO
+            elif state == _CS_LO:
+                state = _WAIT
+                d = _hex_digit(c)
+                if d < 0 or (self._rx_cs | d) != cs:
+                    self.errors += 1
+                else:
+                    (self._len, self._nfields) = (n, nf)
+                    self._dispatch()
+        self._tail = tail
+        (self._state, self._len, self._nfields, self._cs) = (state, n, nf, cs)
+
+    def _dispatch(self):
+        """
+        Call the handler of a sentence with a valid checksum.
+        """
+        line = self._line
+        self.sentences += 1
+        # Standard sentences have a 2-letter talker and 3-letter type;
+        # proprietary ones start with `P`
+        if self._nfields == 0 or self._commas[0] != 5 or line[0] == 0x50:
+            return
+        self.talker = (line[0] << 8) | line[1]
+        handler = self._handlers.get((line[2] << 16) | (line[3] << 8) | line[4])
+        if handler is not None:
+            handler(self)
+
+    def field_count(self):
+        """
+        Return the number of fields of the current sentence, including
+        the sentence type.
+        """
+        return self._nfields + 1
+
+    def _locate(self, i):
+        """
+        Find field `i` of the current sentence and store its span.
+
+        :returns: `True` if the field exists and is not empty.
+        """
+        nf = self._nfields
+        if i > nf:
+            return False
+        self._fs = 0 if i == 0 else self._commas[i - 1] + 1
+        self._fe = self._commas[i] if i < nf else self._len
+        return self._fe > self._fs
+
+    def field_char(self, i):
+        """
+        Return the first character of field `i` as an integer, or 0 if
+        the field is empty.
+        """
+        if not self._locate(i):
+            return 0
+        return self._line[self._fs]
+
+    def field_int(self, i, decimals=0, default=None):
+        """
+        Parse a decimal number of field `i` into a fixed-point integer.
+        Surplus decimal places are truncated.
+
+        :param i: Field index.
+        :param decimals: Number of decimal places of the result, e.g.
+                         `"1.5"` gives 150 for `decimals=2`.
+        :param default: Value returned for an empty or invalid field.
+        """
+        if not self._locate(i):
+            return default
+        line = self._line
+        (pos, end) = (self._fs, self._fe)
+        neg = line[pos] == 0x2d  # `-`
+        if neg:
+            pos += 1
+        val = 0
+        frac = -1  # Decimal places read so far, -1 before the point
+        while pos < end:
+            c = line[pos]
+            pos += 1
+            if c == 0x2e:  # `.`
+                if frac >= 0:
+                    return default
+                frac = 0
+            elif 0x30 <= c <= 0x39:
+                if frac < 0:
+                    val = val * 10 + c - 0x30
+                elif frac < decimals:
+                    val = val * 10 + c - 0x30
+                    frac += 1
+            else:
+                return default
+        if frac < 0:
+            frac = 0
+        while frac < decimals:
+            val *= 10
+            frac += 1
+        return -val if neg else val
+
+    def field_degrees(self, i):
+        """
+        Parse a coordinate in `(d)ddmm.mmmmm` format from field `i` and
+        hemisphere letter from field `i + 1`.
+
+        :returns: Signed value in micro-degrees, or `None` if empty.
+        """
+        # Integer part and 5 decimal places of minutes are parsed
+        # apart; `dddmm.mmmmm` as one number exceeds a small integer
+        ip = self.field_int(i)
+        if ip is None:
+            return None
+        line = self._line
+        (pos, end) = (self._fs, self._fe)
+        while pos < end and line[pos] != 0x2e:  # `.`
+            pos += 1
+        pos += 1
+        (frac, n) = (0, 0)
+        while pos < end and n < 5 and 0x30 <= line[pos] <= 0x39:
+            frac = frac * 10 + line[pos] - 0x30
+            pos += 1
+            n += 1
+        while n < 5:
+            frac *= 10
+            n += 1
+        (deg, mins) = (ip // 100, ip % 100)
+        ud = deg * 1_000_000 + (mins * 100_000 + frac + 3) // 6
+        hemi = self.field_char(i + 1)
+        if hemi == 0x53 or hemi == 0x57:  # `S` or `W`
+            ud = -ud
+        return ud
+
+    def _parse_time(self, i):
+        """
+        Parse UTC time `hhmmss.sss` of field `i` into the fix record.
+        """
+        val = self.field_int(i, 3)
+        if val is None:
+            return
+        fix = self.fix
+        fix.millis = val % 1000
+        val //= 1000
+        fix.seconds = val % 100
+        fix.minutes = (val // 100) % 100
+        fix.hours = val // 10000
+
+    def _parse_position(self, i):
+        """
+        Parse latitude and longitude starting at field `i`.
+        """
+        lat = self.field_degrees(i)
+        lon = self.field_degrees(i + 2)
+        if lat is not None and lon is not None:
+            self.fix.latitude_ud = lat
+            self.fix.longitude_ud = lon
+
+    def _parse_gga(self, parser):
+        # Time, position and fix quality
+        fix = self.fix
+        self._parse_time(1)
+        self._parse_position(2)
+        fix.quality = self.field_int(6, 0, 0)
+        fix.satellites = self.field_int(7, 0, 0)
+        fix.hdop_c = self.field_int(8, 2, 0)
+        alt = self.field_int(9, 2)
+        if alt is not None:
+            fix.altitude_cm = alt
+        fix.updates += 1
+
+    def _parse_rmc(self, parser):
+        # Recommended minimum data: time, date, position and speed
+        fix = self.fix
+        self._parse_time(1)
+        fix.valid = self.field_char(2) == 0x41  # `A`
+        self._parse_position(3)
+        knots = self.field_int(7, 2)
+        if knots is not None:
+            fix.speed_cms = knots * 463 // 900  # 1 kn = 463/9 cm/s
+        course = self.field_int(8, 2)
+        if course is not None:
+            fix.course_cdeg = course
+        date = self.field_int(9, 0)
+        if date is not None:
+            fix.day = date // 10000
+            fix.month = (date // 100) % 100
+            fix.year = 2000 + date % 100
+        fix.updates += 1
+        if fix.valid and date is not None and self.on_time is not None:
+            self.on_time(self)
+
+    def _parse_gll(self, parser):
+        # Geographic position with time
+        self._parse_position(1)
+        self._parse_time(5)
+        self.fix.valid = self.field_char(6) == 0x41  # `A`
+        self.fix.updates += 1
+
+    def _parse_vtg(self, parser):
+        # Course and speed over ground
+        fix = self.fix
+        course = self.field_int(1, 2)
+        if course is not None:
+            fix.course_cdeg = course
+        kmh = self.field_int(7, 2)
+        if kmh is not None:
+            fix.speed_cms = kmh * 5 // 18  # km/h x100 to cm/s
+
+    def _parse_zda(self, parser):
+        # UTC time and full date; fields are empty until the receiver
+        # knows the time
+        day = self.field_int(2)
+        month = self.field_int(3)
+        year = self.field_int(4)
+        if self.field_int(1) is None or day is None or month is None \
+                or year is None:
+            return
+        fix = self.fix
+        self._parse_time(1)
+        (fix.day, fix.month, fix.year) = (day, month, year)
+        if self.on_time is not None:
+            self.on_time(self)
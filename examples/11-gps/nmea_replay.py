@@ -0,0 +1,225 @@
+"""
+This module replays NMEA logs through a fake UART, so the GPS parsers
+of this folder can be run on a computer, either in CPython or in the
+unix port of MicroPython, without a receiver.
+
+`FakeUart` delivers bytes at the speed of a given baud rate on a
+virtual clock and drops bytes that do not fit in its receive buffer,
+like the hardware UART when the application reads it too late.
+`generate_log` creates a synthetic log of a receiver at a given update
+rate, optionally with corrupted checksums and truncated lines.
+
+Example
+-------
+.. code-block:: python
+
+    from nmea_replay import FakeUart, generate_log
+    from nmea_parser import NmeaParser
+
+    uart = FakeUart(generate_log(seconds=10, rate_hz=10), baudrate=115200)
+    gps = NmeaParser(uart)
+    while not uart.done():
+        uart.advance(20_000)  # 20 ms of other work
+        gps.update()
+    print(gps.sentences, uart.dropped)
+
+Author
+------
+Tomas Fryza
+
+Modification history
+--------------------
+- **2026-10-18** : File created, initial release.
+"""
+
+import random
+
+
+def _checksum(body):
+    """
+    Return the XOR checksum of a sentence body between `$` and `*`.
+    """
+    cs = 0
+    for c in body:
+        cs ^= c
+    return cs
+
+
+def sentence(body):
+    """
+    Complete a sentence body with `$`, checksum and line end.
+
+    :param body: Sentence without `$` and checksum, such as `b"GPGGA,..."`.
+    :returns: Sentence as bytes.
+    """
+    return b"$" + body + b"*%02X\r\n" % _checksum(body)
+
+
+def generate_log(seconds=60, rate_hz=1, talker=b"GN", corrupt=0.0,
+                 truncate=0.0, seed=1):
+    """
+    Create a synthetic NMEA log of a moving receiver. Each epoch
+    contains GGA, GSA, three GSV, RMC, VTG and GLL sentences.
+
+    :param seconds: Length of the log.
+    :param rate_hz: Number of epochs per second.
+    :param talker: Talker of the position sentences.
+    :param corrupt: Probability that a sentence has a wrong checksum.
+    :param truncate: Probability that a sentence is cut in the middle.
+    :param seed: Seed of the random generator.
+    :returns: Log as bytes.
+    """
+    random.seed(seed)
+    lines = []
+    lat = 4913.51040
+    lon = 1634.55030
+    for epoch in range(seconds * rate_hz):
+        ms = epoch * 1000 // rate_hz
+        t = ms // 1000
+        hhmmss = b"%02d%02d%02d.%02d" % ((t // 3600) % 24, (t // 60) % 60,
+                                         t % 60, (ms % 1000) // 10)
+        lat += 0.00013
+        lon += 0.00021
+        pos = b"%010.5f,N,%011.5f,E" % (lat, lon)
+        bodies = [
+            talker + b"GGA," + hhmmss + b"," + pos + b",1,09,0.92,237.4,M,43.9,M,,",
+            talker + b"GSA,A,3,05,13,15,18,20,24,29,,,,,,1.61,0.92,1.32",
+            b"GPGSV,3,1,10,05,41,072,44,13,36,295,41,15,62,225,45,18,21,102,38",
+            b"GPGSV,3,2,10,20,44,132,47,24,10,047,31,29,34,156,42,30,05,320,",
+            b"GPGSV,3,3,10,36,32,153,40,49,35,185,39",
+            talker + b"RMC," + hhmmss + b",A," + pos + b",1.52,45.10,180326,,,A",
+            talker + b"VTG,45.10,T,,M,1.52,N,2.82,K,A",
+            talker + b"GLL," + pos + b"," + hhmmss + b",A,A",
+        ]
+        for body in bodies:
+            line = sentence(body)
+            if corrupt and random.random() < corrupt:
+                # Change one character of the body, keep the length
+                i = 1 + int(random.random() * (len(body) - 1))
+                line = line[:i] + (b"0" if line[i] != 0x30 else b"1") + line[i + 1:]
+            if truncate and random.random() < truncate:
+                line = line[:len(line) // 2]
+            lines.append(line)
+    return b"".join(lines)
+
+
+class FakeUart:
+    """
+    UART replaying a log at the speed of a given baud rate. Time runs
+    only when `advance` is called, so the results do not depend on the
+    speed of the host computer.
+    """
+
+    def __init__(self, data, baudrate=9600, rxbuf=256, timeout=0):
+        """
+        :param data: Bytes to be received.
+        :param baudrate: Baud rate; one byte takes 10 bit periods (8N1).
+        :param rxbuf: Size of the receive buffer in bytes.
+        :param timeout: Time in ms `readline` waits for a line end.
+        """
+        self._data = data
+        self._pos = 0  # Next byte of the log to arrive
+        # Receive buffer as a ring, so reading it does not allocate
+        self._ring = bytearray(rxbuf)
+        self._head = 0  # First unread byte
+        self._count = 0  # Unread bytes
+        self.baudrate = baudrate
+        self.rxbuf = rxbuf
+        self.timeout = timeout
+        self.time_us = 0  # Virtual time
+        self.received = 0  # Bytes put in the receive buffer
+        self.dropped = 0  # Bytes lost because the buffer was full
+
+    def advance(self, us):
+        """
+        Let `us` microseconds of virtual time pass.
+        """
+        self.time_us += us
+        self._receive()
+
+    def done(self):
+        """
+        Return `True` when the whole log was received and read.
+        """
+        return self._pos >= len(self._data) and not self._count
+
+    def _receive(self):
+        """
+        Move the bytes that arrived until the current time into the
+        receive buffer; bytes arriving to a full buffer are lost.
+        """
+        target = self.time_us * self.baudrate // 10_000_000
+        if target > len(self._data):
+            target = len(self._data)
+        (ring, size, data) = (self._ring, self.rxbuf, self._data)
+        while self._pos < target:
+            if self._count < size:
+                ring[(self._head + self._count) % size] = data[self._pos]
+                self._count += 1
+                self.received += 1
+            else:
+                self.dropped += 1
+            self._pos += 1
+
+    def _pop(self):
+        """
+        Remove and return the oldest byte of the receive buffer.
+        """
+        c = self._ring[self._head]
+        self._head = (self._head + 1) % self.rxbuf
+        self._count -= 1
+        return c
+
+    def any(self):
+        self._receive()
+        return self._count
+
+    def read(self, nbytes=None):
+        self._receive()
+        if not self._count:
+            return None
+        if nbytes is None or nbytes > self._count:
+            nbytes = self._count
+        buf = bytearray(nbytes)
+        self.readinto(buf)
+        return bytes(buf)
+
+    def readinto(self, buf, nbytes=None):
+        self._receive()
+        if not self._count:
+            return None
+        n = len(buf) if nbytes is None else nbytes
+        if n > self._count:
+            n = self._count
+        for i in range(n):
+            buf[i] = self._pop()
+        return n
+
+    def readline(self):
+        """
+        Return bytes up to and including a line end. Like the real UART,
+        a partial line is returned if none arrives within `timeout`.
+        """
+        self._receive()
+        waited = 0
+        while True:
+            n = 0
+            while n < self._count:
+                if self._ring[(self._head + n) % self.rxbuf] == 0x0a:
+                    break
+                n += 1
+            if n < self._count:
+                n += 1  # Include the line end
+                break
+            if waited >= self.timeout * 1000 or self._pos >= len(self._data):
+                break
+            # Wait for one more byte
+            step = 10_000_000 // self.baudrate + 1
+            self.advance(step)
+            waited += step
+        if n == 0:
+            return None
+        return self.read(n)
+
+    def write(self, buf):
+        return len(buf)
@@ -3,6 +3,14 @@ This module provides functions for connecting to and
 disconnecting from a Wi-Fi network using MicroPython on
 ESP8266 or ESP32 devices.
 
+The first `connect` scans for the strongest access point of the
+network and stores its BSSID and channel and the IP configuration
+from DHCP in a small file on flash. The next `connect` joins this
+access point with the stored IP address, without the scan and the
+DHCP exchange. The port may still search the channels for the
+BSSID if it cannot preset the channel. If the stored values fail,
+the file is removed and a plain connection follows.
+
 Example
 -------
 .. code-block:: python
@@ -29,56 +37,173 @@ Authors
 
 Modification history
 --------------------
+- **2026-10-18** : Fast reconnect with cached BSSID, channel and
+  IP configuration; adaptive polling of the connection state.
 - **2024-12-14** : Prefixes added to print statements.
 - **2024-11-11** : Added Sphinx comments.
 - **2024-11-02** : Added `print_status` method.
 - **2023-06-17** : Created `connect` and `disconnect` methods.
 """
 
+import os
 import time
+import json
+import binascii
 import gc  # Garbage Collector interface (Memory management)
 gc.collect()
 
 print_info = False
+CACHE_FILE = "/wifi.cache"
+last_connect_ms = 0  # Duration of the last connection
 
 
-def connect(wifi, ssid, password):
+def connect(wifi, ssid, password, timeout_ms=10000, cache=CACHE_FILE,
+            static_ip=True):
     """
     Connect to a specified Wi-Fi network using the provided
     SSID and password. If the connection attempt exceeds the
     specified timeout, it will terminate and return `False`.
-    
+
+    The access point and IP configuration of the last connection
+    are reused from `cache` first; a plain connection follows if
+    it does not succeed.
+
     :param wifi: The Wi-Fi interface object to use for the connection.
     :param str ssid: The SSID of the Wi-Fi network to connect to.
     :param str password: The password for the Wi-Fi network.
+    :param timeout_ms: Timeout of the full connection.
+    :param cache: File with the values of the last connection, or
+                  `None` to always connect without a scan and cache.
+    :param static_ip: Reuse the last IP address instead of DHCP;
+                      the address should be reserved in the router.
     :returns: `True` if connected successfully, `False` if
               the connection attempt timed out.
     """
+    global last_connect_ms
 
-    if not wifi.isconnected():
-        wifi.active(True)
-        print(f"[wifi] Connecting to {ssid}...", end="")
-        wifi.connect(ssid, password)
-
-        for _ in range(40):
-            if wifi.isconnected():
-                print(" Done")
-                return True
-            else:
-                if print_info:
-                    print_status(wifi)
-                else:
-                    print(".", end="")
-                time.sleep_ms(250)
-
-        print("\r\n\x1b[31m[wifi] Connection failed\x1b[0m")
-        wifi.disconnect()
-        return False
-    else:
+    if wifi.isconnected():
         print("[wifi] Already connected")
         if print_info:
             print_status(wifi)
-    return True
+        return True
+
+    start = time.ticks_ms()
+    wifi.active(True)
+    print(f"[wifi] Connecting to {ssid}...", end="")
+    saved = _load(cache, ssid)
+    ok = False
+
+    if saved:
+        # Known access point, no DHCP
+        if static_ip:
+            wifi.ifconfig(tuple(saved["ip"]))
+        _set_channel(wifi, saved["channel"])
+        wifi.connect(ssid, password,
+                     bssid=binascii.unhexlify(saved["bssid"]))
+        ok = _wait(wifi, timeout_ms // 4)
+        if not ok:
+            print(" Cached values failed...", end="")
+            wifi.disconnect()
+            if static_ip:
+                _dhcp(wifi)
+            _remove(cache)  # Scan again next time
+
+    if not ok:
+        best = None
+        if cache and saved is None:
+            # Strongest access point of the network, to be stored
+            for ap in wifi.scan():
+                if ap[0] == ssid.encode() and \
+                        (best is None or ap[3] > best[3]):
+                    best = ap
+        if best is None:
+            wifi.connect(ssid, password)
+        else:
+            wifi.connect(ssid, password, bssid=best[1])
+        ok = _wait(wifi, timeout_ms)
+        if ok and best is not None:
+            _save(cache, {"ssid": ssid,
+                          "bssid": binascii.hexlify(best[1]).decode(),
+                          "channel": best[2], "ip": list(wifi.ifconfig())})
+
+    last_connect_ms = time.ticks_diff(time.ticks_ms(), start)
+    if ok:
+        print(f" Done ({last_connect_ms} ms)")
+        return True
+
+    print("\r\n\x1b[31m[wifi] Connection failed\x1b[0m")
+    if print_info:
+        print_status(wifi)
+    wifi.disconnect()
+    return False
+
+
+def _wait(wifi, timeout_ms):
+    """
+    Wait until the interface is connected, checking it often at
+    first and less often later. Stop early if the connection
+    fails, e.g. if the access point is not found.
+    """
+    start = time.ticks_ms()
+    delay = 10
+    while time.ticks_diff(time.ticks_ms(), start) < timeout_ms:
+        if wifi.isconnected():
+            return True
+        if 200 <= wifi.status() <= 204:
+            return False
+        time.sleep_ms(delay)
+        delay = min(delay * 2, 100)
+    return False
+
+
+def _load(path, ssid):
+    """
+    Return the values of the last connection to `ssid`, or `None`.
+    """
+    if not path:
+        return None
+    try:
+        with open(path) as f:
+            values = json.load(f)
+        if values["ssid"] == ssid:
+            return values
+    except (OSError, ValueError, KeyError):
+        pass
+    return None
+
+
+def _save(path, values):
+    try:
+        with open(path, "w") as f:
+            json.dump(values, f)
+    except OSError as e:
+        print("[wifi] Cannot store connection values:", e)
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _set_channel(wifi, channel):
+    try:
+        wifi.config(channel=channel)
+    except (ValueError, OSError):
+        pass  # Not supported in Station mode by this port
+
+
+def _dhcp(wifi):
+    """
+    Return from the static IP configuration to DHCP.
+    """
+    try:
+        wifi.ifconfig("dhcp")
+    except (TypeError, ValueError, OSError):
+        # Older ports; DHCP starts again with the interface
+        wifi.active(False)
+        wifi.active(True)
 
 
 def disconnect(wifi):
@@ -0,0 +1,136 @@
+"""
+Decoder of the binary segments written by `record_log.py`, run on a
+computer:
+
+.. code-block:: bash
+
+    python decode_records.py temp_00001.bin temp_00002.bin > temp.csv
+    python decode_records.py --npz temp.npz temp_*.bin
+
+The CSV has the columns `time` (seconds since 1970-01-01 UTC),
+`channel` and `value`. With `--npz`, the arrays `time`, `channel`
+and `value` are saved by NumPy instead.
+
+Author
+------
+Tomas Fryza
+
+Modification history
+--------------------
+- **2026-10-18** : File created, initial release.
+"""
+
+import calendar
+import struct
+import sys
+
+from record_log import (HEADER_FORMAT, HEADER_SIZE, MAGIC, RECORD_FORMAT,
+                        RECORD_SIZE, TIME_CHANNEL, TIME_FORMAT)
+
+
+def read_header(data):
+    """
+    Return (segment number, start time in seconds since 1970) of
+    a segment.
+
+    :param data: Segment contents as bytes.
+    """
+    (magic, version, record_size, epoch, segment, start) = \
+        struct.unpack_from(HEADER_FORMAT, data)
+    if magic != MAGIC or record_size != RECORD_SIZE:
+        raise ValueError("not a record segment")
+    # `time.time()` of MicroPython counts from 2000 on most ports
+    start += calendar.timegm((epoch, 1, 1, 0, 0, 0))
+    return (segment, start)
+
+
+def records(data):
+    """
+    Iterate over the samples of a segment as (time in seconds since
+    1970, channel, value). An incomplete last record is ignored.
+
+    :param data: Segment contents as bytes.
+    """
+    (_, start) = read_header(data)
+    t = 0
+    end = HEADER_SIZE + (len(data) - HEADER_SIZE) // RECORD_SIZE * RECORD_SIZE
+    for pos in range(HEADER_SIZE, end, RECORD_SIZE):
+        (delta, channel, value) = struct.unpack_from(RECORD_FORMAT, data, pos)
+        if channel == TIME_CHANNEL:
+            t = struct.unpack_from(TIME_FORMAT, data, pos)[2]
+            continue
+        t += delta
+        yield (start + t / 1000, channel, value)
+
+
+def to_csv(paths, out):
+    """
+    Write the samples of segment files as CSV lines.
+
+    :param paths: Segment files in time order.
+    :param out: Text stream.
+    """
+    out.write("time,channel,value\n")
+    for path in paths:
+        with open(path, "rb") as f:
+            data = f.read()
+        for (t, channel, value) in records(data):
+            out.write(f"{t:.3f},{channel},{value:.7g}\n")
+
+
+def to_numpy(paths):
+    """
+    Decode segment files to NumPy arrays.
+
+    :param paths: Segment files in time order.
+    :returns: Arrays (time in seconds since 1970, channel, value).
+    """
+    import numpy as np
+
+    dtype = np.dtype([("delta", "<u2"), ("channel", "<u2"), ("value", "<f4")])
+    times = []
+    channels = []
+    values = []
+    for path in paths:
+        with open(path, "rb") as f:
+            data = f.read()
+        (_, start) = read_header(data)
+        count = (len(data) - HEADER_SIZE) // RECORD_SIZE
+        rec = np.frombuffer(data, dtype, count, HEADER_SIZE)
+        is_time = rec["channel"] == TIME_CHANNEL
+        # Times of the time records, the same 4 bytes read as integers
+        anchor = rec["value"].view("<u4").astype(np.int64)
+        delta = rec["delta"].astype(np.int64)
+        delta[is_time] = 0
+        elapsed = np.cumsum(delta)
+        # Every record counts from the last time record before it
+        group = np.cumsum(is_time)
+        base = np.zeros(group[-1] + 1 if count else 1, np.int64)
+        base_elapsed = np.zeros_like(base)
+        base[1:] = anchor[is_time]
+        base_elapsed[1:] = elapsed[is_time]
+        t = base[group] + elapsed - base_elapsed[group]
+        keep = ~is_time
+        times.append(start + t[keep] / 1000)
+        channels.append(rec["channel"][keep])
+        values.append(rec["value"][keep])
+    if not times:
+        return (np.zeros(0), np.zeros(0, np.uint16), np.zeros(0, np.float32))
+    return (np.concatenate(times), np.concatenate(channels),
+            np.concatenate(values))
+
+
+def main(argv):
+    if len(argv) > 2 and argv[1] == "--npz":
+        import numpy as np
+
+        (t, channel, value) = to_numpy(argv[3:])
+        np.savez(argv[2], time=t, channel=channel, value=value)
+    elif len(argv) > 1:
+        to_csv(argv[1:], sys.stdout)
+    else:
+        print(__doc__)
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,235 @@
+"""
+This module provides a buffered log writer for `asyncio` applications.
+Producers append records to a preallocated ring buffer and a dedicated
+task writes the buffer to the file, either when it holds `flush_bytes`
+or when the oldest record is older than `max_age_ms`. The flash is
+then programmed in large blocks instead of once per line.
+
+When the ring is full, `write` waits until the flush task makes room
+(backpressure), so no record is lost; `write_nowait` drops the record
+instead and counts it. Any number of producer tasks can share one sink.
+
+Example
+-------
+.. code-block:: python
+
+    import uasyncio as asyncio
+    from log_sink import LogSink
+
+    async def producer(sink, name):
+        while True:
+            await sink.write(f"{name}\\n")
+            await asyncio.sleep_ms(1)
+
+    async def main():
+        sink = LogSink(open("log.txt", "wb"))
+        asyncio.create_task(sink.run())
+        asyncio.create_task(producer(sink, "Task 1"))
+        asyncio.create_task(producer(sink, "Task 2"))
+        await asyncio.sleep(10)
+        await sink.close()
+        print(sink.flushes, sink.bytes_per_flush(), sink.max_latency_us)
+
+    asyncio.run(main())
+
+Author
+------
+Tomas Fryza
+
+Modification history
+--------------------
+- **2026-10-18** : Failed file writes do not stop the flush task.
+- **2026-10-18** : File created, initial release.
+"""
+
+import uasyncio as asyncio
+import time
+
+
+class LogSink:
+    """
+    Ring-buffered log writer flushed by an `asyncio` task.
+    """
+
+    def __init__(self, file, size=4096, flush_bytes=2048, max_age_ms=1000,
+                 poll_ms=20):
+        """
+        Allocate the ring buffer.
+
+        :param file: File opened for writing in binary mode.
+        :param size: Size of the ring buffer in bytes.
+        :param flush_bytes: Amount of data that triggers a flush.
+        :param max_age_ms: Longest time a record waits in the buffer.
+        :param poll_ms: Period of checking the thresholds.
+        """
+        self.file = file
+        self._ring = bytearray(size)
+        self._mv = memoryview(self._ring)
+        self._tail = 0  # Oldest byte
+        self._count = 0  # Bytes in the ring
+        self._oldest = 0  # ticks_ms of the oldest record
+        self.flush_bytes = min(flush_bytes, size)
+        self.max_age_ms = max_age_ms
+        self.poll_ms = poll_ms
+        self._space = asyncio.Event()
+        self._running = False
+        self._waiting = 0  # Producers waiting for space
+
+        self.records = 0  # Records accepted
+        self.dropped = 0  # Records dropped by `write_nowait`
+        self.waits = 0  # Times a producer waited for space
+        self.flushes = 0
+        self.bytes_written = 0
+        self.write_errors = 0  # Failed file writes
+        self.lost_bytes = 0  # Data dropped after a failed write
+        self.error = None  # Last write error, e.g. a full file system
+        self.last_latency_us = 0  # Duration of the last file write
+        self.max_latency_us = 0
+        self.total_latency_us = 0
+
+    def free(self):
+        """
+        Return the free space of the ring in bytes.
+        """
+        return len(self._ring) - self._count
+
+    def _put(self, data):
+        """
+        Copy a record into the ring; the caller checks the space.
+        """
+        size = len(self._ring)
+        if not self._count:
+            self._oldest = time.ticks_ms()
+        head = (self._tail + self._count) % size
+        n = len(data)
+        first = min(n, size - head)
+        self._mv[head:head + first] = data[:first] if first < n else data
+        if first < n:
+            self._mv[:n - first] = data[first:]
+        self._count += n
+        self.records += 1
+
+    async def write(self, data):
+        """
+        Append a record, waiting while the ring is full.
+
+        :param data: Record as `bytes` or `str`.
+        """
+        if isinstance(data, str):
+            data = data.encode()
+        if len(data) > len(self._ring):
+            raise ValueError("record larger than buffer")
+        while self.free() < len(data):
+            self.waits += 1
+            self._waiting += 1
+            await self._space.wait()
+            self._waiting -= 1
+        self._put(data)
+
+    def write_nowait(self, data):
+        """
+        Append a record if there is space, e.g. from a time-critical
+        task that must not wait.
+
+        :param data: Record as `bytes` or `str`.
+        :returns: `True` if the record was stored, `False` if dropped.
+        """
+        if isinstance(data, str):
+            data = data.encode()
+        if len(data) > self.free():
+            self.dropped += 1
+            return False
+        self._put(data)
+        return True
+
+    def flush(self):
+        """
+        Write the whole ring to the file now. The call blocks for the
+        duration of the file write.
+        """
+        count = self._count
+        if not count:
+            return
+        size = len(self._ring)
+        tail = self._tail
+        start = time.ticks_us()
+        first = min(count, size - tail)
+        self.file.write(self._mv[tail:tail + first])
+        if first < count:
+            self.file.write(self._mv[:count - first])
+        self.file.flush()
+        latency = time.ticks_diff(time.ticks_us(), start)
+
+        self._tail = (tail + count) % size
+        self._count = 0
+        self.flushes += 1
+        self.bytes_written += count
+        self.last_latency_us = latency
+        self.total_latency_us += latency
+        if latency > self.max_latency_us:
+            self.max_latency_us = latency
+        # Wake up producers waiting for space
+        self._space.set()
+        self._space.clear()
+
+    def _failed(self, e):
+        """
+        Drop the buffered data after a failed write and wake up the
+        producers, so they do not wait for space forever.
+        """
+        if self.error is None:
+            print(f"[!] Log write failed: {e}")
+        self.error = e
+        self.write_errors += 1
+        self.lost_bytes += self._count
+        self._tail = 0
+        self._count = 0
+        self._space.set()
+        self._space.clear()
+
+    def bytes_per_flush(self):
+        """
+        Return the average number of bytes written by one flush.
+        """
+        return self.bytes_written // self.flushes if self.flushes else 0
+
+    def due(self):
+        """
+        Return `True` if the size or age threshold was reached.
+        """
+        if self._count >= self.flush_bytes:
+            return True
+        return self._count > 0 and \
+            time.ticks_diff(time.ticks_ms(), self._oldest) >= self.max_age_ms
+
+    async def run(self):
+        """
+        Flush task; start it by `asyncio.create_task(sink.run())`. It
+        ends after `close`. If a file write fails, the buffered data is
+        dropped and counted in `lost_bytes`, and the error is kept in
+        `error`; the task and the producers go on.
+        """
+        self._running = True
+        while self._running:
+            # Producers waiting for space are served without delay
+            if self.due() or self._waiting:
+                try:
+                    self.flush()
+                except OSError as e:
+                    self._failed(e)
+            await asyncio.sleep_ms(self.poll_ms)
+        try:
+            self.flush()
+        except OSError as e:
+            self._failed(e)
+
+    async def close(self):
+        """
+        Flush the remaining records, stop the flush task and close
+        the file.
+        """
+        self._running = False
+        try:
+            self.flush()
+        finally:
+            self.file.close()
@@ -0,0 +1,194 @@
+"""
+This module stores sensor samples in compact binary segment files
+instead of text lines. Each sample is one 8-byte record:
+
+====== ====== ==============================================
+Offset Type   Content
+====== ====== ==============================================
+0      uint16 Time since the previous record in ms
+2      uint16 Channel ID, `TIME_CHANNEL` (0xFFFF) is reserved
+4      float  Value (32-bit)
+====== ====== ==============================================
+
+When the time since the previous record does not fit in 16 bits, a
+record of `TIME_CHANNEL` with the absolute time in ms since the
+segment start (uint32 instead of float) is inserted first.
+
+Every segment starts with a 16-byte header: magic `b"TSR1"`, format
+version (uint8), record size (uint8), epoch year of `time.time()`
+(uint16), segment number (uint32) and the start time of the segment
+in seconds since the epoch (uint32). All values are little-endian.
+
+Records are collected in a block buffer and the file is written one
+block at a time. When a segment reaches `segment_size` bytes, a new
+one is started. The number of the last segment is kept in a small
+`<prefix>.seq` file, so no directory listing is needed at startup.
+Segments can be converted on a computer by `decode_records.py`.
+
+Example
+-------
+.. code-block:: python
+
+    from record_log import RecordLog
+
+    log = RecordLog("temp", segment_size=64*1024, max_segments=8)
+    log.append(1, 23.5)  # Channel 1
+    log.append(2, 48.0)  # Channel 2
+    log.flush()
+    print(log.segment, log.records)
+
+Author
+------
+Tomas Fryza
+
+Modification history
+--------------------
+- **2026-10-18** : File created, initial release.
+"""
+
+import os
+import struct
+import time
+
+MAGIC = b"TSR1"
+VERSION = 1
+HEADER_FORMAT = "<4sBBHII"
+HEADER_SIZE = 16
+RECORD_FORMAT = "<HHf"
+TIME_FORMAT = "<HHI"
+RECORD_SIZE = 8
+TIME_CHANNEL = 0xFFFF
+_MAX_DELTA = 0xFFFF
+
+
+def segment_name(prefix, number):
+    """
+    Return the file name of a segment.
+
+    :param prefix: Prefix of the log files.
+    :param number: Segment number.
+    """
+    return f"{prefix}_{number:05d}.bin"
+
+
+class RecordLog:
+    """
+    Writer of binary record segments with size-based rotation.
+    """
+
+    def __init__(self, prefix="log", segment_size=64*1024, max_segments=0,
+                 block_size=512):
+        """
+        Open a new segment following the last one of the previous run.
+
+        :param prefix: Prefix of the log files, may include a directory.
+        :param segment_size: Size of one segment file in bytes.
+        :param max_segments: Number of segments kept; older ones are
+                             removed. Zero keeps all.
+        :param block_size: Size of the write buffer in bytes, a multiple
+                           of `RECORD_SIZE`.
+        """
+        self.prefix = prefix
+        self.segment_size = segment_size
+        self.max_segments = max_segments
+        self._buf = bytearray(block_size - block_size % RECORD_SIZE)
+        self._n = 0  # Bytes in the buffer
+        self._file = None
+        self._size = 0  # Bytes of the segment, including the buffer
+        self._tick = 0  # ticks_ms of the last record
+        self._last = 0  # Time of the last record in ms since the start
+        self.segment = self._load_counter()
+        self.records = 0
+        self._open_next()
+
+    def _load_counter(self):
+        """
+        Return the number of the last segment, or 0 for a new log.
+        """
+        try:
+            with open(self.prefix + ".seq", "rb") as f:
+                return struct.unpack("<I", f.read(4))[0]
+        except (OSError, ValueError, struct.error):
+            return 0
+
+    def _open_next(self):
+        """
+        Close the current segment and start the next one. The counter
+        is saved first, so a reset never reuses a segment number.
+        """
+        self.close()
+        self.segment += 1
+        with open(self.prefix + ".seq", "wb") as f:
+            f.write(struct.pack("<I", self.segment))
+        if self.max_segments and self.segment > self.max_segments:
+            try:
+                os.remove(segment_name(self.prefix,
+                                       self.segment - self.max_segments))
+            except OSError:
+                pass  # Already removed
+        self._file = open(segment_name(self.prefix, self.segment), "wb")
+        self._tick = time.ticks_ms()
+        self._last = 0
+        self._file.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION,
+                                     RECORD_SIZE, time.gmtime(0)[0],
+                                     self.segment, int(time.time())))
+        self._size = HEADER_SIZE
+
+    def _put(self, fmt, delta, channel, value):
+        """
+        Pack one record into the block buffer, writing the buffer when
+        it is full.
+        """
+        struct.pack_into(fmt, self._buf, self._n, delta, channel, value)
+        self._n += RECORD_SIZE
+        self._size += RECORD_SIZE
+        if self._n == len(self._buf):
+            self._write_block()
+
+    def _write_block(self):
+        self._file.write(memoryview(self._buf)[:self._n])
+        self._n = 0
+
+    def append(self, channel, value, t_ms=None):
+        """
+        Add one sample.
+
+        :param channel: Channel ID, 0 to 65534.
+        :param value: Sample value, stored as a 32-bit float.
+        :param t_ms: Time of the sample from `time.ticks_ms()`; the
+                     current time if omitted.
+        """
+        if self._size + 2 * RECORD_SIZE > self.segment_size:
+            self._open_next()
+        if t_ms is None:
+            t_ms = time.ticks_ms()
+        # Differences of consecutive samples, so the time does not wrap
+        # with `ticks_ms`
+        delta = time.ticks_diff(t_ms, self._tick)
+        if delta < 0:
+            delta = 0  # Samples out of order keep the last time
+        else:
+            self._tick = t_ms
+        self._last += delta
+        if delta > _MAX_DELTA:
+            self._put(TIME_FORMAT, 0, TIME_CHANNEL, self._last)
+            delta = 0
+        self._put(RECORD_FORMAT, delta, channel, value)
+        self.records += 1
+
+    def flush(self):
+        """
+        Write the buffered records to the file.
+        """
+        if self._n:
+            self._write_block()
+        self._file.flush()
+
+    def close(self):
+        """
+        Write the buffered records and close the segment.
+        """
+        if self._file is not None:
+            self.flush()
+            self._file.close()
+            self._file = None
@@ -0,0 +1,68 @@
+"""
+Two tasks log samples to binary segment files by `RecordLog`,
+instead of text lines as in `save_to_2_files.py`. One record takes
+8 bytes, and the segment number is read from `log.seq` at startup
+instead of listing the directory.
+
+Copy the `log_*.bin` files to a computer and convert them by:
+
+.. code-block:: bash
+
+    python decode_records.py log_*.bin > log.csv
+
+Author
+------
+Tomas Fryza
+
+Modification history
+--------------------
+- **2026-10-18** : File created, initial release.
+"""
+
+# MicroPython builtin modules
+import uasyncio as asyncio
+import time
+
+# Our own modules
+from record_log import RecordLog
+
+# Channel IDs
+CH_TASK1 = 1
+CH_TASK2 = 2
+
+
+async def process_fast(log):
+    """Task 1: sample every 1 ms"""
+    n = 0
+    while True:
+        log.append(CH_TASK1, n)
+        n += 1
+        await asyncio.sleep_ms(1)
+
+
+async def process_slow(log):
+    """Task 2: sample every second, then write the records"""
+    start = time.ticks_ms()
+    while True:
+        log.append(CH_TASK2, time.ticks_diff(time.ticks_ms(), start) / 1000)
+        log.flush()
+        print(f"Segment {log.segment}, {log.records} records")
+        await asyncio.sleep(1)
+
+
+async def main(log):
+    print("Starting tasks...")
+    print("Press `Ctrl+C` to stop")
+    await asyncio.gather(process_fast(log), process_slow(log))
+
+
+# Only run if executed directly
+if __name__ == "__main__":
+    # Segments of 64 kB, the last 16 are kept
+    log = RecordLog("log", segment_size=64*1024, max_segments=16)
+    try:
+        asyncio.run(main(log))
+    except KeyboardInterrupt:
+        print("Program stopped. Exiting...")
+    finally:
+        log.close()
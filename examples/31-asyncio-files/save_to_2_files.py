@@ -3,6 +3,11 @@ import uasyncio as asyncio
 import sys
 import os
 import time
+from log_sink import LogSink
+
+
+# Buffered writers of open files
+sinks = []
 
 
 def elapsed():
@@ -29,34 +34,37 @@ def generate_filename(prefix):
     return f"{prefix}_{max_num + 1:03d}.txt"
 
 
-async def process_to_file1():
-    """Task 1"""
-    fname = generate_filename("proc1")
+def open_sink(prefix):
+    """
+    Open a new file and its buffered writer. Lines are written in
+    blocks of 2 kB or at least once per second.
+    """
     try:
-        with open(fname, 'w') as f:
-            print(f"New file `{fname}` created")
-            while True:
-                f.write(f"[{elapsed()}] Task 1\n")
-                f.flush()  # Ensure data is written immediately
-                await asyncio.sleep_ms(1)
+        fname = generate_filename(prefix)
+        file = open(fname, 'wb')
+        print(f"New file `{fname}` created")
     except OSError as e:
-        print(f"[!] File operation failed: {e}")
+        print("[!] Failed to open file:", e)
         sys.exit()
+    sink = LogSink(file, size=4096, flush_bytes=2048, max_age_ms=1000)
+    sinks.append(sink)
+    asyncio.create_task(sink.run())
+    return sink
+
+
+async def process_to_file1():
+    """Task 1"""
+    sink = open_sink("proc1")
+    while True:
+        await sink.write(f"[{elapsed()}] Task 1\n")
+        await asyncio.sleep_ms(1)
 
 
 async def process_to_file2():
     """Task 2"""
-    try:
-        fname = generate_filename("proc2")
-        file = open(fname, 'w')
-        print(f"New file `{fname}` created")
-    except OSError as e:
-        print("[!] Failed to open file:", e)
-        sys.exit()
-
+    sink = open_sink("proc2")
     while True:
-        file.write(f"[{elapsed()}] Task 2\n")
-        file.flush()  # Ensure data is written immediately
+        await sink.write(f"[{elapsed()}] Task 2\n")
         await asyncio.sleep(1)
 
 
@@ -86,11 +94,13 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         # This part runs when Ctrl+C is pressed
         print("Program stopped. Exiting...")
-        # Optional cleanup code
-        try:
-            file.close()
-        except NameError:
-            pass  # file not defined
+        # Write the buffered lines and close the files
+        for sink in sinks:
+            sink.flush()
+            sink.file.close()
+            print(f"{sink.records} lines, {sink.flushes} flushes, "
+                  f"{sink.bytes_per_flush()} B/flush, "
+                  f"max {sink.max_latency_us} us")
         try:
             loop.stop()
         except AttributeError:
@@ -2,6 +2,7 @@ import uasyncio as asyncio
 import sys
 import os
 import time
+from log_sink import LogSink
 
 # Get the starting time in milliseconds
 start = time.ticks_ms()
@@ -35,8 +36,11 @@ def generate_filename():
 # Open file for writing (for Process 2)
 try:
     fname = generate_filename()
-    file = open(fname, 'w')
+    file = open(fname, 'wb')
     print(f"New file `{fname}` created")
+    # Lines are collected in RAM and written in blocks of 2 kB or at
+    # least once per second, instead of flushing every line
+    sink = LogSink(file, size=4096, flush_bytes=2048, max_age_ms=1000)
 except OSError as e:
     print(f"[!] Failed to open file: {e}")
     sys.exit()
@@ -46,14 +50,15 @@ except OSError as e:
 async def process_to_serial():
     while True:
         print(f"[{elapsed()}] This is being printed to the serial monitor")
+        print(f"    Log: {sink.flushes} flushes, {sink.bytes_per_flush()} B/flush, "
+              f"max {sink.max_latency_us} us, {sink.waits} waits")
         await asyncio.sleep(1)
 
 
 # Process 2: Write to file
 async def process_to_file():
     while True:
-        file.write(f"[{elapsed()}] This is being written to the file\n")
-        file.flush()  # Ensure data is written immediately
+        await sink.write(f"[{elapsed()}] This is being written to the file\n")
         await asyncio.sleep_ms(1)
 
 
@@ -62,6 +67,7 @@ async def main():
     print("Starting tasks...")
     task1 = asyncio.create_task(process_to_serial())
     task2 = asyncio.create_task(process_to_file())
+    asyncio.create_task(sink.run())
 
     # Run both tasks concurrently
     try:
@@ -79,6 +85,7 @@ except KeyboardInterrupt:
     # This part runs when Ctrl+C is pressed
     print("Program stopped. Exiting...")
     
-    # Optional cleanup code
+    # Write the buffered lines and close the file
+    sink.flush()
     file.close()
     loop.stop()  # Not available in all uasyncio versions
@@ -0,0 +1,224 @@
+"""
+This module provides a write-back sector cache in front of a block
+device, such as `SDCard` or the internal flash partition. The cache
+implements the same `readblocks`, `writeblocks` and `ioctl` protocol,
+so it can be mounted instead of the device itself.
+
+Single-block accesses, typical for FAT sectors and directory entries,
+are served from a preallocated pool of N blocks with least recently
+used (LRU) eviction. Written blocks are marked dirty and written back
+on eviction or sync, and consecutive dirty blocks are sent in one
+multi-block transfer. Multi-block reads and writes of file data
+bypass the pool, so they do not evict the metadata.
+
+The cache is flushed on `ioctl` sync (op 3), which is called by
+`os.sync()`, when a file is closed and on `os.umount`. Data not yet
+flushed is lost on power failure.
+
+Example
+-------
+.. code-block:: python
+
+    from machine import Pin, SPI
+    import os
+    from sdcard import SDCard
+    from block_cache import BlockCache
+
+    spi = SPI(1, sck=Pin(18), mosi=Pin(23), miso=Pin(19))
+    sd = BlockCache(SDCard(spi, Pin(12)), blocks=16)
+    os.mount(sd, "/sd")
+
+    with open("/sd/log.txt", "a") as f:
+        f.write("Hello\\n")
+    print(sd.hits, sd.misses, sd.writes)
+
+Author
+------
+Tomas Fryza
+
+Modification history
+--------------------
+- **2026-10-18** : File created, initial release.
+"""
+
+import array
+
+
+class BlockCache:
+    """
+    Write-back LRU cache of a block device.
+    """
+
+    def __init__(self, bdev, blocks=16, max_run=4):
+        """
+        Wrap a block device and allocate the cache pool.
+
+        :param bdev: Block device with `readblocks`, `writeblocks` and
+                     `ioctl` methods.
+        :param blocks: Number of blocks kept in the cache.
+        :param max_run: Largest number of consecutive dirty blocks
+                        written back in one transfer.
+        """
+        self.bdev = bdev
+        self.block_size = bdev.ioctl(5, 0) or 512
+        bs = self.block_size
+        self._pool = bytearray(blocks * bs)
+        mv = memoryview(self._pool)
+        self._slots = [mv[i * bs:(i + 1) * bs] for i in range(blocks)]
+        self._block = array.array("i", [-1] * blocks)  # Block of each slot
+        self._stamp = array.array("i", bytes(4 * blocks))  # Last access
+        self._dirty = bytearray(blocks)
+        self._map = {}  # Block number to slot
+        self._clock = 0
+        # Staging buffer of the multi-block write back
+        self._run = bytearray(max_run * bs)
+        self._run_mv = memoryview(self._run)
+        self._max_run = max_run
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0  # Write transfers to the device
+
+    def _touch(self, slot):
+        """
+        Mark a slot as the most recently used.
+        """
+        self._clock += 1
+        self._stamp[slot] = self._clock
+
+    def _flush_from(self, block):
+        """
+        Write back a dirty block together with the following dirty
+        blocks in one multi-block transfer.
+
+        :param block: Number of the first block.
+        """
+        (bs, dirty, slots) = (self.block_size, self._dirty, self._slots)
+        n = 0
+        while n < self._max_run:
+            slot = self._map.get(block + n)
+            if slot is None or not dirty[slot]:
+                break
+            n += 1
+        if n == 0:
+            return
+        if n == 1:
+            slot = self._map[block]
+            self.bdev.writeblocks(block, slots[slot])
+            dirty[slot] = 0
+        else:
+            for i in range(n):
+                slot = self._map[block + i]
+                self._run_mv[i * bs:(i + 1) * bs] = slots[slot]
+            self.bdev.writeblocks(block, self._run_mv[:n * bs])
+            # Clean only after a successful write
+            for i in range(n):
+                dirty[self._map[block + i]] = 0
+        self.writes += 1
+
+    def flush(self):
+        """
+        Write back all dirty blocks in ascending order, so consecutive
+        blocks are merged into multi-block transfers.
+        """
+        while True:
+            # Lowest dirty block; a run starts there
+            first = -1
+            for slot in range(len(self._slots)):
+                if self._dirty[slot]:
+                    block = self._block[slot]
+                    if first < 0 or block < first:
+                        first = block
+            if first < 0:
+                return
+            self._flush_from(first)
+
+    def _slot_for(self, block, load):
+        """
+        Return the slot of a block, allocating the least recently used
+        slot on a miss.
+
+        :param block: Block number.
+        :param load: Read the block from the device on a miss.
+        """
+        slot = self._map.get(block)
+        if slot is not None:
+            self.hits += 1
+            self._touch(slot)
+            return slot
+        self.misses += 1
+        slot = 0
+        stamp = self._stamp
+        for i in range(1, len(stamp)):
+            if stamp[i] < stamp[slot]:
+                slot = i
+        old = self._block[slot]
+        if old >= 0:
+            if self._dirty[slot]:
+                self._flush_from(old)
+            del self._map[old]
+            self._block[slot] = -1
+        self._dirty[slot] = 0
+        if load:
+            # The slot stays free if the read fails
+            self.bdev.readblocks(block, self._slots[slot])
+        self._block[slot] = block
+        self._map[block] = slot
+        self._touch(slot)
+        return slot
+
+    def readblocks(self, block_num, buf, offset=0):
+        bs = self.block_size
+        if offset or len(buf) < bs:
+            # Part of one block (extended interface)
+            slot = self._slot_for(block_num, True)
+            buf[:] = self._slots[slot][offset:offset + len(buf)]
+            return
+        nblocks = len(buf) // bs
+        if nblocks == 1:
+            slot = self._slot_for(block_num, True)
+            buf[:] = self._slots[slot]
+            return
+        # File data: one transfer, then cached blocks take precedence
+        self.bdev.readblocks(block_num, buf)
+        mv = memoryview(buf)
+        for i in range(nblocks):
+            slot = self._map.get(block_num + i)
+            if slot is not None:
+                mv[i * bs:(i + 1) * bs] = self._slots[slot]
+
+    def writeblocks(self, block_num, buf, offset=None):
+        bs = self.block_size
+        if offset is not None and (offset or len(buf) < bs):
+            # Program part of an erased block (extended interface)
+            slot = self._slot_for(block_num, True)
+            self._slots[slot][offset:offset + len(buf)] = buf
+            self._dirty[slot] = 1
+            return
+        nblocks = len(buf) // bs
+        if nblocks == 1:
+            slot = self._slot_for(block_num, False)
+            self._slots[slot][:] = buf
+            self._dirty[slot] = 1
+            return
+        # File data: write through, keep cached copies up to date
+        self.bdev.writeblocks(block_num, buf)
+        self.writes += 1
+        mv = memoryview(buf)
+        for i in range(nblocks):
+            slot = self._map.get(block_num + i)
+            if slot is not None:
+                self._slots[slot][:] = mv[i * bs:(i + 1) * bs]
+                self._dirty[slot] = 0
+
+    def ioctl(self, op, arg):
+        if op == 3 or op == 2:  # Sync or deinit
+            self.flush()
+        elif op == 6:  # Erase block (extended interface)
+            slot = self._slot_for(arg, False)
+            slot_mv = self._slots[slot]
+            for i in range(len(slot_mv)):
+                slot_mv[i] = 0xFF
+            self._dirty[slot] = 1
+            return 0
+        return self.bdev.ioctl(op, arg)
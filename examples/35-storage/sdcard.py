@@ -12,6 +12,16 @@ Example usage on ESP8266:
     sd = sdcard.SDCard(machine.SPI(1), machine.Pin(15))
     os.mount(sd, '/sd')
     os.listdir('/')
+
+High-throughput options (2026-10-18, Tomas Fryza):
+    * after initialisation, the SPI clock is raised to the highest rate
+      allowed by the card (CSD TRAN_SPEED) and `max_baudrate`; the rate
+      is lowered until the CSD reads back unchanged;
+    * multi-block writes announce the block count by ACMD23, so the card
+      can pre-erase the blocks;
+    * waiting for the card polls into preallocated buffers without
+      sleeping, with a timeout;
+    * `crc=True` enables CRC checking of commands and data (CMD59).
 """
 
 from micropython import const
@@ -19,6 +29,8 @@ import time
 
 
 _CMD_TIMEOUT = const(100)
+_READ_TIMEOUT_MS = const(100)  # Start token of a read block
+_WRITE_TIMEOUT_MS = const(500)  # Busy after a written block
 
 _R1_IDLE_STATE = const(1 << 0)
 # R1_ERASE_RESET = const(1 << 1)
@@ -31,15 +43,56 @@ _TOKEN_CMD25 = const(0xFC)
 _TOKEN_STOP_TRAN = const(0xFD)
 _TOKEN_DATA = const(0xFE)
 
+# TRAN_SPEED of CSD: time values x10 and rate units in bit/s
+_TRAN_VALUES = (0, 10, 12, 13, 15, 20, 25, 30, 35, 40, 45, 50, 55, 60, 70, 80)
+_TRAN_UNITS = (100_000, 1_000_000, 10_000_000, 100_000_000)
+
+
+def _crc7(buf, n):
+    # CRC7 of the first `n` bytes of a command, including the end bit
+    crc = 0
+    for k in range(n):
+        b = buf[k]
+        for i in range(7, -1, -1):
+            msb = (crc >> 6) ^ ((b >> i) & 1)
+            crc = (crc << 1) & 0x7F
+            if msb:
+                crc ^= 0x09
+    return (crc << 1) | 1
+
+
+def _crc16_table():
+    # Table of CRC16-CCITT (polynomial 0x1021) for each byte value
+    import array
+
+    table = array.array("H", bytes(512))
+    for i in range(256):
+        crc = i << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x1021) & 0xFFFF if crc & 0x8000 else (crc << 1) & 0xFFFF
+        table[i] = crc
+    return table
+
 
 class SDCard:
-    def __init__(self, spi, cs):
+    def __init__(self, spi, cs, baudrate=None, max_baudrate=20_000_000, crc=False):
+        # baudrate: fixed SPI clock after initialisation; if None, the
+        # highest rate the card supports, up to max_baudrate
         self.spi = spi
         self.cs = cs
+        self.baudrate = baudrate
+        self.max_baudrate = max_baudrate
+        self.crc = crc
+        self._crc_on = False  # Card checks CRC of commands and data
+        self._crc_table = _crc16_table() if crc else None
 
         self.cmdbuf = bytearray(6)
         self.dummybuf = bytearray(512)
         self.tokenbuf = bytearray(1)
+        # Busy polling reads several bytes per call; the card holds
+        # MISO low while busy and clocking extra 0xFF bytes is harmless
+        self.busybuf = bytearray(8)
+        self.crcbuf = bytearray(2)
         for i in range(512):
             self.dummybuf[i] = 0xFF
         self.dummybuf_memoryview = memoryview(self.dummybuf)
@@ -90,6 +143,7 @@ class SDCard:
             raise OSError("no response from SD card")
         csd = bytearray(16)
         self.readinto(csd)
+        self.csd = csd
         if csd[0] & 0xC0 == 0x40:  # CSD version 2.0
             self.sectors = ((csd[8] << 8 | csd[9]) + 1) * 1024
         elif csd[0] & 0xC0 == 0x00:  # CSD version 1.0 (old, <=2GB)
@@ -104,8 +158,43 @@ class SDCard:
         if self.cmd(16, 512, 0) != 0:
             raise OSError("can't set 512 block size")
 
+        # CMD59: enable CRC checking by the card
+        if self.crc:
+            if self.cmd(59, 1, 0) != 0:
+                raise OSError("can't enable CRC")
+            self._crc_on = True
+
         # set to high data rate now that it's initialised
-        self.init_spi(1_320_000)
+        self.init_fast_spi()
+
+    def max_card_baudrate(self):
+        # Maximum transfer rate from TRAN_SPEED byte of the CSD
+        tran = self.csd[3]
+        unit = tran & 0x07
+        if unit >= len(_TRAN_UNITS):
+            unit = len(_TRAN_UNITS) - 1  # reserved codes
+        return _TRAN_UNITS[unit] * _TRAN_VALUES[(tran >> 3) & 0x0F] // 10
+
+    def init_fast_spi(self):
+        if self.baudrate is not None:
+            self.init_spi(self.baudrate)
+            return
+        # Highest rate at which the CSD reads back unchanged
+        baudrate = min(self.max_card_baudrate(), self.max_baudrate)
+        check = bytearray(16)
+        while baudrate > 1_320_000:
+            self.init_spi(baudrate)
+            try:
+                if self.cmd(9, 0, 0, 0, False) == 0:
+                    self.readinto(check)
+                    if check == self.csd:
+                        self.baudrate = baudrate
+                        return
+            except OSError:
+                pass
+            baudrate //= 2
+        self.baudrate = 1_320_000
+        self.init_spi(self.baudrate)
 
     def init_card_v1(self):
         for i in range(_CMD_TIMEOUT):
@@ -138,7 +227,7 @@ class SDCard:
         buf[2] = arg >> 16
         buf[3] = arg >> 8
         buf[4] = arg
-        buf[5] = crc
+        buf[5] = _crc7(buf, 5) if self._crc_on else crc
         self.spi.write(buf)
 
         if skip1:
@@ -162,18 +251,39 @@ class SDCard:
         self.spi.write(b"\xff")
         return -1
 
+    def crc16(self, buf):
+        # CRC16-CCITT of a data block
+        (crc, table) = (0, self._crc_table)
+        for b in buf:
+            crc = ((crc << 8) & 0xFFFF) ^ table[(crc >> 8) ^ b]
+        return crc
+
+    def wait_ready(self):
+        # poll until the card releases MISO (busy = 0x00), no allocation
+        busy = self.busybuf
+        start = time.ticks_ms()
+        while True:
+            self.spi.readinto(busy, 0xFF)
+            if busy[-1] != 0x00:
+                return True
+            if time.ticks_diff(time.ticks_ms(), start) > _WRITE_TIMEOUT_MS:
+                return False
+
     def readinto(self, buf):
         self.cs(0)
 
-        # read until start byte (0xff)
-        for i in range(_CMD_TIMEOUT):
-            self.spi.readinto(self.tokenbuf, 0xFF)
-            if self.tokenbuf[0] == _TOKEN_DATA:
+        # read until start byte (0xfe), polling without sleep
+        token = self.tokenbuf
+        start = time.ticks_ms()
+        while True:
+            self.spi.readinto(token, 0xFF)
+            if token[0] == _TOKEN_DATA:
                 break
-            time.sleep_ms(1)
-        else:
-            self.cs(1)
-            raise OSError("timeout waiting for response")
+            if token[0] != 0xFF or time.ticks_diff(time.ticks_ms(), start) > _READ_TIMEOUT_MS:
+                # error token or timeout
+                self.cs(1)
+                self.spi.write(b"\xff")
+                raise OSError("timeout waiting for response")
 
         # read data
         mv = self.dummybuf_memoryview
@@ -182,44 +292,56 @@ class SDCard:
         self.spi.write_readinto(mv, buf)
 
         # read checksum
-        self.spi.write(b"\xff")
-        self.spi.write(b"\xff")
+        self.spi.readinto(self.crcbuf, 0xFF)
 
         self.cs(1)
         self.spi.write(b"\xff")
 
+        if self.crc:
+            if self.crc16(buf) != (self.crcbuf[0] << 8 | self.crcbuf[1]):
+                raise OSError(5)  # EIO
+
     def write(self, token, buf):
+        # returns True if the card accepted the block
         self.cs(0)
 
         # send: start of block, data, checksum
-        self.spi.read(1, token)
+        self.tokenbuf[0] = token
+        self.spi.write(self.tokenbuf)
         self.spi.write(buf)
-        self.spi.write(b"\xff")
-        self.spi.write(b"\xff")
+        if self.crc:
+            crc = self.crc16(buf)
+            self.crcbuf[0] = crc >> 8
+            self.crcbuf[1] = crc & 0xFF
+            self.spi.write(self.crcbuf)
+        else:
+            self.spi.write(b"\xff\xff")
 
-        # check the response
-        if (self.spi.read(1, 0xFF)[0] & 0x1F) != 0x05:
+        # check the response (0x05 accepted, 0x0B CRC error, 0x0D error)
+        self.spi.readinto(self.tokenbuf, 0xFF)
+        if (self.tokenbuf[0] & 0x1F) != 0x05:
             self.cs(1)
             self.spi.write(b"\xff")
-            return
+            return False
 
         # wait for write to finish
-        while self.spi.read(1, 0xFF)[0] == 0:
-            pass
+        ready = self.wait_ready()
 
         self.cs(1)
         self.spi.write(b"\xff")
+        return ready
 
     def write_token(self, token):
         self.cs(0)
-        self.spi.read(1, token)
+        self.tokenbuf[0] = token
+        self.spi.write(self.tokenbuf)
         self.spi.write(b"\xff")
         # wait for write to finish
-        while self.spi.read(1, 0xFF)[0] == 0x00:
-            pass
+        ready = self.wait_ready()
 
         self.cs(1)
         self.spi.write(b"\xff")
+        return ready
 
     def readblocks(self, block_num, buf):
         nblocks = len(buf) // 512
@@ -240,13 +362,16 @@ class SDCard:
                 raise OSError(5)  # EIO
             offset = 0
             mv = memoryview(buf)
-            while nblocks:
-                # receive the data and release card
-                self.readinto(mv[offset : offset + 512])
-                offset += 512
-                nblocks -= 1
-            if self.cmd(12, 0, 0xFF, skip1=True):
-                raise OSError(5)  # EIO
+            try:
+                while nblocks:
+                    # receive the data and release card
+                    self.readinto(mv[offset : offset + 512])
+                    offset += 512
+                    nblocks -= 1
+            finally:
+                # CMD12: stop the transmission also after an error
+                if self.cmd(12, 0, 0xFF, skip1=True):
+                    raise OSError(5)  # EIO
 
     def writeblocks(self, block_num, buf):
         nblocks, err = divmod(len(buf), 512)
@@ -257,19 +382,29 @@ class SDCard:
                 raise OSError(5)  # EIO
 
             # send the data
-            self.write(_TOKEN_DATA, buf)
+            if not self.write(_TOKEN_DATA, buf):
+                raise OSError(5)  # EIO
         else:
+            # ACMD23: number of blocks to pre-erase; only a hint, so the
+            # response is not checked
+            self.cmd(55, 0, 0)
+            self.cmd(23, nblocks, 0)
             # CMD25: set write address for first block
             if self.cmd(25, block_num * self.cdv, 0) != 0:
                 raise OSError(5)  # EIO
             # send the data
             offset = 0
             mv = memoryview(buf)
+            ok = True
             while nblocks:
-                self.write(_TOKEN_CMD25, mv[offset : offset + 512])
+                if not self.write(_TOKEN_CMD25, mv[offset : offset + 512]):
+                    ok = False
+                    break
                 offset += 512
                 nblocks -= 1
-            self.write_token(_TOKEN_STOP_TRAN)
+            # stop the transmission also after an error
+            if not self.write_token(_TOKEN_STOP_TRAN) or not ok:
+                raise OSError(5)  # EIO
 
     def ioctl(self, op, arg):
         if op == 4:  # get number of blocks
@@ -4,6 +4,8 @@
 
 from micropython import const
 import framebuf
+import time
+import uasyncio as asyncio
 
 
 # register definitions
@@ -34,6 +36,14 @@ class SSD1306(framebuf.FrameBuffer):
         self.external_vcc = external_vcc
         self.pages = self.height // 8
         self.buffer = bytearray(self.pages * self.width)
+        # Column and page address commands of `show`, sent as one batch
+        self.addr_cmds = bytearray(6)
+        # Transmit buffer of `show_async`, allocated on first use
+        self.tx = None
+        self.tx_busy = False
+        self.tx_pending = False
+        self.frame_ms = 0
+        self.next_frame = time.ticks_ms()
         super().__init__(self.buffer, self.width, self.height, framebuf.MONO_VLSB)
         self.init_display()
 
@@ -94,14 +104,59 @@ class SSD1306(framebuf.FrameBuffer):
             # displays with width of 64 pixels are shifted by 32
             x0 += 32
             x1 += 32
-        self.write_cmd(SET_COL_ADDR)
-        self.write_cmd(x0)
-        self.write_cmd(x1)
-        self.write_cmd(SET_PAGE_ADDR)
-        self.write_cmd(0)
-        self.write_cmd(self.pages - 1)
+        cmds = self.addr_cmds
+        cmds[0] = SET_COL_ADDR
+        cmds[1] = x0
+        cmds[2] = x1
+        cmds[3] = SET_PAGE_ADDR
+        cmds[4] = 0
+        cmds[5] = self.pages - 1
+        self.write_cmds(cmds)
         self.write_data(self.buffer)
 
+    def set_max_fps(self, fps):
+        # Frames requested faster are merged, 0 = no limit
+        self.frame_ms = 1000 // fps if fps else 0
+
+    async def show_async(self):
+        # Refresh without blocking other tasks: the frame is copied to
+        # a transmit buffer and sent one page per scheduler slice, so
+        # the next frame can be drawn meanwhile. Calls made during a
+        # transfer are coalesced into one more frame.
+        if self.tx_busy:
+            self.tx_pending = True
+            return
+        if self.tx is None:
+            self.tx = bytearray(len(self.buffer))
+            mv = memoryview(self.tx)
+            self.tx_pages = [mv[self.width * p:self.width * (p + 1)]
+                             for p in range(self.pages)]
+        x0 = 32 if self.width == 64 else 0
+        cmds = self.addr_cmds
+        self.tx_busy = True
+        try:
+            while True:
+                self.tx_pending = False
+                wait = time.ticks_diff(self.next_frame, time.ticks_ms())
+                if wait > 0:
+                    await asyncio.sleep_ms(wait)
+                self.next_frame = time.ticks_add(time.ticks_ms(), self.frame_ms)
+                self.tx[:] = self.buffer
+                for page in range(self.pages):
+                    cmds[0] = SET_COL_ADDR
+                    cmds[1] = x0
+                    cmds[2] = x0 + self.width - 1
+                    cmds[3] = SET_PAGE_ADDR
+                    cmds[4] = page
+                    cmds[5] = page
+                    self.write_cmds(cmds)
+                    self.write_data(self.tx_pages[page])
+                    await asyncio.sleep_ms(0)
+                if not self.tx_pending:
+                    break
+        finally:
+            self.tx_busy = False
+
 
 class SSD1306_I2C(SSD1306):
     def __init__(self, width, height, i2c, addr=0x3C, external_vcc=False):
@@ -109,6 +164,7 @@ class SSD1306_I2C(SSD1306):
         self.addr = addr
         self.temp = bytearray(2)
         self.write_list = [b"\x40", None]  # Co=0, D/C#=1
+        self.cmd_list = [b"\x00", None]  # Co=0, D/C#=0
         super().__init__(width, height, external_vcc)
 
     def write_cmd(self, cmd):
@@ -116,6 +172,11 @@ class SSD1306_I2C(SSD1306):
         self.temp[1] = cmd
         self.i2c.writeto(self.addr, self.temp)
 
+    def write_cmds(self, buf):
+        # All bytes following the control byte are commands
+        self.cmd_list[1] = buf
+        self.i2c.writevto(self.addr, self.cmd_list)
+
     def write_data(self, buf):
         self.write_list[1] = buf
         self.i2c.writevto(self.addr, self.write_list)
@@ -131,6 +192,7 @@ class SSD1306_SPI(SSD1306):
         self.dc = dc
         self.res = res
         self.cs = cs
+        self.cmd_buf = bytearray(1)
         import time
 
         self.res(1)
@@ -145,7 +207,16 @@ class SSD1306_SPI(SSD1306):
         self.cs(1)
         self.dc(0)
         self.cs(0)
-        self.spi.write(bytearray([cmd]))
+        self.cmd_buf[0] = cmd
+        self.spi.write(self.cmd_buf)
+        self.cs(1)
+
+    def write_cmds(self, buf):
+        self.spi.init(baudrate=self.rate, polarity=0, phase=0)
+        self.cs(1)
+        self.dc(0)
+        self.cs(0)
+        self.spi.write(buf)
         self.cs(1)
 
     def write_data(self, buf):
@@ -0,0 +1,275 @@
+"""
+This module provides a common base class for I2C sensors and other
+devices with a register map. It keeps preallocated buffers for all
+register transfers, so reading a value does not create a new bytes
+object on every call. Consecutive registers can be read in one I2C
+transaction and decoded with `struct.unpack_from`. Written registers
+are kept in a shadow copy, so read-modify-write updates do not have
+to read the register back from the device.
+
+Example
+-------
+.. code-block:: python
+
+    from machine import I2C, Pin
+    from i2c_device import I2cDevice
+
+    i2c = I2C(0, scl=Pin(22), sda=Pin(21), freq=400_000)
+
+    # MPU6050 accelerometer at address 0x68
+    mpu = I2cDevice(i2c, 0x68)
+    mpu.write_u8(0x6b, 0)  # Wake up the sensor
+
+    # Read all three acceleration axes in a single transaction
+    ax, ay, az = mpu.unpack(0x3b, ">hhh")
+
+Author
+------
+Tomas Fryza
+
+Modification history
+--------------------
+- **2026-10-18** : File created, initial release.
+"""
+
+import struct
+
+
+class I2cDevice:
+    """
+    Base class for I2C devices accessed through registers.
+    """
+
+    def __init__(self, i2c, addr, buf_size=16, addrsize=8):
+        """
+        Initialize the device and allocate its transfer buffers.
+
+        :param i2c: I2C bus object.
+        :param addr: I2C address of the device.
+        :param buf_size: Size of the read buffer, i.e. the longest block
+                         read by `read_block`, `read_raw` or `unpack`.
+        :param addrsize: Register address size in bits (8 or 16).
+        """
+        self.i2c = i2c
+        self.addr = addr
+        self.addrsize = addrsize
+        self._buf = bytearray(buf_size)
+        self._mv = memoryview(self._buf)
+        self._views = {}
+        self._wbuf = bytearray(2)
+        self._w1 = memoryview(self._wbuf)[:1]
+        self._shadow = {}
+
+    def _view(self, n):
+        """
+        Return a memoryview of the first `n` bytes of the read buffer.
+        Views are created once and reused by all later calls.
+
+        :param n: Number of bytes.
+        :raises ValueError: If `n` exceeds the buffer size.
+        """
+        view = self._views.get(n)
+        if view is None:
+            if n > len(self._buf):
+                raise ValueError(f"Block of {n} bytes exceeds buffer size")
+            view = self._mv[:n]
+            self._views[n] = view
+        return view
+
+    def read_into(self, reg, buf):
+        """
+        Read `len(buf)` consecutive registers into a caller's buffer.
+
+        :param reg: Address of the first register.
+        :param buf: Buffer to be filled.
+        """
+        self.i2c.readfrom_mem_into(self.addr, reg, buf, addrsize=self.addrsize)
+
+    def read_block(self, reg, n):
+        """
+        Read `n` consecutive registers in one I2C transaction.
+
+        :param reg: Address of the first register.
+        :param n: Number of bytes to read.
+        :returns: A memoryview of the internal buffer. It is valid
+                  until the next read from the device.
+        """
+        view = self._view(n)
+        self.i2c.readfrom_mem_into(self.addr, reg, view, addrsize=self.addrsize)
+        return view
+
+    def unpack(self, reg, fmt, size=None):
+        """
+        Read a block of registers and decode it by `struct.unpack_from`.
+
+        :param reg: Address of the first register.
+        :param fmt: Format string, such as `">hhh"`.
+        :param size: Block size in bytes; computed from `fmt` if not given.
+        :returns: A tuple of decoded values.
+        """
+        if size is None:
+            size = struct.calcsize(fmt)
+        return struct.unpack_from(fmt, self.read_block(reg, size))
+
+    def read_u8(self, reg):
+        """
+        Read an unsigned 8-bit register.
+
+        :param reg: Register address.
+        :returns: Register value (0 to 255).
+        """
+        view = self._view(1)
+        self.i2c.readfrom_mem_into(self.addr, reg, view, addrsize=self.addrsize)
+        self._shadow[reg] = view[0]
+        return view[0]
+
+    def read_s8(self, reg):
+        """
+        Read a signed 8-bit register.
+
+        :param reg: Register address.
+        :returns: Register value (-128 to 127).
+        """
+        val = self.read_u8(reg)
+        return val - 256 if val > 127 else val
+
+    def read_u16(self, reg, little_endian=False):
+        """
+        Read an unsigned 16-bit value from two consecutive registers.
+
+        :param reg: Address of the first register.
+        :param little_endian: Byte order; big endian by default.
+        :returns: Register value (0 to 65535).
+        """
+        view = self._view(2)
+        self.i2c.readfrom_mem_into(self.addr, reg, view, addrsize=self.addrsize)
+        if little_endian:
+            val = view[0] | (view[1] << 8)
+        else:
+            val = (view[0] << 8) | view[1]
+        self._shadow[reg] = val
+        return val
+
+    def read_s16(self, reg, little_endian=False):
+        """
+        Read a signed 16-bit value from two consecutive registers.
+
+        :param reg: Address of the first register.
+        :param little_endian: Byte order; big endian by default.
+        :returns: Register value (-32768 to 32767).
+        """
+        val = self.read_u16(reg, little_endian)
+        return val - 65536 if val > 32767 else val
+
+    def read_raw(self, n):
+        """
+        Read `n` bytes from the device without a register address,
+        e.g. the response to a previously written command.
+
+        :param n: Number of bytes to read.
+        :returns: A memoryview of the internal buffer.
+        """
+        view = self._view(n)
+        self.i2c.readfrom_into(self.addr, view)
+        return view
+
+    def write_u8(self, reg, val):
+        """
+        Write an 8-bit register and store the value in the shadow copy.
+
+        :param reg: Register address.
+        :param val: Value to be written.
+        """
+        val &= 0xff
+        self._w1[0] = val
+        self.i2c.writeto_mem(self.addr, reg, self._w1, addrsize=self.addrsize)
+        self._shadow[reg] = val
+
+    def write_u16(self, reg, val, little_endian=False):
+        """
+        Write a 16-bit value to two consecutive registers and store it
+        in the shadow copy.
+
+        :param reg: Address of the first register.
+        :param val: Value to be written.
+        :param little_endian: Byte order; big endian by default.
+        """
+        val &= 0xffff
+        buf = self._wbuf
+        if little_endian:
+            buf[0] = val & 0xff
+            buf[1] = val >> 8
+        else:
+            buf[0] = val >> 8
+            buf[1] = val & 0xff
+        self.i2c.writeto_mem(self.addr, reg, buf, addrsize=self.addrsize)
+        self._shadow[reg] = val
+
+    def write_block(self, reg, buf):
+        """
+        Write a buffer to consecutive registers. The shadow copy is
+        not updated.
+
+        :param reg: Address of the first register.
+        :param buf: Data to be written.
+        """
+        self.i2c.writeto_mem(self.addr, reg, buf, addrsize=self.addrsize)
+
+    def write_raw(self, buf):
+        """
+        Write a buffer to the device without a register address.
+
+        :param buf: Data to be written.
+        """
+        self.i2c.writeto(self.addr, buf)
+
+    def update_u8(self, reg, mask, val):
+        """
+        Change selected bits of an 8-bit register. The current value is
+        taken from the shadow copy and read from the device only if the
+        register has not been accessed yet.
+
+        :param reg: Register address.
+        :param mask: Bits to be changed.
+        :param val: New value of the masked bits.
+        """
+        cur = self._shadow.get(reg)
+        if cur is None:
+            cur = self.read_u8(reg)
+        self.write_u8(reg, (cur & ~mask) | (val & mask))
+
+    def update_u16(self, reg, mask, val, little_endian=False):
+        """
+        Change selected bits of a 16-bit register, see `update_u8`.
+
+        :param reg: Address of the first register.
+        :param mask: Bits to be changed.
+        :param val: New value of the masked bits.
+        :param little_endian: Byte order; big endian by default.
+        """
+        cur = self._shadow.get(reg)
+        if cur is None:
+            cur = self.read_u16(reg, little_endian)
+        self.write_u16(reg, (cur & ~mask) | (val & mask), little_endian)
+
+    def cached(self, reg):
+        """
+        Return the last value written to or read from a register, or
+        `None` if the register has not been accessed yet. No I2C
+        transfer is performed.
+
+        :param reg: Register address.
+        """
+        return self._shadow.get(reg)
+
+    def invalidate(self, reg=None):
+        """
+        Drop the shadow copy of one register, or of all registers, e.g.
+        after a device reset or when the device changes its bits.
+
+        :param reg: Register address; all registers if `None`.
+        """
+        if reg is None:
+            self._shadow.clear()
+        elif reg in self._shadow:
+            del self._shadow[reg]
@@ -17,6 +17,7 @@
 #
 
 from machine import RTC
+from i2c_device import I2cDevice
 
 random_access_address = 17
 
@@ -57,6 +58,11 @@ RDA5807M_FLG_TUNE = 0x0010
 RDA5807M_FLG_DE = 0x0800
 RDA5807M_FLG_SOFTMUTE = 0x0200
 RDA5807M_FLG_AFCD = 0x0100
+
+# Bits cleared by the chip when the operation is done; they are not
+# kept in the shadow copy, so an unrelated update does not repeat it
+_SELF_CLEARING = {RDA5807M_REG_CONFIG: RDA5807M_FLG_SEEK,
+                  RDA5807M_REG_TUNING: RDA5807M_FLG_TUNE}
 RDA5807P_FLG_INTMODE = 0x8000
 RDA5807M_FLG_EASTBAND65M = 0x0200
 RDA5807M_FLG_SOFTBLEND = 0x0002
@@ -88,7 +94,7 @@ rds_program_types_europe = [
 "Country Music", "National Music", "Oldies Music", "Folk Music", "Documentary",
 "Alarm Test","Alarm"]
 
-class Radio:
+class Radio(I2cDevice):
 
     """ Access RDA5807M Device """
     
@@ -104,7 +110,7 @@ class Radio:
 
         """
 
-        self.i2c = i2c
+        super().__init__(i2c, random_access_address)
         self.mute_flag = False
         self.bass_boost_flag = True
         self.mono = False
@@ -173,24 +179,35 @@ class Radio:
 
         """ Read data from i2c register """
 
-        self.i2c.writeto(random_access_address, bytes([reg]))
-        data = self.i2c.readfrom(random_access_address, 2)
-        return (data[0] << 8) | data[1]
+        return self.read_u16(reg)
 
     def write_reg(self, reg, data):
 
         """ Write data to i2c register """
 
-        data = bytes([reg, data >> 8, data&0xff])
-        self.i2c.writeto(random_access_address, data)
+        self.write_u16(reg, data)
+        self._drop_self_clearing(reg)
         
     def update_reg(self, reg, mask, value):
 
-        """ Update specific bits in I2C register """
+        """ Update specific bits in I2C register
+
+        The current value is taken from the shadow copy of the register
+        (last value written or read), so no read transfer is needed.
+        Self-clearing bits (SEEK, TUNE) are set only if `mask` and
+        `value` ask for them """
+
+        bits = _SELF_CLEARING.get(reg, 0)
+        self.update_u16(reg, mask | bits, value & mask)
+        self._drop_self_clearing(reg)
+
+    def _drop_self_clearing(self, reg):
+
+        """ Remove self-clearing bits from the shadow copy """
 
-        data = self.read_reg(reg)
-        data = (data & ~mask) | value
-        self.write_reg(reg, data)
+        bits = _SELF_CLEARING.get(reg)
+        if bits and reg in self._shadow:
+            self._shadow[reg] &= ~bits
         
     def set_volume(self, volume):
 
@@ -304,9 +321,10 @@ class Radio:
         if (self.read_reg(RDA5807M_REG_STATUS) & 0x8000):
         
             #check for uncorrectable errors
-            if (self.read_reg(RDA5807M_REG_RSSI) & 0x3) == 0x3:
+            errors = self.read_reg(RDA5807M_REG_RSSI)
+            if (errors & 0x3) == 0x3:
                 return False
-            if (self.read_reg(RDA5807M_REG_RSSI) & 0xc) == 0xc:
+            if (errors & 0xc) == 0xc:
                 return False
             
             a, b, c, d = self.get_rds_block_group()           
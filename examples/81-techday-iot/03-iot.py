@@ -5,27 +5,36 @@ This script connects to a DHT12 temperature and humidity
 sensor and transmits the collected data to ThingSpeak
 using Wi-Fi via either GET or POST request.
 
-Requires: wifi_utils, dht12 modules and config script
+Samples are stored in a queue on flash first and sent oldest
+first when Wi-Fi is available, so no data is lost while the
+network is down. Wi-Fi is turned on only every 15 samples, which
+are uploaded by one ThingSpeak bulk update request.
+
+Requires: wifi_utils, dht12, thingspeak, telemetry_queue modules
+and config script
 
 Instructions:
 - Go to `https://thingspeak.com` and log in to your account
 - Create a new channel with two fields:
   - Field 1: Temperature
   - Field 2: Humidity
-- Copy the `Write API Key` -- you will need it here
+- Copy the `Channel ID` and `Write API Key` -- you will need them here
 - Store your Wi-Fi SSID and password to `config.py`
 
 Author(s):
 - Tomas Fryza
 
 Creation date: 2023-06-18
-Last modified: 2026-05-11
+Last modified: 2026-10-18
 """
 
 # MicroPython builtin modules
 from machine import Pin, I2C
 from time import sleep
+import time
+import struct
 from network import WLAN, STA_IF
+import ntptime
 
 # External modules
 from dht12 import DHT12
@@ -33,14 +42,37 @@ from bme280 import BME280
 import thingspeak
 import wifi_utils
 import config
+from telemetry_queue import TelemetryQueue
 
+CHANNEL_ID = "YOUR_THINGSPEAK_CHANNEL_ID"
 API_KEY = "YOUR_THINGSPEAK_WRITE_API_KEY"
+SAMPLE_PERIOD_S = 60
+UPLOAD_EVERY = 15  # Samples, i.e. 4 uploads per hour
 
 i2c = I2C(0, scl=Pin(22), sda=Pin(21), freq=100_000)
 sensor = DHT12(i2c)  # 1st variant
 # sensor = BME280(i2c)  # 2nd variant
 wifi = WLAN(STA_IF)
 
+# Samples waiting for upload, up to 16 x 4 kB on flash
+queue = TelemetryQueue("/queue", segment_size=4096, max_segments=16)
+client = thingspeak.BulkClient(CHANNEL_ID, API_KEY)
+
+
+def upload(records):
+    """Send queued samples (time, temperature, humidity)"""
+    client.clear()
+    for record in records:
+        t, temp, humid = struct.unpack("<Iff", record)
+        # Without a valid clock, ThingSpeak uses the time of arrival
+        if time.gmtime(t)[0] < 2024:
+            t = None
+        client.add(round(temp, 1), round(humid, 1), created_at=t)
+    # Number of samples accepted, the rest stays in the queue
+    return client.flush()
+
+
+samples = 0
 try:
     while True:
         temp, humid = sensor.read_values()  # 1st variant
@@ -48,11 +80,23 @@ try:
         print()
         print(f"T={temp:.1f}°C, H={humid:.1f}%")
 
-        wifi_utils.connect(wifi, config.SSID, config.PSWD)
-        thingspeak.send(temp, humid, API_KEY)
-        wifi_utils.disconnect(wifi)
+        queue.put(struct.pack("<Iff", time.time(), temp, humid))
+        samples += 1
+
+        # First sample after start, and then every 15th
+        if (samples - 1) % UPLOAD_EVERY == 0:
+            if wifi_utils.connect(wifi, config.SSID, config.PSWD):
+                if time.gmtime()[0] < 2024:
+                    try:
+                        ntptime.settime()  # Time stamps of queued samples
+                    except OSError:
+                        pass
+                # Up to 2 x 60 oldest samples, so a backlog drains
+                queue.drain(upload, batch=60, max_batches=2)
+                wifi_utils.disconnect(wifi)
+        print(f"Queued: {queue.pending_bytes()} bytes")
 
-        sleep(60)
+        sleep(SAMPLE_PERIOD_S)
 
 except KeyboardInterrupt:
     print()
@@ -2,6 +2,7 @@
 
 # from machine import I2C
 import time
+from i2c_device import I2cDevice
 
 # BME280 default address
 BME280_I2CADDR = 0x76
@@ -13,6 +14,28 @@ BME280_OSAMPLE_4 = 3
 BME280_OSAMPLE_8 = 4
 BME280_OSAMPLE_16 = 5
 
+# Power modes (ctrl_meas register, bits 1..0)
+BME280_SLEEP_MODE = 0
+BME280_FORCED_MODE = 1
+BME280_NORMAL_MODE = 3
+
+# Standby time between conversions in normal mode (config register, t_sb)
+BME280_STANDBY_0_5 = 0  # 0.5 ms
+BME280_STANDBY_62_5 = 1  # 62.5 ms
+BME280_STANDBY_125 = 2  # 125 ms
+BME280_STANDBY_250 = 3  # 250 ms
+BME280_STANDBY_500 = 4  # 500 ms
+BME280_STANDBY_1000 = 5  # 1000 ms
+BME280_STANDBY_10 = 6  # 10 ms
+BME280_STANDBY_20 = 7  # 20 ms
+
+# IIR filter coefficient (config register, filter)
+BME280_FILTER_OFF = 0
+BME280_FILTER_2 = 1
+BME280_FILTER_4 = 2
+BME280_FILTER_8 = 3
+BME280_FILTER_16 = 4
+
 # BME280 temperature registers
 BME280_REGISTER_DIG_T1 = 0x88  # Trimming parameter registers
 BME280_REGISTER_DIG_T2 = 0x8A
@@ -41,6 +64,7 @@ BME280_REGISTER_VERSION = 0xD1
 BME280_REGISTER_SOFTRESET = 0xE0
 
 BME280_REGISTER_CONTROL_HUM = 0xF2
+BME280_REGISTER_STATUS = 0xF3
 BME280_REGISTER_CONTROL = 0xF4
 BME280_REGISTER_CONFIG = 0xF5
 BME280_REGISTER_PRESSURE_DATA = 0xF7
@@ -48,72 +72,62 @@ BME280_REGISTER_TEMP_DATA = 0xFA
 BME280_REGISTER_HUMIDITY_DATA = 0xFD
 
 
-class Device:
+class Device(I2cDevice):
     """Class for communicating with an I2C device.
 
     Allows reading and writing 8-bit, 16-bit, and byte array values to
-    registers on the device."""
+    registers on the device. All transfers use the preallocated buffers
+    of `I2cDevice`."""
 
     def __init__(self, address, i2c):
         """Create an instance of the I2C device at the specified address using
         the specified I2C interface object."""
+        # Buffer is large enough for the 24 bytes of T/P calibration data
+        super().__init__(i2c, address, buf_size=24)
         self._address = address
         self._i2c = i2c
 
     def writeRaw8(self, value):
         """Write an 8-bit value on the bus (without register)."""
-        value = value & 0xFF
-        self._i2c.writeto(self._address, value)
+        self._w1[0] = value & 0xFF
+        self.write_raw(self._w1)
 
     def write8(self, register, value):
         """Write an 8-bit value to the specified register."""
-        b = bytearray(1)
-        b[0] = value & 0xFF
-        self._i2c.writeto_mem(self._address, register, b)
+        self.write_u8(register, value)
 
     def write16(self, register, value):
         """Write a 16-bit value to the specified register."""
-        value = value & 0xFFFF
-        b = bytearray(2)
-        b[0] = value & 0xFF
-        b[1] = (value >> 8) & 0xFF
-        self.i2c.writeto_mem(self._address, register, value)
+        self.write_u16(register, value, little_endian=True)
+
+    def readinto(self, register, buf):
+        """Read `len(buf)` consecutive registers starting at the specified
+        register into a preallocated buffer (single I2C transaction)."""
+        self.read_into(register, buf)
 
     def readRaw8(self):
         """Read an 8-bit value on the bus (without register)."""
-        return int.from_bytes(
-            self._i2c.readfrom(self._address, 1), 'little') & 0xFF
+        return self.read_raw(1)[0]
 
     def readU8(self, register):
         """Read an unsigned byte from the specified register."""
-        return int.from_bytes(
-            self._i2c.readfrom_mem(self._address, register, 1), 'little') & 0xFF
+        return self.read_u8(register)
 
     def readS8(self, register):
         """Read a signed byte from the specified register."""
-        result = self.readU8(register)
-        if result > 127:
-            result -= 256
-        return result
+        return self.read_s8(register)
 
     def readU16(self, register, little_endian=True):
         """Read an unsigned 16-bit value from the specified register, with the
         specified endianness (default little endian, or least significant byte
         first)."""
-        result = int.from_bytes(
-            self._i2c.readfrom_mem(self._address, register, 2), 'little') & 0xFFFF
-        if not little_endian:
-            result = ((result << 8) & 0xFF00) + (result >> 8)
-        return result
+        return self.read_u16(register, little_endian)
 
     def readS16(self, register, little_endian=True):
         """Read a signed 16-bit value from the specified register, with the
         specified endianness (default little endian, or least significant byte
         first)."""
-        result = self.readU16(register, little_endian)
-        if result > 32767:
-            result -= 65536
-        return result
+        return self.read_s16(register, little_endian)
 
     def readU16LE(self, register):
         """Read an unsigned 16-bit value from the specified register, in little
@@ -157,74 +171,167 @@ class BME280:
         self._device.write8(BME280_REGISTER_CONTROL, 0x3F)
         self.t_fine = 0
 
-    def _load_calibration(self):
-        self.dig_T1 = self._device.readU16LE(BME280_REGISTER_DIG_T1)
-        self.dig_T2 = self._device.readS16LE(BME280_REGISTER_DIG_T2)
-        self.dig_T3 = self._device.readS16LE(BME280_REGISTER_DIG_T3)
-
-        self.dig_P1 = self._device.readU16LE(BME280_REGISTER_DIG_P1)
-        self.dig_P2 = self._device.readS16LE(BME280_REGISTER_DIG_P2)
-        self.dig_P3 = self._device.readS16LE(BME280_REGISTER_DIG_P3)
-        self.dig_P4 = self._device.readS16LE(BME280_REGISTER_DIG_P4)
-        self.dig_P5 = self._device.readS16LE(BME280_REGISTER_DIG_P5)
-        self.dig_P6 = self._device.readS16LE(BME280_REGISTER_DIG_P6)
-        self.dig_P7 = self._device.readS16LE(BME280_REGISTER_DIG_P7)
-        self.dig_P8 = self._device.readS16LE(BME280_REGISTER_DIG_P8)
-        self.dig_P9 = self._device.readS16LE(BME280_REGISTER_DIG_P9)
+        # Forced mode with the same oversampling for all channels
+        self._power_mode = BME280_FORCED_MODE
+        self._set_oversampling(mode, mode, mode)
 
-        self.dig_H1 = self._device.readU8(BME280_REGISTER_DIG_H1)
-        self.dig_H2 = self._device.readS16LE(BME280_REGISTER_DIG_H2)
-        self.dig_H3 = self._device.readU8(BME280_REGISTER_DIG_H3)
-        self.dig_H6 = self._device.readS8(BME280_REGISTER_DIG_H7)
+        # Raw values of the last burst read
+        self._adc_t = 0
+        self._adc_p = 0
+        self._adc_h = 0
 
-        h4 = self._device.readS8(BME280_REGISTER_DIG_H4)
-        h4 = (h4 << 24) >> 20
-        self.dig_H4 = h4 | (self._device.readU8(BME280_REGISTER_DIG_H5) & 0x0F)
+    def _load_calibration(self):
+        # Temperature and pressure trimming parameters, 0x88..0x9F
+        (self.dig_T1, self.dig_T2, self.dig_T3,
+         self.dig_P1, self.dig_P2, self.dig_P3, self.dig_P4, self.dig_P5,
+         self.dig_P6, self.dig_P7, self.dig_P8, self.dig_P9) = \
+            self._device.unpack(BME280_REGISTER_DIG_T1, '<HhhHhhhhhhhh')
 
-        h5 = self._device.readS8(BME280_REGISTER_DIG_H6)
-        h5 = (h5 << 24) >> 20
-        self.dig_H5 = h5 | (
-            self._device.readU8(BME280_REGISTER_DIG_H5) >> 4 & 0x0F)
+        # Humidity trimming parameters, 0xA1 and 0xE1..0xE7
+        self.dig_H1 = self._device.readU8(BME280_REGISTER_DIG_H1)
+        buf = self._device.read_block(BME280_REGISTER_DIG_H2, 7)
+        self.dig_H2 = buf[0] | (buf[1] << 8)
+        if self.dig_H2 > 32767:
+            self.dig_H2 -= 65536
+        self.dig_H3 = buf[2]
+        h4 = buf[3] - 256 if buf[3] > 127 else buf[3]
+        self.dig_H4 = (h4 << 4) | (buf[4] & 0x0F)
+        h5 = buf[5] - 256 if buf[5] > 127 else buf[5]
+        self.dig_H5 = (h5 << 4) | (buf[4] >> 4 & 0x0F)
+        self.dig_H6 = buf[6] - 256 if buf[6] > 127 else buf[6]
+
+    def _set_oversampling(self, osrs_t, osrs_p, osrs_h):
+        """Store per-channel oversampling and the worst-case conversion
+        time of one measurement."""
+        for osrs in (osrs_t, osrs_p, osrs_h):
+            if osrs not in [BME280_OSAMPLE_1, BME280_OSAMPLE_2,
+                            BME280_OSAMPLE_4, BME280_OSAMPLE_8,
+                            BME280_OSAMPLE_16]:
+                raise ValueError(
+                    'Unexpected oversampling value {0}'.format(osrs))
+        self._osrs_h = osrs_h
+        self._ctrl_meas = osrs_t << 5 | osrs_p << 2
+
+        sleep_time = 1250 + 2300 * (1 << osrs_t)
+        sleep_time = sleep_time + 2300 * (1 << osrs_p) + 575
+        sleep_time = sleep_time + 2300 * (1 << osrs_h) + 575
+        self._sleep_time = sleep_time
+
+    def configure(self, mode=BME280_NORMAL_MODE, standby=BME280_STANDBY_0_5,
+                  iir_filter=BME280_FILTER_OFF, osrs_t=None, osrs_p=None,
+                  osrs_h=None):
+        """
+        Configure the power mode, standby time, IIR filter and
+        per-channel oversampling of the sensor.
+
+        In normal mode the sensor converts continuously and the data
+        registers always hold the latest result, so reads do not wait
+        for a conversion at all.
+
+        :param mode: `BME280_NORMAL_MODE`, `BME280_FORCED_MODE` or
+                     `BME280_SLEEP_MODE`.
+        :param standby: Standby time between conversions in normal
+                        mode, one of `BME280_STANDBY_*`.
+        :param iir_filter: IIR filter coefficient, one of
+                           `BME280_FILTER_*`.
+        :param osrs_t: Temperature oversampling (default: constructor mode).
+        :param osrs_p: Pressure oversampling (default: constructor mode).
+        :param osrs_h: Humidity oversampling (default: constructor mode).
+        """
+        if mode not in [BME280_SLEEP_MODE, BME280_FORCED_MODE,
+                        BME280_NORMAL_MODE]:
+            raise ValueError('Unexpected power mode {0}'.format(mode))
+        if not 0 <= standby <= 7:
+            raise ValueError('Unexpected standby value {0}'.format(standby))
+        if not 0 <= iir_filter <= 4:
+            raise ValueError('Unexpected filter value {0}'.format(iir_filter))
+        self._set_oversampling(
+            self._mode if osrs_t is None else osrs_t,
+            self._mode if osrs_p is None else osrs_p,
+            self._mode if osrs_h is None else osrs_h)
+        self._power_mode = mode
+
+        # Writes to the config register may be ignored in normal mode
+        self._device.write8(BME280_REGISTER_CONTROL, BME280_SLEEP_MODE)
+        self._device.write8(BME280_REGISTER_CONFIG,
+                            standby << 5 | iir_filter << 2)
+        # Changes of ctrl_hum become effective after a write to ctrl_meas
+        self._device.write8(BME280_REGISTER_CONTROL_HUM, self._osrs_h)
+        if mode == BME280_NORMAL_MODE:
+            self._device.write8(BME280_REGISTER_CONTROL,
+                                self._ctrl_meas | BME280_NORMAL_MODE)
+
+    def start_measurement(self):
+        """Trigger one forced conversion without waiting for its result.
+        Does nothing in normal mode, where the sensor converts on its own."""
+        if self._power_mode == BME280_NORMAL_MODE:
+            return
+        self._device.write8(BME280_REGISTER_CONTROL_HUM, self._osrs_h)
+        self._device.write8(BME280_REGISTER_CONTROL,
+                            self._ctrl_meas | BME280_FORCED_MODE)
+
+    def is_measuring(self):
+        """Return `True` while a conversion is running (status register,
+        bit `measuring`)."""
+        return bool(self._device.read_u8(BME280_REGISTER_STATUS) & 0x08)
+
+    def _force_measurement(self):
+        """Start one forced conversion of all channels and wait for it.
+        Does nothing in normal mode."""
+        if self._power_mode == BME280_NORMAL_MODE:
+            return
+        self.start_measurement()
+        time.sleep_us(self._sleep_time)  # Wait the required time
+
+    def read_raw_data(self):
+        """Trigger one forced conversion and read all measurement registers
+        (0xF7 to 0xFE) in a single I2C transaction.
+
+        :returns: Tuple of raw (uncompensated) temperature, pressure and
+                  humidity values taken from the same conversion.
+        """
+        self._force_measurement()
+        self._read_raw_registers()
+        return self._adc_t, self._adc_p, self._adc_h
+
+    def _read_raw_registers(self):
+        """Burst read of the measurement registers without triggering
+        a new conversion. Raw values are stored in `_adc_t`, `_adc_p`
+        and `_adc_h`."""
+        buf = self._device.read_block(BME280_REGISTER_PRESSURE_DATA, 8)
+        self._adc_p = ((buf[0] << 16) | (buf[1] << 8) | buf[2]) >> 4
+        self._adc_t = ((buf[3] << 16) | (buf[4] << 8) | buf[5]) >> 4
+        self._adc_h = (buf[6] << 8) | buf[7]
 
     def read_raw_temp(self):
         """Reads the raw (uncompensated) temperature from the sensor."""
-        meas = self._mode
-        self._device.write8(BME280_REGISTER_CONTROL_HUM, meas)
-        meas = self._mode << 5 | self._mode << 2 | 1
-        self._device.write8(BME280_REGISTER_CONTROL, meas)
-        sleep_time = 1250 + 2300 * (1 << self._mode)
-
-        sleep_time = sleep_time + 2300 * (1 << self._mode) + 575
-        sleep_time = sleep_time + 2300 * (1 << self._mode) + 575
-        time.sleep_us(sleep_time)  # Wait the required time
-        msb = self._device.readU8(BME280_REGISTER_TEMP_DATA)
-        lsb = self._device.readU8(BME280_REGISTER_TEMP_DATA + 1)
-        xlsb = self._device.readU8(BME280_REGISTER_TEMP_DATA + 2)
-        raw = ((msb << 16) | (lsb << 8) | xlsb) >> 4
+        self._force_measurement()
+        buf = self._device.read_block(BME280_REGISTER_TEMP_DATA, 3)
+        raw = ((buf[0] << 16) | (buf[1] << 8) | buf[2]) >> 4
         return raw
 
     def read_raw_pressure(self):
         """Reads the raw (uncompensated) pressure level from the sensor."""
         """Assumes that the temperature has already been read """
         """i.e. that enough delay has been provided"""
-        msb = self._device.readU8(BME280_REGISTER_PRESSURE_DATA)
-        lsb = self._device.readU8(BME280_REGISTER_PRESSURE_DATA + 1)
-        xlsb = self._device.readU8(BME280_REGISTER_PRESSURE_DATA + 2)
-        raw = ((msb << 16) | (lsb << 8) | xlsb) >> 4
+        buf = self._device.read_block(BME280_REGISTER_PRESSURE_DATA, 3)
+        raw = ((buf[0] << 16) | (buf[1] << 8) | buf[2]) >> 4
         return raw
 
     def read_raw_humidity(self):
         """Assumes that the temperature has already been read """
         """i.e. that enough delay has been provided"""
-        msb = self._device.readU8(BME280_REGISTER_HUMIDITY_DATA)
-        lsb = self._device.readU8(BME280_REGISTER_HUMIDITY_DATA + 1)
-        raw = (msb << 8) | lsb
+        raw = self._device.read_u16(BME280_REGISTER_HUMIDITY_DATA)
         return raw
 
     def read_temperature(self):
         """Get the compensated temperature in 0.01 of a degree celsius."""
-        adc = self.read_raw_temp()
-        var1 = ((adc >> 3) - (self.dig_T1 << 1)) * (self.dig_T2 >> 11)
+        return self._compensate_temperature(self.read_raw_temp())
+
+    def _compensate_temperature(self, adc):
+        """Compensate raw temperature, update `t_fine` and return the
+        temperature in 0.01 of a degree celsius."""
+        var1 = (((adc >> 3) - (self.dig_T1 << 1)) * self.dig_T2) >> 11
         var2 = ((
             (((adc >> 4) - self.dig_T1) * ((adc >> 4) - self.dig_T1)) >> 12) *
             self.dig_T3) >> 14
@@ -233,13 +340,17 @@ class BME280:
 
     def read_pressure(self):
         """Gets the compensated pressure in Pascals."""
-        adc = self.read_raw_pressure()
+        return self._compensate_pressure(self.read_raw_pressure())
+
+    def _compensate_pressure(self, adc):
+        """Compensate raw pressure using the current `t_fine` and return
+        the pressure in Pascals (Q24.8 format)."""
         var1 = self.t_fine - 128000
         var2 = var1 * var1 * self.dig_P6
         var2 = var2 + ((var1 * self.dig_P5) << 17)
         var2 = var2 + (self.dig_P4 << 35)
         var1 = (((var1 * var1 * self.dig_P3) >> 8) +
-                ((var1 * self.dig_P2) >> 12))
+                ((var1 * self.dig_P2) << 12))
         var1 = (((1 << 47) + var1) * self.dig_P1) >> 33
         if var1 == 0:
             return 0
@@ -249,14 +360,70 @@ class BME280:
         var2 = (self.dig_P8 * p) >> 19
         return ((p + var1 + var2) >> 8) + (self.dig_P7 << 4)
 
+    def _compensate_pressure_int32(self, adc):
+        """Compensate raw pressure with the 32-bit integer formula from
+        the Bosch datasheet and return the pressure in Pascals.
+
+        Products that do not fit into a MicroPython small integer
+        (31 bits on 32-bit ports) are split, so no big integers are
+        allocated for readings within the sensor operating range."""
+        var1 = (self.t_fine >> 1) - 64000
+        # ((var1 >> 2) * (var1 >> 2)) >> 11 computed from 11-bit halves
+        x = var1 >> 2
+        xh = x >> 11
+        xl = x & 0x7FF
+        sq = ((xh * xh) << 11) + 2 * xh * xl + ((xl * xl) >> 11)
+        var2 = sq * self.dig_P6
+        var2 = var2 + ((var1 * self.dig_P5) << 1)
+        var2 = (var2 >> 2) + (self.dig_P4 << 16)
+        # (((dig_P3 * (sq >> 2)) >> 3) + ((dig_P2 * var1) >> 1)) >> 18
+        # with var1 split into 11-bit halves
+        vh = var1 >> 11
+        vl = var1 & 0x7FF
+        var1 = (self.dig_P2 * vh +
+                ((((self.dig_P3 * (sq >> 2)) >> 3) +
+                  ((self.dig_P2 * vl) >> 1)) >> 10)) >> 8
+        # ((32768 + var1) * dig_P1) >> 15
+        var1 = self.dig_P1 + ((var1 * self.dig_P1) >> 15)
+        if var1 == 0:
+            return 0
+        p = (1048576 - adc) - (var2 >> 12)
+        # p * 3125 exceeds 31 bits, divide quotient and remainder separately
+        q = p // var1
+        r = p - q * var1
+        if p < 687195:  # p * 3125 < 0x80000000
+            p = q * 6250 + (r * 6250) // var1
+        else:
+            p = (q * 3125 + (r * 3125) // var1) * 2
+        var1 = (self.dig_P9 * (((p >> 3) * (p >> 3)) >> 13)) >> 12
+        var2 = ((p >> 2) * self.dig_P8) >> 13
+        return p + ((var1 + var2 + self.dig_P7) >> 4)
+
     def read_humidity(self):
-        adc = self.read_raw_humidity()
-        # print 'Raw humidity = {0:d}'.format (adc)
+        return self._compensate_humidity(self.read_raw_humidity())
+
+    def _compensate_humidity(self, adc):
+        """Compensate raw humidity using the current `t_fine` and return
+        the relative humidity in 1/1024 of a percent.
+
+        The formula from the Bosch datasheet is evaluated with split
+        products, so the intermediates stay within a MicroPython small
+        integer (31 bits on 32-bit ports) for readings within the
+        sensor operating range (-40..85 degC, below 100 %RH)."""
         h = self.t_fine - 76800
-        h = (((((adc << 14) - (self.dig_H4 << 20) - (self.dig_H5 * h)) + 16384) >> 15) * (((((((h * self.dig_H6) >> 10) * (((h *
-                                self.dig_H3) >> 11) + 32768)) >> 10) + 2097152) *
-                                self.dig_H2 + 8192) >> 14))
-        h = h - (((((h >> 15) * (h >> 15)) >> 7) * self.dig_H1) >> 4)
+        # ((adc << 14) - (dig_H4 << 20) - dig_H5 * h + 16384) >> 15
+        x = (adc >> 1) - (self.dig_H4 << 5) + \
+            ((((adc & 1) << 14) - self.dig_H5 * h + 16384) >> 15)
+        y = (((((h * self.dig_H6) >> 10) *
+               (((h * self.dig_H3) >> 11) + 32768)) >> 10) + 2097152)
+        h = x * ((y * self.dig_H2 + 8192) >> 14)
+        # (((h >> 15) * (h >> 15)) >> 7) from 7-bit halves
+        x = h >> 15
+        xh = x >> 7
+        xl = x & 0x7F
+        sq = ((xh * xh) << 7) + 2 * xh * xl + ((xl * xl) >> 7)
+        # (sq * dig_H1) >> 4
+        h = h - ((sq >> 4) * self.dig_H1 + (((sq & 0xF) * self.dig_H1) >> 4))
         h = 0 if h < 0 else h
         h = 419430400 if h > 419430400 else h
         return h >> 12
@@ -288,20 +455,82 @@ class BME280:
         h = (h / 1024)
         return h
 
-    def altitude(self, sea_level_pressure_hpa = 1013.25):
-        "Return the approximative altitude in meters."
-        p = self.pressure()
+    def altitude(self, sea_level_pressure_hpa = 1013.25, pressure=None):
+        """Return the approximative altitude in meters.
+
+        If `pressure` (in hPa) is given, e.g. from a previous burst read,
+        no new measurement is performed."""
+        p = self.pressure() if pressure is None else pressure
         # Barometric formula
         # https://www.omnicalculator.com/physics/air-pressure-at-altitude
         altitude = 44330 * (1 - (p/sea_level_pressure_hpa) ** (1/5.255))
         return altitude
 
-    def read_values(self):
+    def read_values(self, sea_level_pressure_hpa=1013.25):
         """
         Read temperature, humidity, pressure, and altitude
         from the sensor.
+
+        All values are compensated from a single forced conversion
+        fetched by one burst read; the altitude is derived from the
+        same pressure sample.
+        """
+        self._force_measurement()
+        self._read_raw_registers()
+        return self._compensate_values(sea_level_pressure_hpa)
+
+    def read_values_fixed(self, result=None, int32=True):
+        """
+        Read temperature, humidity, and pressure as fixed-point integers
+        without any floating-point arithmetic.
+
+        :param result: Optional preallocated list or `array('i')` of
+                       length 3. It is filled in place and returned, so
+                       the call does not allocate on the heap.
+        :param int32: Use the 32-bit pressure compensation (1 Pa
+                      resolution). With `False` the 64-bit formula is used
+                      (1/256 Pa resolution), which needs big integers.
+        :returns: Temperature in 0.01 °C, humidity in 1/1024 %RH (Q22.10),
+                  and pressure in 1/256 Pa (Q24.8).
+        """
+        self._force_measurement()
+        self._read_raw_registers()
+        t = self._compensate_temperature(self._adc_t)
+        h = self._compensate_humidity(self._adc_h)
+        if int32:
+            p = self._compensate_pressure_int32(self._adc_p) << 8
+        else:
+            p = self._compensate_pressure(self._adc_p)
+        if result is None:
+            return t, h, p
+        result[0] = t
+        result[1] = h
+        result[2] = p
+        return result
+
+    def poll_values(self, sea_level_pressure_hpa=1013.25):
+        """
+        Non-blocking variant of `read_values`.
+
+        In forced mode, call `start_measurement` first and then poll
+        until a tuple is returned. The status register is checked
+        instead of sleeping for the worst-case conversion time. In
+        normal mode the latest result is returned immediately.
+
+        :returns: Tuple of temperature, humidity, pressure, and altitude,
+                  or `None` while the conversion is still running.
         """
-        return self.temperature(), self.humidity(), self.pressure(), self.altitude()
+        if self._power_mode != BME280_NORMAL_MODE and self.is_measuring():
+            return None
+        self._read_raw_registers()
+        return self._compensate_values(sea_level_pressure_hpa)
+
+    def _compensate_values(self, sea_level_pressure_hpa):
+        """Compensate the last raw snapshot into physical values."""
+        t = self._compensate_temperature(self._adc_t) / 100
+        h = self._compensate_humidity(self._adc_h) / 1024
+        p = (self._compensate_pressure(self._adc_p) // 256) / 100
+        return t, h, p, self.altitude(sea_level_pressure_hpa, pressure=p)
 
 
 def demo():
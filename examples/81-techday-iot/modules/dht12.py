@@ -6,7 +6,8 @@ humidity data from the sensor.
 
 Classes
 -------
-- ``DHTBaseI2C`` : Base class for handling low-level I2C communication with the DHT12 sensor.
+- ``DHTBaseI2C`` : Base class for handling low-level I2C communication with the DHT12 sensor,
+  built on `i2c_device.I2cDevice`.
 - ``DHT1`` : Extends `DHTBaseI2C` to provide methods for reading temperature and humidity values.
 
 Attributes
@@ -37,19 +38,21 @@ Authors
 
 Modification history
 --------------------
+- **2026-10-18** : `DHTBaseI2C` derived from `I2cDevice`.
 - **2024-11-11** : Added Sphinx comments.
 - **2024-11-02** : Added `read_values` method.
 - **2023-11-10** : Added `scan` method.
 """
 
+from i2c_device import I2cDevice
+
 SENSOR_ADDR = 0x5c
 
 
-class DHTBaseI2C:
+class DHTBaseI2C(I2cDevice):
     def __init__(self, i2c, addr=SENSOR_ADDR):
-        self.i2c = i2c
-        self.addr = addr
-        self.buf = bytearray(5)
+        super().__init__(i2c, addr, buf_size=5)
+        self.buf = self._buf
         self.scan()
 
     def measure(self):
@@ -73,9 +76,8 @@ class DHTBaseI2C:
                 except Exception as e:
                     print("Checksum error:", e)
         """
-        buf = self.buf
         # Read 5 bytes from address 0 to the buffer
-        self.i2c.readfrom_mem_into(self.addr, 0, buf)
+        buf = self.read_block(0, 5)
         if (buf[0] + buf[1] + buf[2] + buf[3]) & 0xff != buf[4]:
             raise Exception(f"`{hex(SENSOR_ADDR)}` checksum error")
 
@@ -1,29 +1,223 @@
+import time
+import json
 import urequests
 
-API_URL = "https://api.thingspeak.com/update"
+API_HOST = "https://api.thingspeak.com"
+API_URL = API_HOST + "/update"
+MIN_INTERVAL_S = 15  # Rate limit of a free account
+MAX_FIELDS = 8
+MAX_BULK = 960  # Entries of one bulk update, free account
 
 
-def send(value1, value2, api_key):
+def iso_time(t):
     """
-    Send two parameters to ThingSpeak.
+    Format seconds from `time.time()` as ISO 8601 UTC time.
     """
+    tm = time.gmtime(t)
+    return "{:04d}-{:02d}-{:02d}T{:02d}:{:02d}:{:02d}Z".format(*tm[:6])
 
-    # Select GET or POST request
-    # Make the GET request
-    request_url = f"{API_URL}?api_key={api_key}&field1={value1}&field2={value2}"
+
+def update(values, api_key, created_at=None, url=API_URL):
+    """
+    Send one entry with up to 8 fields to ThingSpeak.
+
+    :param values: Values of field1, field2, ...; `None` skips a field.
+    :param created_at: Time of the values in seconds from
+                       `time.time()`; the time of arrival if `None`.
+    :param url: Address of the update endpoint.
+    :returns: `True` if ThingSpeak accepted the entry.
+    """
+    parts = [url, "?api_key=", api_key]
+    for i, value in enumerate(values):
+        if value is not None:
+            parts.append("&field%d=%s" % (i + 1, value))
+    if created_at is not None:
+        parts.append("&created_at=")
+        parts.append(iso_time(created_at))
     try:
-        response = urequests.get(request_url)
-        # print("Status code:", response.status_code)
+        response = urequests.get("".join(parts))
         print(f"ThingSpeak entry no.: {response.text}")
+        # Entry number, or 0 if the update was refused
+        ok = response.status_code == 200 and response.text.strip() != "0"
         response.close()
+        return ok
     except Exception as e:
         print("Error sending data:", e)
-        response = urequests.get(request_url)
-
-    # Make the POST request
-    # request_url = f"{API_URL}?api_key={API_KEY}"
-    # json = {"field1": value1, "field2": value2}
-    # headers = {"Content-Type": "application/json"}
-    # response = urequests.post(request_url, json=json, headers=headers)
-    # print(f"ThingSpeak entry no.: {response.text}")
-    # response.close()
+        return False
+
+
+def send(value1, value2, api_key, created_at=None):
+    """
+    Send two parameters to ThingSpeak. Failed requests are not
+    repeated here; queue the values and send them later instead,
+    see `telemetry_queue`.
+
+    :param created_at: Time of the values in seconds from
+                       `time.time()`; the time of arrival if `None`.
+    :returns: `True` if ThingSpeak accepted the entry.
+    """
+    return update((value1, value2), api_key, created_at)
+
+
+class BulkClient:
+    """
+    Buffer of time stamped samples uploaded to ThingSpeak by one
+    bulk update request instead of one request per sample.
+
+    Samples without time, or all samples if the bulk endpoint is
+    refused, are sent by single updates instead. Requests are at
+    least `min_interval_s` apart.
+
+    Example:
+
+        client = thingspeak.BulkClient(CHANNEL_ID, API_KEY)
+        client.add(23.5, 45.0, created_at=time.time())
+        ...
+        client.flush()  # Once per several minutes
+    """
+
+    def __init__(self, channel_id, api_key, host=API_HOST,
+                 max_samples=MAX_BULK, min_interval_s=MIN_INTERVAL_S):
+        """
+        :param channel_id: ID of the channel, or `None` for single
+                           updates only.
+        :param api_key: Write API key of the channel.
+        :param host: Address of the server, e.g. of a local stand-in.
+        :param max_samples: Largest number of buffered samples; the
+                            oldest sample is dropped when it is full.
+        :param min_interval_s: Shortest time between two requests.
+        """
+        self.api_key = api_key
+        self.update_url = host + "/update"
+        self.bulk_url = None if channel_id is None else \
+            "%s/channels/%s/bulk_update.json" % (host, channel_id)
+        self.max_samples = max_samples
+        self.min_interval_s = min_interval_s
+        self._samples = []  # Tuples (created_at, values)
+        self._last_ms = None  # End of the last request
+
+        self.requests = 0
+        self.bulk = 0  # Successful bulk updates
+        self.single = 0  # Successful single updates
+        self.uploaded = 0  # Samples accepted by the server
+        self.dropped = 0  # Samples dropped from a full buffer
+
+    def add(self, *values, created_at=None):
+        """
+        Buffer one sample.
+
+        :param values: Values of field1 up to field8.
+        :param created_at: Time of the sample in seconds from
+                           `time.time()`, or `None` if unknown.
+        """
+        if len(values) > MAX_FIELDS:
+            raise ValueError("too many fields")
+        if len(self._samples) >= self.max_samples:
+            self._samples.pop(0)
+            self.dropped += 1
+        self._samples.append((created_at, values))
+
+    def pending(self):
+        """
+        Return the number of buffered samples.
+        """
+        return len(self._samples)
+
+    def clear(self):
+        """
+        Drop all buffered samples.
+        """
+        self._samples = []
+
+    def _wait(self):
+        """
+        Sleep until the rate limit allows the next request.
+        """
+        if self._last_ms is not None:
+            left = self.min_interval_s * 1000 - \
+                time.ticks_diff(time.ticks_ms(), self._last_ms)
+            if left > 0:
+                time.sleep(left / 1000)
+        self.requests += 1
+
+    def _post_bulk(self, samples):
+        """
+        Send samples by one bulk update request.
+
+        :returns: `True` if accepted, `False` if not, or `None` if the
+                  bulk endpoint cannot be used.
+        """
+        updates = []
+        for (t, values) in samples:
+            entry = {"created_at": iso_time(t)}
+            for i, value in enumerate(values):
+                if value is not None:
+                    entry["field%d" % (i + 1)] = value
+            updates.append(entry)
+        body = json.dumps({"write_api_key": self.api_key,
+                           "updates": updates})
+        del updates
+        try:
+            response = urequests.post(
+                self.bulk_url, data=body,
+                headers={"Content-Type": "application/json"})
+            status = response.status_code
+            response.close()
+        except Exception as e:
+            print("Error sending data:", e)
+            return False
+        print(f"ThingSpeak bulk update: {len(samples)} entries, "
+              f"status {status}")
+        if status in (200, 202):
+            return True
+        if status in (401, 403, 429) or status >= 500:
+            # Wrong key, too early or server error, try later
+            return False
+        return None
+
+    def flush(self, max_requests=4):
+        """
+        Upload the buffered samples, oldest first. Time stamped
+        samples are sent by bulk updates, the others by single
+        updates.
+
+        :param max_requests: Largest number of requests of this call.
+        :returns: Number of samples uploaded and removed from the
+                  buffer.
+        """
+        done = 0
+        while self._samples and max_requests > 0:
+            max_requests -= 1
+            # Run of time stamped samples at the front
+            n = 0
+            if self.bulk_url is not None:
+                while n < len(self._samples) and n < MAX_BULK and \
+                        self._samples[n][0] is not None:
+                    n += 1
+            ok = None
+            if n > 1:
+                self._wait()
+                ok = self._post_bulk(self._samples[:n])
+                # The interval counts from the end of a request
+                self._last_ms = time.ticks_ms()
+                if ok:
+                    self.bulk += 1
+                elif ok is None:
+                    print("ThingSpeak: bulk update refused, "
+                          "single updates used")
+                    self.bulk_url = None
+                    continue
+            if ok is None:
+                n = 1
+                (t, values) = self._samples[0]
+                self._wait()
+                ok = update(values, self.api_key, t, self.update_url)
+                self._last_ms = time.ticks_ms()
+                if ok:
+                    self.single += 1
+            if not ok:
+                break
+            del self._samples[:n]
+            self.uploaded += n
+            done += n
+        return done
@@ -0,0 +1,148 @@
+"""
+Local stand-in for the ThingSpeak update API
+
+This script runs on a PC (CPython), not on the ESP32. It accepts
+single updates (`/update`) and bulk updates
+(`/channels/<id>/bulk_update.json`) like ThingSpeak, including the
+rate limit, and prints every entry, so uploads can be tested without
+an account or Internet connection. Stored entries are returned by
+`/channels/<id>/feeds.json`.
+
+Usage:
+- Run `python thingspeak_stub.py --port 8000`
+- On the ESP32, use the address of the PC as the host, e.g.
+  `thingspeak.BulkClient(1, API_KEY, host="http://192.168.1.10:8000")`
+
+Author(s):
+- Tomas Fryza
+
+Creation date: 2026-10-18
+Last modified: 2026-10-18
+"""
+
+import argparse
+import json
+import re
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+FIELDS = ["field%d" % i for i in range(1, 9)]
+
+
+class Channel:
+    """Entries of one channel and the time of the last update"""
+
+    def __init__(self, api_key, interval_s):
+        self.api_key = api_key
+        self.interval_s = interval_s
+        self.entries = []
+        self.last = None
+
+    def rate_limited(self):
+        now = time.monotonic()
+        if self.last is not None and now - self.last < self.interval_s:
+            return True
+        self.last = now
+        return False
+
+    def add(self, values, created_at=None):
+        entry = {"entry_id": len(self.entries) + 1,
+                 "created_at": created_at or time.strftime(
+                     "%Y-%m-%dT%H:%M:%SZ", time.gmtime())}
+        for name in FIELDS:
+            if values.get(name) is not None:
+                entry[name] = str(values[name])
+        self.entries.append(entry)
+        print("Entry:", entry)
+        return entry["entry_id"]
+
+
+class Handler(BaseHTTPRequestHandler):
+    channel = None
+
+    def reply(self, status, body, content_type="text/plain"):
+        data = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def body(self):
+        length = int(self.headers.get("Content-Length", 0))
+        return self.rfile.read(length).decode()
+
+    def single_update(self, params):
+        ch = self.channel
+        params = {k: v[0] for k, v in params.items()}
+        if params.get("api_key") != ch.api_key:
+            # ThingSpeak answers 0 for a refused update
+            self.reply(200, "0")
+            return
+        if ch.rate_limited():
+            self.reply(200, "0")
+            return
+        self.reply(200, str(ch.add(params, params.get("created_at"))))
+
+    def bulk_update(self):
+        ch = self.channel
+        try:
+            request = json.loads(self.body())
+            updates = request["updates"]
+        except (ValueError, KeyError):
+            self.reply(400, '{"status": "400", "error": "Bad request"}',
+                       "application/json")
+            return
+        if request.get("write_api_key") != ch.api_key:
+            self.reply(401, '{"status": "401", "error": "Unauthorized"}',
+                       "application/json")
+            return
+        if ch.rate_limited():
+            self.reply(429, '{"status": "429", "error": "Too Many Requests"}',
+                       "application/json")
+            return
+        for update in updates:
+            ch.add(update, update.get("created_at"))
+        self.reply(202, '{"success": true}', "application/json")
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == "/update":
+            self.single_update(parse_qs(url.query))
+        elif re.fullmatch(r"/channels/\d+/feeds\.json", url.path):
+            self.reply(200, json.dumps({"feeds": self.channel.entries}),
+                       "application/json")
+        else:
+            self.reply(404, "Not found")
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path == "/update":
+            self.single_update(parse_qs(self.body() or url.query))
+        elif re.fullmatch(r"/channels/\d+/bulk_update\.json", url.path):
+            self.bulk_update()
+        else:
+            self.reply(404, "Not found")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--api-key", default="YOUR_THINGSPEAK_WRITE_API_KEY")
+    parser.add_argument("--interval", type=float, default=15,
+                        help="rate limit in seconds")
+    args = parser.parse_args()
+
+    Handler.channel = Channel(args.api_key, args.interval)
+    server = ThreadingHTTPServer(("", args.port), Handler)
+    print(f"ThingSpeak stand-in at http://0.0.0.0:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print()
+        print("Program stopped. Exiting...")
+
+
+if __name__ == "__main__":
+    main()
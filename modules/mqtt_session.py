@@ -0,0 +1,441 @@
+"""
+This module provides a persistent MQTT 3.1.1 publisher based on
+`asyncio`. Instead of connecting to the broker for every sample, one
+session is kept open: idle periods are bridged by PINGREQ packets and
+a lost connection is restored with exponential backoff.
+
+QoS 1 messages are pipelined: `publish` returns as soon as the message
+is sent, and up to `window` messages may wait for their PUBACK at
+once. Messages not acknowledged before a connection loss are sent
+again after the reconnect, so none is lost (at least once delivery).
+The time from `publish` to PUBACK is measured for every message.
+
+Example
+-------
+.. code-block:: python
+
+    import uasyncio as asyncio
+    from mqtt_session import MqttSession
+
+    async def main():
+        mqtt = MqttSession("broker.example.com", "esp32", keepalive=60)
+        asyncio.create_task(mqtt.run())
+        while True:
+            await mqtt.publish("sensors/temp", b"23.5", qos=1)
+            print(mqtt.acked, mqtt.last_latency_ms, mqtt.avg_latency_ms())
+            await asyncio.sleep(10)
+
+    asyncio.run(main())
+
+Author
+------
+Tomas Fryza
+
+Modification history
+--------------------
+- **2026-10-18** : File created, initial release.
+"""
+
+import uasyncio as asyncio
+import random
+import time
+
+# Packet types
+_CONNECT = 0x10
+_CONNACK = 0x20
+_PUBLISH = 0x30
+_PUBACK = 0x40
+_PINGREQ = 0xC0
+_PINGRESP = 0xD0
+_DISCONNECT = 0xE0
+
+
+async def _recv(reader, mv):
+    """
+    Read into a memoryview, with a fallback for streams without
+    `readinto`.
+    """
+    if hasattr(reader, "readinto"):
+        return await reader.readinto(mv)
+    data = await reader.read(len(mv))
+    mv[:len(data)] = data
+    return len(data)
+
+
+async def _read_exact(reader, mv):
+    """
+    Fill a memoryview completely.
+
+    :raises OSError: If the connection is closed.
+    """
+    n = 0
+    while n < len(mv):
+        got = await _recv(reader, mv[n:])
+        if not got:
+            raise OSError("connection closed")
+        n += got
+
+
+def _put_length(buf, pos, n):
+    """
+    Encode the remaining length of a packet.
+
+    :returns: Position after the length.
+    """
+    while True:
+        byte = n & 0x7F
+        n >>= 7
+        buf[pos] = byte | 0x80 if n else byte
+        pos += 1
+        if not n:
+            return pos
+
+
+def _put_string(buf, pos, s):
+    """
+    Encode a string or bytes with a 16-bit length.
+
+    :returns: Position after the string.
+    """
+    n = len(s)
+    buf[pos] = n >> 8
+    buf[pos + 1] = n & 0xFF
+    buf[pos + 2:pos + 2 + n] = s
+    return pos + 2 + n
+
+
+class MqttSession:
+    """
+    MQTT session with keep-alive, reconnect and QoS 1 window.
+    """
+
+    def __init__(self, server, client_id, port=1883, user=None,
+                 password=None, keepalive=60, ssl=None, window=8,
+                 clean_session=True, backoff_min_ms=1000,
+                 backoff_max_ms=60000, packet_size=512):
+        """
+        :param server: Broker host name or IP address.
+        :param client_id: Client identifier.
+        :param port: Broker port, usually 1883 or 8883 for TLS.
+        :param user: User name, or `None`.
+        :param password: Password, or `None`.
+        :param keepalive: Keep-alive interval in seconds.
+        :param ssl: `True` or an `ssl.SSLContext` for TLS, a function
+                    returning it, called before every connect, or an
+                    object with coroutine `open_connection(host, port)`,
+                    such as `tls_cache.TlsCredentials`.
+        :param window: Largest number of QoS 1 messages waiting for
+                       PUBACK.
+        :param clean_session: Ask the broker not to keep the session.
+        :param backoff_min_ms: First delay before a reconnect.
+        :param backoff_max_ms: Longest delay before a reconnect.
+        :param packet_size: Size of the send buffer; longer packets
+                            are sent in two writes.
+        """
+        self.server = server
+        self.port = port
+        self.client_id = client_id.encode() if isinstance(client_id, str) \
+            else client_id
+        self.user = user
+        self.password = password
+        self.keepalive = keepalive
+        self.ssl = ssl
+        self.window = window
+        self.clean_session = clean_session
+        self.backoff_min_ms = backoff_min_ms
+        self.backoff_max_ms = backoff_max_ms
+
+        self._buf = bytearray(packet_size)
+        self._mv = memoryview(self._buf)
+        self._rx = bytearray(4)
+        self._rx_mv = memoryview(self._rx)
+        self._reader = None
+        self._writer = None
+        self.connected = False
+        self._lost = None  # Reason of a connection loss
+        self._last_tx = 0  # ticks_ms of the last packet sent
+        self._ping_at = None  # ticks_ms of an unanswered PINGREQ
+        self._pid = 0
+        # QoS 1 messages waiting for PUBACK: packet ID to
+        # [topic, payload, retain, ticks_ms of publish]
+        self._inflight = {}
+        self._acked = asyncio.Event()
+
+        self.connects = 0
+        self.published = 0
+        self.acked = 0
+        self.resent = 0  # Messages sent again after a reconnect
+        self.pings = 0
+        self.last_latency_ms = 0  # From `publish` to PUBACK
+        self.max_latency_ms = 0
+        self.total_latency_ms = 0
+        self.last_connect_ms = 0  # Time of the last connect
+
+    def avg_latency_ms(self):
+        """
+        Return the mean time from `publish` to PUBACK.
+        """
+        return self.total_latency_ms // self.acked if self.acked else 0
+
+    def inflight(self):
+        """
+        Return the number of QoS 1 messages waiting for PUBACK.
+        """
+        return len(self._inflight)
+
+    async def _send(self, n, payload=None):
+        """
+        Send the first `n` bytes of the send buffer followed by an
+        optional payload.
+        """
+        writer = self._writer
+        if payload is not None and n + len(payload) <= len(self._buf):
+            self._mv[n:n + len(payload)] = payload
+            n += len(payload)
+            payload = None
+        writer.write(self._mv[:n])
+        if payload is not None:
+            writer.write(payload)
+        self._last_tx = time.ticks_ms()
+        await writer.drain()
+
+    async def _connect(self):
+        """
+        Open the connection and wait for CONNACK.
+        """
+        start = time.ticks_ms()
+        ssl = self.ssl
+        if hasattr(ssl, "open_connection"):
+            streams = await ssl.open_connection(self.server, self.port)
+        else:
+            if callable(ssl):
+                ssl = ssl()
+            if ssl:
+                streams = await asyncio.open_connection(self.server,
+                                                        self.port, ssl=ssl)
+            else:
+                streams = await asyncio.open_connection(self.server,
+                                                        self.port)
+        (self._reader, self._writer) = streams
+
+        (user, password) = (self.user, self.password)
+        if isinstance(user, str):
+            user = user.encode()
+        if isinstance(password, str):
+            password = password.encode()
+        flags = 0x02 if self.clean_session else 0
+        length = 10 + 2 + len(self.client_id)
+        if user is not None:
+            flags |= 0x80
+            length += 2 + len(user)
+        if password is not None:
+            flags |= 0x40
+            length += 2 + len(password)
+        buf = self._buf
+        buf[0] = _CONNECT
+        pos = _put_length(buf, 1, length)
+        pos = _put_string(buf, pos, b"MQTT")
+        buf[pos] = 4  # Protocol level 3.1.1
+        buf[pos + 1] = flags
+        buf[pos + 2] = self.keepalive >> 8
+        buf[pos + 3] = self.keepalive & 0xFF
+        pos = _put_string(buf, pos + 4, self.client_id)
+        if user is not None:
+            pos = _put_string(buf, pos, user)
+        if password is not None:
+            pos = _put_string(buf, pos, password)
+        await self._send(pos)
+
+        await asyncio.wait_for(_read_exact(self._reader, self._rx_mv),
+                               self.keepalive or 30)
+        if self._rx[0] != _CONNACK or self._rx[3] != 0:
+            raise OSError(f"connection refused, code {self._rx[3]}")
+        self.connected = True
+        self._lost = None
+        self._ping_at = None
+        self.connects += 1
+        self.last_connect_ms = time.ticks_diff(time.ticks_ms(), start)
+
+    async def _publish_packet(self, topic, payload, qos, retain, pid, dup):
+        buf = self._buf
+        buf[0] = _PUBLISH | (0x08 if dup else 0) | (qos << 1) | retain
+        length = 2 + len(topic) + len(payload) + (2 if qos else 0)
+        pos = _put_string(buf, _put_length(buf, 1, length), topic)
+        if qos:
+            buf[pos] = pid >> 8
+            buf[pos + 1] = pid & 0xFF
+            pos += 2
+        await self._send(pos, payload)
+
+    async def publish(self, topic, payload, qos=0, retain=False):
+        """
+        Send a message. A QoS 1 message waits only while the window is
+        full; it is sent after a reconnect if the session is down.
+
+        :param topic: Topic as `str` or bytes.
+        :param payload: Message as `str` or bytes-like object.
+        :param qos: Quality of service, 0 or 1.
+        :param retain: Retain flag.
+        :returns: `True` if the message was sent or queued, `False` if a
+                  QoS 0 message was dropped because of no connection
+                  or a send error.
+        """
+        if isinstance(topic, str):
+            topic = topic.encode()
+        if isinstance(payload, str):
+            payload = payload.encode()
+        retain = 1 if retain else 0
+        if not qos:
+            if not self.connected:
+                return False
+            try:
+                await self._publish_packet(topic, payload, 0, retain, 0,
+                                           False)
+            except OSError as e:
+                self._lost = e  # Reconnected by `run`
+                return False
+            self.published += 1
+            return True
+
+        while len(self._inflight) >= self.window:
+            await self._acked.wait()
+        self._pid = self._pid % 0xFFFF + 1
+        pid = self._pid
+        self._inflight[pid] = [topic, payload, retain, time.ticks_ms()]
+        self.published += 1
+        if self.connected:
+            try:
+                await self._publish_packet(topic, payload, 1, retain, pid,
+                                           False)
+            except OSError as e:
+                self._lost = e  # Sent again after the reconnect
+        return True
+
+    async def wait_acked(self):
+        """
+        Wait until all QoS 1 messages are acknowledged, e.g. before
+        a deep sleep.
+        """
+        while self._inflight:
+            await self._acked.wait()
+
+    def _puback(self, pid):
+        msg = self._inflight.pop(pid, None)
+        if msg is None:
+            return  # Duplicate PUBACK
+        latency = time.ticks_diff(time.ticks_ms(), msg[3])
+        self.acked += 1
+        self.last_latency_ms = latency
+        self.total_latency_ms += latency
+        if latency > self.max_latency_ms:
+            self.max_latency_ms = latency
+        self._acked.set()
+        self._acked.clear()
+
+    async def _read_loop(self):
+        """
+        Receive packets until the connection fails.
+        """
+        (reader, rx) = (self._reader, self._rx_mv)
+        try:
+            while True:
+                await _read_exact(reader, rx[:2])
+                ptype = self._rx[0] & 0xF0
+                # Remaining length
+                (length, shift, byte) = (0, 0, self._rx[1])
+                while True:
+                    length |= (byte & 0x7F) << shift
+                    if not byte & 0x80:
+                        break
+                    shift += 7
+                    await _read_exact(reader, rx[:1])
+                    byte = self._rx[0]
+                if ptype == _PUBACK and length == 2:
+                    await _read_exact(reader, rx[:2])
+                    self._puback((self._rx[0] << 8) | self._rx[1])
+                    continue
+                if ptype == _PINGRESP:
+                    self._ping_at = None
+                # Skip other packets, e.g. messages of subscriptions
+                while length:
+                    n = min(length, len(rx))
+                    await _read_exact(reader, rx[:n])
+                    length -= n
+        except Exception as e:
+            self._lost = e if isinstance(e, OSError) else OSError(e)
+
+    async def _resend(self):
+        """
+        Send the unacknowledged QoS 1 messages again with the DUP flag.
+        """
+        for pid in sorted(self._inflight):
+            (topic, payload, retain, _) = self._inflight[pid]
+            await self._publish_packet(topic, payload, 1, retain, pid, True)
+            self.resent += 1
+
+    async def _session(self):
+        """
+        Keep the connection alive until it fails.
+        """
+        reader_task = asyncio.create_task(self._read_loop())
+        period = self.keepalive * 1000
+        try:
+            await self._resend()
+            while self._lost is None:
+                await asyncio.sleep_ms(500)
+                now = time.ticks_ms()
+                if self._ping_at is not None:
+                    if time.ticks_diff(now, self._ping_at) > period:
+                        raise OSError("no PINGRESP")
+                elif period and time.ticks_diff(now, self._last_tx) >= period // 2:
+                    self._buf[0] = _PINGREQ
+                    self._buf[1] = 0
+                    self._ping_at = now
+                    self.pings += 1
+                    await self._send(2)
+            raise self._lost
+        finally:
+            self.connected = False
+            reader_task.cancel()
+
+    def _close(self):
+        self.connected = False
+        if self._writer is not None:
+            try:
+                self._writer.close()
+            except OSError:
+                pass
+            self._writer = None
+
+    async def run(self):
+        """
+        Session task; start it by `asyncio.create_task(session.run())`.
+        Connects to the broker and reconnects after a failure.
+        """
+        delay = self.backoff_min_ms
+        while True:
+            try:
+                await self._connect()
+                print(f"[mqtt] Connected to {self.server} "
+                      f"in {self.last_connect_ms} ms")
+                delay = self.backoff_min_ms
+                await self._session()
+            except (OSError, asyncio.TimeoutError) as e:
+                print(f"[mqtt] Connection failed: {e}")
+            self._close()
+            # Random part avoids reconnects of many nodes at once
+            wait = delay - delay // 4 + random.getrandbits(16) % (delay // 2 + 1)
+            print(f"[mqtt] Reconnecting in {wait} ms")
+            await asyncio.sleep_ms(wait)
+            delay = min(2 * delay, self.backoff_max_ms)
+
+    async def disconnect(self):
+        """
+        Send DISCONNECT and close the connection. Stop the `run` task
+        first, otherwise it connects again.
+        """
+        if self.connected:
+            self._buf[0] = _DISCONNECT
+            self._buf[1] = 0
+            await self._send(2)
+        self._close()
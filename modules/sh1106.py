@@ -5,6 +5,17 @@ display's power, contrast, and pixel data, as well as render text and
 images. It inherits from the `framebuf.FrameBuffer` class to enable drawing
 on the display's buffer and updating the OLED screen.
 
+Drawing methods record which pages and columns they modify, and `show`
+sends only these changed spans to the display instead of the whole
+1 kB frame buffer. Each span is sent in a single I2C transaction
+together with its page and column address, directly from the frame
+buffer without copying.
+
+In `asyncio` applications, `show_async` transfers one page at a time
+and lets other tasks run in between. The frame is first copied to a
+second buffer, so drawing of the next frame can continue during the
+transfer.
+
 Example
 -------
 .. code-block:: python
@@ -30,6 +41,9 @@ Authors:
 
 Modification history
 --------------------
+- **2026-10-18** : Added `show_async` with double buffering and frame-rate limit.
+- **2026-10-18** : Zero-copy data writes using `writevto`.
+- **2026-10-18** : Dirty-page tracking and partial refresh in `show`.
 - **2024-11-11** : Added Sphinx-style comments for documentation.
 - **2024-11-02** : Added `demo` method to demonstrate usage of the display.
 - **2023-10-27** : File created, initial release.
@@ -39,6 +53,7 @@ from machine import Pin
 from machine import I2C
 import framebuf
 import utime as time
+import uasyncio as asyncio
 
 
 class SH1106_I2C(framebuf.FrameBuffer):
@@ -53,9 +68,31 @@ class SH1106_I2C(framebuf.FrameBuffer):
     def __init__(self, i2c, width=WIDTH, height=HEIGHT, addr=DEV_ADDR):
         self.i2c = i2c
         self.addr = addr
+        # Preallocated I2C frames: control byte Co=1 + one command byte,
+        # and three addressing commands followed by data control byte
+        self._cmd = bytearray(2)
+        self._cmd[0] = 0x80
+        self._page_hdr = bytearray(b"\x80\x00\x80\x00\x80\x00\x40")
+        self._write_list = [self._page_hdr, None]
+        self._data_list = [b"\x40", None]
         self._sh1106_init()
         self.buffer = bytearray(self.PAGES * self.WIDTH)
         super().__init__(self.buffer, width, height, framebuf.MONO_VLSB)
+        # Views of individual pages, so no copy is needed to send them
+        mv = memoryview(self.buffer)
+        self._pages = [mv[(self.WIDTH*page):(self.WIDTH*page + self.WIDTH)]
+                       for page in range(self.PAGES)]
+        # Dirty column span [x0, x1) of each page; display RAM content
+        # is undefined after reset, so the first `show` sends everything
+        self._dirty_x0 = bytearray(self.PAGES)
+        self._dirty_x1 = bytearray(self.PAGES)
+        self.mark_dirty()
+        # Asynchronous refresh: transmit buffer is allocated on first use
+        self._tx = None
+        self._busy = False
+        self._pending = False
+        self._frame_ms = 0
+        self._next_frame = time.ticks_ms()
 
     def write_cmd(self, cmd):
         """
@@ -63,7 +100,8 @@ class SH1106_I2C(framebuf.FrameBuffer):
 
         :param cmd: The command byte to be sent to the display.
         """
-        self.i2c.writeto(self.DEV_ADDR, bytearray([0x80, cmd]))
+        self._cmd[1] = cmd
+        self.i2c.writeto(self.addr, self._cmd)
 
     def write_data(self, data):
         """
@@ -71,7 +109,8 @@ class SH1106_I2C(framebuf.FrameBuffer):
 
         :param data: A byte array containing the data to be sent.
         """
-        self.i2c.writeto(self.DEV_ADDR, b"\x40"+data)
+        self._data_list[1] = data
+        self.i2c.writevto(self.addr, self._data_list)
 
     def poweron(self):
         """Turn on the OLED display."""
@@ -94,15 +133,186 @@ class SH1106_I2C(framebuf.FrameBuffer):
         self.write_cmd(0x81)
         self.write_cmd(val)
 
-    def show(self):
-        """Refresh the OLED display with the current buffer data."""
-        (w, p, buf) = (self.WIDTH, self.PAGES, self.buffer)
-        for page in range(0, p):
-            self.write_cmd(self.PAGE_ADDRESS | page)
-            self.write_cmd(self.LOW_COLUMN_ADDR | 2)
-            self.write_cmd(self.HIGH_COLUMN_ADDR | 0)
-            # print(f"Updating page {page}")
-            self.write_data(buf[(w*page):(w*page+w)])
+    def mark_dirty(self, x=0, y=0, w=WIDTH, h=HEIGHT):
+        """
+        Mark a rectangle of the frame buffer as changed, so it is sent
+        by the next `show`. Drawing methods call it automatically; call
+        it directly after writing to `buffer` by other means.
+
+        :param x: Left column.
+        :param y: Top row.
+        :param w: Width in pixels.
+        :param h: Height in pixels.
+        """
+        x1 = min(x + w, self.WIDTH)
+        y1 = min(y + h, self.HEIGHT)
+        x = max(x, 0)
+        y = max(y, 0)
+        if x >= x1 or y >= y1:
+            return
+        (d0, d1) = (self._dirty_x0, self._dirty_x1)
+        for page in range(y >> 3, ((y1 - 1) >> 3) + 1):
+            if d0[page] >= d1[page]:  # Clean page
+                d0[page] = x
+                d1[page] = x1
+            else:
+                if x < d0[page]:
+                    d0[page] = x
+                if x1 > d1[page]:
+                    d1[page] = x1
+
+    def fill(self, c):
+        self.mark_dirty()
+        super().fill(c)
+
+    def pixel(self, x, y, c=None):
+        if c is None:
+            return super().pixel(x, y)
+        self.mark_dirty(x, y, 1, 1)
+        super().pixel(x, y, c)
+
+    def hline(self, x, y, w, c):
+        self.mark_dirty(x, y, w, 1)
+        super().hline(x, y, w, c)
+
+    def vline(self, x, y, h, c):
+        self.mark_dirty(x, y, 1, h)
+        super().vline(x, y, h, c)
+
+    def line(self, x1, y1, x2, y2, c):
+        self.mark_dirty(min(x1, x2), min(y1, y2),
+                        abs(x2 - x1) + 1, abs(y2 - y1) + 1)
+        super().line(x1, y1, x2, y2, c)
+
+    def rect(self, x, y, w, h, c, *args):
+        self.mark_dirty(x, y, w, h)
+        super().rect(x, y, w, h, c, *args)
+
+    def fill_rect(self, x, y, w, h, c):
+        self.mark_dirty(x, y, w, h)
+        super().fill_rect(x, y, w, h, c)
+
+    def ellipse(self, x, y, xr, yr, c, *args):
+        self.mark_dirty(x - xr, y - yr, 2 * xr + 1, 2 * yr + 1)
+        super().ellipse(x, y, xr, yr, c, *args)
+
+    def text(self, s, x, y, c=1):
+        self.mark_dirty(x, y, 8 * len(s), 8)
+        super().text(s, x, y, c)
+
+    def poly(self, x, y, coords, c, *args):
+        self.mark_dirty()
+        super().poly(x, y, coords, c, *args)
+
+    def scroll(self, xstep, ystep):
+        self.mark_dirty()
+        super().scroll(xstep, ystep)
+
+    def blit(self, fbuf, x, y, *args):
+        self.mark_dirty()
+        super().blit(fbuf, x, y, *args)
+
+    def _write_span(self, pages, page, x0, x1):
+        """
+        Send columns `x0` to `x1 - 1` of one page in a single I2C
+        transaction, including the page and column address.
+
+        :param pages: List of page views (frame or transmit buffer).
+        :param page: Page number.
+        :param x0: First column.
+        :param x1: Column after the last one.
+        """
+        # SH1106 RAM is 132 columns wide, visible area starts at 2
+        col = x0 + 2
+        hdr = self._page_hdr
+        hdr[1] = self.PAGE_ADDRESS | page
+        hdr[3] = self.LOW_COLUMN_ADDR | (col & 0x0f)
+        hdr[5] = self.HIGH_COLUMN_ADDR | (col >> 4)
+        # print(f"Updating page {page}, columns {x0}..{x1 - 1}")
+        if x0 == 0 and x1 == self.WIDTH:
+            self._write_list[1] = pages[page]
+        else:
+            self._write_list[1] = pages[page][x0:x1]
+        self.i2c.writevto(self.addr, self._write_list)
+
+    def show(self, full=False):
+        """
+        Refresh the OLED display with the current buffer data. Only the
+        column spans changed since the previous call are transferred.
+
+        :param full: If `True`, send the whole buffer regardless of
+                     the changes.
+        """
+        if full:
+            self.mark_dirty()
+        (d0, d1) = (self._dirty_x0, self._dirty_x1)
+        for page in range(0, self.PAGES):
+            if d0[page] < d1[page]:
+                self._write_span(self._pages, page, d0[page], d1[page])
+                d0[page] = 0
+                d1[page] = 0
+
+    def set_max_fps(self, fps):
+        """
+        Limit the rate of frames sent by `show_async`. Requests arriving
+        faster are merged into the next frame.
+
+        :param fps: Maximum frames per second; 0 disables the limit.
+        """
+        self._frame_ms = 1000 // fps if fps else 0
+
+    async def show_async(self):
+        """
+        Refresh the OLED display without blocking other `asyncio` tasks.
+
+        Changed spans are copied to a transmit buffer and sent one page
+        per scheduler slice, so the frame buffer can be redrawn while
+        the transfer is running. If a transfer is already in progress,
+        the request is coalesced: this call returns immediately and the
+        running call sends one more frame with all changes made so far.
+        """
+        if self._busy:
+            self._pending = True
+            return
+        if self._tx is None:
+            self._tx = bytearray(len(self.buffer))
+            mv = memoryview(self._tx)
+            self._tx_pages = [mv[(self.WIDTH*page):(self.WIDTH*page + self.WIDTH)]
+                              for page in range(self.PAGES)]
+            self._tx_x0 = bytearray(self.PAGES)
+            self._tx_x1 = bytearray(self.PAGES)
+        (d0, d1) = (self._dirty_x0, self._dirty_x1)
+        (t0, t1) = (self._tx_x0, self._tx_x1)
+        self._busy = True
+        try:
+            while True:
+                self._pending = False
+                # Frame-rate limit; requests during the wait are merged
+                wait = time.ticks_diff(self._next_frame, time.ticks_ms())
+                if wait > 0:
+                    await asyncio.sleep_ms(wait)
+                self._next_frame = time.ticks_add(time.ticks_ms(), self._frame_ms)
+
+                # Latch the changed spans into the transmit buffer
+                for page in range(0, self.PAGES):
+                    (x0, x1) = (d0[page], d1[page])
+                    t0[page] = x0
+                    t1[page] = x1
+                    if x0 < x1:
+                        self._tx_pages[page][x0:x1] = self._pages[page][x0:x1]
+                        d0[page] = 0
+                        d1[page] = 0
+
+                # One page per scheduler slice
+                for page in range(0, self.PAGES):
+                    if t0[page] < t1[page]:
+                        self._write_span(self._tx_pages, page, t0[page], t1[page])
+                        await asyncio.sleep_ms(0)
+
+                if not self._pending:
+                    break
+        finally:
+            self._busy = False
 
     def _sh1106_init(self):
         """Initialize the SH1106 OLED display with a set of predefined commands."""
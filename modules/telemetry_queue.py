@@ -0,0 +1,305 @@
+"""
+This module provides a persistent first-in first-out queue of
+telemetry records on flash, for store-and-forward upload: records are
+appended while the network is down and sent in batches when it is
+back, oldest first.
+
+Records are appended to segment files `<prefix>_NNNNN.q`, each with a
+header of a marker byte, length (uint16) and CRC-32 of the data. A
+record torn by a reset is detected by its CRC and the queue continues
+in a new segment. The read position is kept in `<prefix>.ack` as two
+alternating copies with a sequence number and CRC, so one of them is
+always valid even if a reset interrupts the write.
+
+A record is removed only after `ack` confirms that the last batch
+returned by `peek` was delivered, so nothing is lost when an upload
+fails. The queue is limited to `max_segments` segments; when it is
+full, the oldest segment is dropped.
+
+Example
+-------
+.. code-block:: python
+
+    from telemetry_queue import TelemetryQueue
+
+    queue = TelemetryQueue("/queue", segment_size=8192, max_segments=8)
+    queue.put(b"23.5,45.0")
+
+    # When connected; `send` returns True if the batch was delivered
+    def send(records):
+        for record in records:
+            ...
+        return True
+
+    queue.drain(send, batch=10)
+
+Author
+------
+Tomas Fryza
+
+Modification history
+--------------------
+- **2026-10-18** : Partial acknowledgement of a batch.
+- **2026-10-18** : File created, initial release.
+"""
+
+import binascii
+import os
+import struct
+
+_MAGIC = 0xA5
+_HEADER_FORMAT = "<BHI"  # Marker, length, CRC-32 of the data
+_HEADER_SIZE = 7
+_CURSOR_FORMAT = "<IIII"  # Sequence, segment, offset, CRC-32
+_CURSOR_SIZE = 16
+
+
+def _size(path):
+    """
+    Return the size of a file, or -1 if it does not exist.
+    """
+    try:
+        return os.stat(path)[6]
+    except OSError:
+        return -1
+
+
+class TelemetryQueue:
+    """
+    Flash-backed FIFO queue with acknowledged reads.
+    """
+
+    def __init__(self, prefix="queue", segment_size=8192, max_segments=8,
+                 max_record=256):
+        """
+        Open the queue and recover it after a reset.
+
+        :param prefix: Prefix of the files, may include a directory.
+        :param segment_size: Size of one segment file in bytes.
+        :param max_segments: Largest number of segments; the oldest one
+                             is dropped when a new one is needed.
+        :param max_record: Largest record in bytes.
+        """
+        self.prefix = prefix
+        self.segment_size = segment_size
+        self.max_segments = max_segments
+        self._buf = bytearray(_HEADER_SIZE + max_record)
+        self._mv = memoryview(self._buf)
+        self._seq = 0
+        self._batch = []  # Read position after each record of `peek`
+
+        self.appended = 0
+        self.acked = 0
+        self.evicted = 0  # Segments dropped because the queue was full
+
+        (self.head, self.offset) = self._load_cursor()
+        # Last segment; no directory listing is needed
+        self.tail = self.head
+        while _size(self._path(self.tail + 1)) >= 0:
+            self.tail += 1
+        self._tail_size = self._recover()
+
+    def _path(self, segment):
+        return f"{self.prefix}_{segment:05d}.q"
+
+    def _load_cursor(self):
+        """
+        Return the read position from the valid cursor copy with the
+        highest sequence number.
+        """
+        best = (1, 0)
+        try:
+            with open(self.prefix + ".ack", "rb") as f:
+                data = f.read()
+        except OSError:
+            return best
+        for slot in range(len(data) // _CURSOR_SIZE):
+            pos = slot * _CURSOR_SIZE
+            (seq, segment, offset, crc) = struct.unpack_from(_CURSOR_FORMAT,
+                                                             data, pos)
+            if crc != binascii.crc32(data[pos:pos + 12]) & 0xFFFFFFFF:
+                continue
+            if seq >= self._seq:
+                self._seq = seq
+                best = (segment, offset)
+        return best
+
+    def _save_cursor(self):
+        """
+        Write the read position to the older of the two copies.
+        """
+        self._seq += 1
+        data = struct.pack("<III", self._seq, self.head, self.offset)
+        data += struct.pack("<I", binascii.crc32(data) & 0xFFFFFFFF)
+        path = self.prefix + ".ack"
+        if _size(path) < 2 * _CURSOR_SIZE:
+            with open(path, "wb") as f:
+                f.write(bytes(2 * _CURSOR_SIZE))
+        with open(path, "r+b") as f:
+            f.seek((self._seq & 1) * _CURSOR_SIZE)
+            f.write(data)
+
+    def _read_record(self, f):
+        """
+        Read the next record of an open segment.
+
+        :returns: Data of the record, or `None` at the end or at
+                  a damaged record.
+        """
+        hdr = self._mv[:_HEADER_SIZE]
+        if f.readinto(hdr) != _HEADER_SIZE:
+            return None
+        (magic, length, crc) = struct.unpack_from(_HEADER_FORMAT, hdr)
+        if magic != _MAGIC or length > len(self._buf) - _HEADER_SIZE:
+            return None
+        data = f.read(length)
+        if len(data) != length or binascii.crc32(data) & 0xFFFFFFFF != crc:
+            return None
+        return data
+
+    def _recover(self):
+        """
+        Return the end of the valid records of the last segment. After
+        a torn write the queue continues in a new segment.
+        """
+        size = _size(self._path(self.tail))
+        if size <= 0:
+            return 0
+        end = 0
+        with open(self._path(self.tail), "rb") as f:
+            while True:
+                data = self._read_record(f)
+                if data is None:
+                    break
+                end += _HEADER_SIZE + len(data)
+        if end < size:
+            self.tail += 1
+            self._evict()
+            return 0
+        return end
+
+    def put(self, data):
+        """
+        Append a record with a single write.
+
+        :param data: Record as bytes-like object.
+        :raises ValueError: If the record is longer than `max_record`.
+        """
+        n = len(data)
+        if n > len(self._buf) - _HEADER_SIZE:
+            raise ValueError("record too long")
+        if self._tail_size and \
+                self._tail_size + _HEADER_SIZE + n > self.segment_size:
+            self.tail += 1
+            self._tail_size = 0
+            self._evict()
+        struct.pack_into(_HEADER_FORMAT, self._buf, 0, _MAGIC, n,
+                         binascii.crc32(data) & 0xFFFFFFFF)
+        self._mv[_HEADER_SIZE:_HEADER_SIZE + n] = data
+        with open(self._path(self.tail), "ab") as f:
+            f.write(self._mv[:_HEADER_SIZE + n])
+        self._tail_size += _HEADER_SIZE + n
+        self.appended += 1
+
+    def _evict(self):
+        """
+        Drop the oldest segments above the limit.
+        """
+        while self.tail - self.head + 1 > self.max_segments:
+            try:
+                os.remove(self._path(self.head))
+            except OSError:
+                pass  # Already removed
+            self.head += 1
+            self.offset = 0
+            self.evicted += 1
+            self._batch = []
+            self._save_cursor()
+
+    def peek(self, count=10):
+        """
+        Return up to `count` oldest records without removing them.
+        """
+        records = []
+        self._batch = []
+        (segment, offset) = (self.head, self.offset)
+        while len(records) < count:
+            try:
+                f = open(self._path(segment), "rb")
+            except OSError:
+                f = None  # Segment not created yet or removed
+            if f is not None:
+                with f:
+                    f.seek(offset)
+                    while len(records) < count:
+                        data = self._read_record(f)
+                        if data is None:
+                            break  # End, or damaged rest of the segment
+                        records.append(data)
+                        offset += _HEADER_SIZE + len(data)
+                        self._batch.append((segment, offset))
+            if len(records) == count or segment >= self.tail:
+                break
+            segment += 1
+            offset = 0
+        return records
+
+    def ack(self, count=None):
+        """
+        Remove the records returned by the last `peek`.
+
+        :param count: Number of the first records to remove, or `None`
+                      for all of them.
+        """
+        if count is None:
+            count = len(self._batch)
+        if count <= 0 or not self._batch:
+            return
+        count = min(count, len(self._batch))
+        (segment, offset) = self._batch[count - 1]
+        self._batch = []
+        self.acked += count
+        # Fully read segments
+        for old in range(self.head, segment):
+            try:
+                os.remove(self._path(old))
+            except OSError:
+                pass
+        self.head = segment
+        self.offset = offset
+        self._save_cursor()
+
+    def pending_bytes(self):
+        """
+        Return the size of the queued records including headers.
+        """
+        total = -self.offset
+        for segment in range(self.head, self.tail + 1):
+            total += max(_size(self._path(segment)), 0)
+        return max(total, 0)
+
+    def drain(self, send, batch=10, max_batches=None):
+        """
+        Send queued records in batches, oldest first.
+
+        :param send: Function called with a list of records; returns
+                     `True` if they were delivered, `False` if not, or
+                     the number of the first records delivered.
+        :param batch: Largest number of records of one batch.
+        :param max_batches: Limit of batches for one call, or `None`.
+        :returns: `True` if the queue is empty.
+        """
+        while max_batches is None or max_batches > 0:
+            records = self.peek(batch)
+            if not records:
+                return True
+            sent = send(records)
+            if sent is True:
+                sent = len(records)
+            if sent:
+                self.ack(sent)
+            if sent < len(records):
+                return False
+            if max_batches is not None:
+                max_batches -= 1
+        return not self.pending_bytes()
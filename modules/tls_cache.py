@@ -0,0 +1,146 @@
+"""
+This module keeps TLS client credentials in memory for the whole run
+of the program. The CA certificate, client certificate and private key
+are read from flash and parsed into one `ssl.SSLContext` only once,
+instead of before every connection.
+
+Connections are opened by `TlsCredentials.open_connection`, which
+measures the time of every handshake. TLS session resumption is not
+used: current MicroPython ports do not expose the session of an
+`SSLSocket`, so every reconnect performs a full handshake.
+
+On MicroPython the handshake is done on a blocking socket with a
+timeout, which then continues as an `asyncio` stream; other tasks
+wait during the handshake. Other interpreters use
+`asyncio.open_connection`.
+
+Example
+-------
+.. code-block:: python
+
+    from tls_cache import TlsCredentials
+    from mqtt_session import MqttSession
+
+    tls = TlsCredentials("/AmazonRootCA1.pem", "/certificate.pem.crt",
+                         "/private.pem.key")
+    mqtt = MqttSession("xxx.amazonaws.com", "esp32", port=8883, ssl=tls)
+    ...
+    print(tls.handshakes, tls.last_handshake_ms)
+
+Author
+------
+Tomas Fryza
+
+Modification history
+--------------------
+- **2026-10-18** : Unreachable session resumption removed.
+- **2026-10-18** : File created, initial release.
+"""
+
+import uasyncio as asyncio
+import socket
+import ssl
+import sys
+import time
+
+_MICROPYTHON = sys.implementation.name == "micropython"
+
+
+def _read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+class TlsCredentials:
+    """
+    Cached `SSLContext` with handshake statistics.
+    """
+
+    def __init__(self, ca_path=None, cert_path=None, key_path=None,
+                 timeout_s=10):
+        """
+        :param ca_path: File with the CA certificate of the server, or
+                        `None` to skip the verification.
+        :param cert_path: File with the client certificate, or `None`.
+        :param key_path: File with the client private key, or `None`.
+        :param timeout_s: Timeout of the connect and the handshake.
+        """
+        self.ca_path = ca_path
+        self.cert_path = cert_path
+        self.key_path = key_path
+        self.timeout_s = timeout_s
+        self._context = None
+
+        self.load_ms = 0  # Time of reading and parsing the credentials
+        self.handshakes = 0
+        self.last_handshake_ms = 0
+        self.total_handshake_ms = 0
+
+    def context(self):
+        """
+        Return the `SSLContext`, created at the first call.
+        """
+        if self._context is not None:
+            return self._context
+        start = time.ticks_ms()
+        ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        if self.ca_path is None:
+            ctx.check_hostname = False
+            ctx.verify_mode = ssl.CERT_NONE
+        elif _MICROPYTHON:
+            # Data instead of file names, each file is read once
+            ctx.load_verify_locations(cadata=_read(self.ca_path))
+        else:
+            ctx.load_verify_locations(cafile=self.ca_path)
+        if self.cert_path is not None:
+            if _MICROPYTHON:
+                ctx.load_cert_chain(_read(self.cert_path),
+                                    _read(self.key_path))
+            else:
+                ctx.load_cert_chain(self.cert_path, self.key_path)
+        self._context = ctx
+        self.load_ms = time.ticks_diff(time.ticks_ms(), start)
+        return ctx
+
+    def avg_handshake_ms(self):
+        """
+        Return the mean duration of the handshakes.
+        """
+        return self.total_handshake_ms // self.handshakes \
+            if self.handshakes else 0
+
+    async def open_connection(self, host, port):
+        """
+        Open a TLS connection.
+
+        :returns: Tuple of `asyncio` reader and writer streams.
+        """
+        ctx = self.context()
+        start = time.ticks_ms()
+        if not _MICROPYTHON:
+            streams = await asyncio.wait_for(
+                asyncio.open_connection(host, port, ssl=ctx,
+                                        server_hostname=host),
+                self.timeout_s)
+            self._count(start)
+            return streams
+
+        addr = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)[0][-1]
+        sock = socket.socket()
+        try:
+            sock.settimeout(self.timeout_s)
+            sock.connect(addr)
+            sock = ctx.wrap_socket(sock, server_hostname=host)
+        except Exception:
+            sock.close()
+            raise
+        self._count(start)
+        sock.setblocking(False)
+        stream = asyncio.StreamWriter(sock, {})
+        return (stream, stream)
+
+    def _count(self, start):
+        ms = time.ticks_diff(time.ticks_ms(), start)
+        self.handshakes += 1
+        self.last_handshake_ms = ms
+        self.total_handshake_ms += ms